@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# benchmarks/bench_skeleton_cache.py
+"""
+Compara slides/s de TextToPptxConverter con y sin la caché de XML decorativo
+
+Uso:
+    python benchmarks/bench_skeleton_cache.py --slides 1000 --repeat 3
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.text_to_pptx import TextToPptxConverter, iter_slides
+from benchmarks.bench_suite import make_outline
+
+
+def bench(structure, theme, cache_skeletons, repeat):
+    """Devuelve el mejor tiempo (s) de construir y guardar la presentación"""
+    best = float("inf")
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = os.path.join(tmp, "bench.pptx")
+        for _ in range(repeat):
+            converter = TextToPptxConverter(theme=theme, cache_skeletons=cache_skeletons)
+            start = time.perf_counter()
+            converter.write_slides(structure, output_file)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--slides", type=int, default=1000)
+    parser.add_argument("--theme", default="modern_blue")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    structure = list(iter_slides(make_outline(args.slides).split("\n")))
+
+    results = {}
+    for cache_skeletons in (False, True):
+        elapsed = bench(structure, args.theme, cache_skeletons, args.repeat)
+        results[cache_skeletons] = elapsed
+
+    print(f"\n📊 {args.slides} diapositivas, tema {args.theme} (mejor de {args.repeat})")
+    for cache_skeletons, elapsed in results.items():
+        label = "con caché" if cache_skeletons else "sin caché"
+        print(f"   {label}: {elapsed:.2f} s  ({args.slides / elapsed:.0f} slides/s)")
+    print(f"   Aceleración: {results[False] / results[True]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+# benchmarks/bench_suite.py
+"""
+Suite de benchmarks offline para los conversores
+
+No necesita API keys ni conexión. Cada caso se ejecuta en un proceso
+nuevo para poder medir su pico de memoria (RSS) de forma aislada, y los
+resultados se guardan en un archivo JSON.
+
+Uso:
+    python benchmarks/bench_suite.py run --output results.json
+    python benchmarks/bench_suite.py run --groups text parse --sizes 10 100
+    python benchmarks/bench_suite.py run --output new.json --baseline baseline.json
+    python benchmarks/bench_suite.py compare baseline.json new.json --threshold 0.15
+
+Grupos disponibles:
+    text   TextToPptxConverter completo (parseo + slides + guardado) por tema
+    parse  Solo la etapa de parseo del formato SLIDE N:
+    paginate  Solo la estimación de desborde y división en continuaciones
+    pdf    LatexToPptxConverter._pdf_to_pptx sobre PDFs sintéticos, por DPI y
+           por resolución de destino
+    pdf_workers  Escalado del rasterizado en paralelo según el número de procesos
+    encode Tamaño y tiempo de codificación de páginas por modo (PNG, paleta, JPEG...)
+    ai_async  Generación de muchas presentaciones con generate_many contra un
+           proveedor simulado local, por límite de concurrencia (necesita
+           el SDK de anthropic; ver benchmarks/fake_provider.py)
+    ai_stream  Tiempo hasta la primera diapositiva generando un PPTX con y sin
+           streaming contra el proveedor simulado (necesita el SDK de anthropic)
+    startup  Tiempo de arranque en frío (python -X importtime) de los módulos
+           de entrada: integración con la IA, conversores y GUI
+"""
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Agregar el directorio raíz al path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from scripts.instrumentation import peak_rss_mb
+
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+DEFAULT_PDF_PAGES = [1, 20, 200]
+DEFAULT_DPIS = [72, 150, 300]
+DEFAULT_RESOLUTIONS = ["1280x720", "1920x1080"]
+DEFAULT_WORKERS = sorted({1, 2, 4, os.cpu_count() or 1})
+DEFAULT_ENCODINGS = ["png", "png-palette", "png-optimized", "jpeg", "auto"]
+DEFAULT_CONCURRENCY = [1, 4, 16, 64]
+FAKE_PROVIDER_LATENCY = 0.1
+FAKE_PROVIDER_TOKEN_DELAY = 0.005
+
+# Código de arranque medido por el grupo startup
+STARTUP_TARGETS = {
+    "claude_integration": "import claude.claude_integration",
+    "detect_provider": "from claude.claude_integration import ClaudeIntegration; "
+                       "ClaudeIntegration(provider='auto')",
+    "text_to_pptx": "import scripts.text_to_pptx",
+    "latex_to_pptx": "import scripts.latex_to_pptx",
+    "gui_app": "import gui_app",
+}
+
+# SDK de los proveedores (su importación es lo más lento del arranque)
+PROVIDER_SDKS = ("anthropic", "google.generativeai")
+
+# Métricas que se comparan contra la línea base
+COMPARED_METRICS = ("wall_s", "peak_rss_mb", "output_bytes", "first_slide_s")
+
+# Diferencias absolutas por debajo de estas se consideran ruido
+NOISE_FLOOR = {"wall_s": 0.005, "peak_rss_mb": 2.0, "output_bytes": 0, "first_slide_s": 0.005}
+
+
+# ========== UTILIDADES ==========
+
+def make_outline(num_slides, bullets_per_slide=4):
+    """Genera el texto de una presentación sintética en formato SLIDE N:"""
+    lines = []
+    for n in range(1, num_slides + 1):
+        lines.append(f"SLIDE {n}: Diapositiva de prueba número {n}")
+        for b in range(1, bullets_per_slide + 1):
+            lines.append(f"- Viñeta {b} de la diapositiva {n} con algo de texto de relleno")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def make_pages(num_pages):
+    """Genera páginas sintéticas tipo beamer (colores planos y texto) con Pillow"""
+    from PIL import Image, ImageDraw
+
+    pages = []
+    for n in range(num_pages):
+        img = Image.new("RGB", (1280, 720), (255, 255, 255))
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([0, 0, 1280, 90], fill=(41, 128, 185))
+        draw.text((40, 30), f"Diapositiva {n + 1}", fill=(255, 255, 255))
+        for b in range(5):
+            draw.text((80, 160 + b * 90), f"- Viñeta {b + 1} de la página {n + 1}", fill=(44, 62, 80))
+        draw.rectangle([0, 690, 1280, 720], fill=(46, 204, 113))
+        pages.append(img)
+    return pages
+
+
+def make_pdf(path, num_pages):
+    """Genera un PDF sintético tipo beamer con make_pages"""
+    pages = make_pages(num_pages)
+    pages[0].save(path, "PDF", resolution=96.0, save_all=True, append_images=pages[1:])
+
+
+# ========== CASOS ==========
+# Cada runner se ejecuta en un proceso hijo y devuelve un dict con métricas
+# adicionales (por ejemplo "output_bytes" o "slides").
+
+def run_text_case(params, workdir):
+    """Conversión completa de texto a PPTX"""
+    from scripts.text_to_pptx import TextToPptxConverter
+
+    input_file = os.path.join(workdir, "outline.txt")
+    output_file = os.path.join(workdir, "output.pptx")
+    with open(input_file, "w", encoding="utf-8") as f:
+        f.write(make_outline(params["slides"]))
+
+    converter = TextToPptxConverter(theme=params["theme"])
+    start = time.perf_counter()
+    slides = converter.convert(input_file, output_file)
+    wall = time.perf_counter() - start
+    return {"wall_s": wall, "slides": slides, "output_bytes": os.path.getsize(output_file)}
+
+
+def run_parse_case(params, workdir):
+    """Solo la etapa de parseo"""
+    from scripts.text_to_pptx import iter_slides
+
+    input_file = os.path.join(workdir, "outline.txt")
+    with open(input_file, "w", encoding="utf-8") as f:
+        f.write(make_outline(params["slides"]))
+
+    start = time.perf_counter()
+    with open(input_file, "r", encoding="utf-8") as f:
+        slides = sum(1 for _ in iter_slides(f))
+    wall = time.perf_counter() - start
+    return {"wall_s": wall, "slides": slides}
+
+
+def run_paginate_case(params, workdir):
+    """Solo la etapa de paginación automática"""
+    from scripts.text_to_pptx import TextToPptxConverter, iter_slides
+
+    structure = list(iter_slides(make_outline(params["slides"], bullets_per_slide=8).split("\n")))
+    converter = TextToPptxConverter(auto_paginate=True)
+    start = time.perf_counter()
+    slides = sum(1 for _ in converter._paginate(structure))
+    wall = time.perf_counter() - start
+    return {"wall_s": wall, "slides": slides}
+
+
+def run_pdf_case(params, workdir):
+    """Rasterización de un PDF sintético a PPTX"""
+    from scripts.latex_to_pptx import LatexToPptxConverter
+
+    output_file = os.path.join(workdir, "output.pptx")
+    resolution = params.get("resolution")
+    converter = LatexToPptxConverter(
+        dpi=params.get("dpi", 150),
+        workers=params.get("workers"),
+        window=params.get("window"),
+        target_resolution=tuple(map(int, resolution.split("x"))) if resolution else None
+    )
+    start = time.perf_counter()
+    converter._pdf_to_pptx(params["pdf"], output_file)
+    wall = time.perf_counter() - start
+    return {"wall_s": wall, "output_bytes": os.path.getsize(output_file)}
+
+
+def run_encode_case(params, workdir):
+    """Codificación de páginas ya rasterizadas con un modo dado"""
+    from PIL import Image
+    from scripts.instrumentation import ProfileRecorder
+    from scripts.latex_to_pptx import LatexToPptxConverter
+
+    # Páginas del tamaño que produce un PDF de 13.33x7.5" a 150 DPI; el
+    # reescalado agrega el antialiasado de una rasterización real
+    pages = [page.resize((2000, 1125), Image.BILINEAR) for page in make_pages(params["pages"])]
+    output_file = os.path.join(workdir, "output.pptx")
+    recorder = ProfileRecorder()
+    converter = LatexToPptxConverter(
+        observer=recorder,
+        encoding=params["encoding"],
+        target_slide_kb=params.get("target_kb")
+    )
+    start = time.perf_counter()
+    converter._pages_to_pptx(pages, output_file)
+    wall = time.perf_counter() - start
+    return {
+        "wall_s": wall,
+        "encode_s": recorder.summary()["encode"],
+        "output_bytes": os.path.getsize(output_file),
+    }
+
+
+def run_ai_async_case(params, workdir):
+    """generate_many contra el proveedor simulado con un límite de concurrencia"""
+    import asyncio
+    from benchmarks.fake_provider import FakeProvider
+    from claude.claude_integration import ClaudeIntegration
+
+    topics = [f"Tema {n}" for n in range(params["topics"])]
+    with FakeProvider(latency=params["latency"]) as provider:
+        os.environ["ANTHROPIC_BASE_URL"] = provider.url
+        ai = ClaudeIntegration(provider="claude", api_key="benchmark")
+
+        async def generate_all():
+            errors = [error async for _, _, error in ai.generate_many(
+                topics, concurrency=params["concurrency"], num_slides=5) if error]
+            if errors:
+                raise errors[0]
+
+        start = time.perf_counter()
+        asyncio.run(generate_all())
+        wall = time.perf_counter() - start
+
+    return {
+        "wall_s": wall,
+        "decks_per_s": len(topics) / wall,
+        "max_in_flight": provider.max_in_flight,
+    }
+
+
+def run_ai_stream_case(params, workdir):
+    """Generación de un PPTX con y sin streaming contra el proveedor simulado"""
+    from benchmarks.fake_provider import FakeProvider
+    from claude.claude_integration import ClaudeIntegration
+    from scripts.generate_presentation import generate_presentation
+
+    output_file = os.path.join(workdir, "stream.pptx")
+    with FakeProvider(latency=params["latency"], token_delay=params["token_delay"]) as provider:
+        os.environ["ANTHROPIC_BASE_URL"] = provider.url
+        ai = ClaudeIntegration(provider="claude", api_key="benchmark")
+        stats = generate_presentation(ai, "Benchmark", output_file, num_slides=params["slides"],
+                                      stream=params["mode"] == "stream")
+
+    return {
+        "wall_s": stats["total_s"],
+        "first_slide_s": stats["first_slide_s"],
+        "output_bytes": os.path.getsize(output_file),
+    }
+
+
+def _import_times(code):
+    """
+    Ejecuta `code` en un intérprete nuevo con -X importtime
+
+    Returns:
+        tuple: (segundos de pared, {módulo de primer nivel: segundos acumulados})
+    """
+    env = dict(os.environ, GEMINI_API_KEY="benchmark", PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=ROOT_DIR, env=env, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if not line.startswith("import time:") or len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        modules[name.strip()] = (int(parts[1]) / 1e6, len(name) - len(name.lstrip()))
+    return wall, modules
+
+
+def run_startup_case(params, workdir):
+    """Arranque en frío de un módulo de entrada, descontando el del intérprete"""
+    _, baseline = _import_times("pass")
+    wall, modules = _import_times(params["code"])
+    # Nivel superior: la indentación del nombre es de un espacio
+    new_modules = {name: cumulative for name, (cumulative, indent) in modules.items()
+                   if name not in baseline and indent == 1}
+    return {
+        "wall_s": wall,
+        "import_s": sum(new_modules.values()),
+        "modules": len(set(modules) - set(baseline)),
+        "sdk_imported": any(name in modules for name in PROVIDER_SDKS),
+    }
+
+
+def text_cases(args, workdir):
+    from scripts.themes import available_themes
+    themes = args.themes or available_themes()
+    return [
+        (f"text/{theme}/{size}", {"theme": theme, "slides": size})
+        for theme in themes
+        for size in args.sizes
+    ]
+
+
+def parse_cases(args, workdir):
+    return [(f"parse/{size}", {"slides": size}) for size in args.sizes]
+
+
+def paginate_cases(args, workdir):
+    return [(f"paginate/{size}", {"slides": size}) for size in args.sizes]
+
+
+def pdf_cases(args, workdir):
+    cases = []
+    for pages in args.pdf_pages:
+        pdf = os.path.join(workdir, f"synthetic_{pages}.pdf")
+        make_pdf(pdf, pages)
+        for dpi in args.dpis:
+            cases.append((f"pdf/{pages}p/{dpi}dpi", {"pdf": pdf, "pages": pages, "dpi": dpi}))
+        for resolution in args.resolutions:
+            cases.append((f"pdf/{pages}p/{resolution}",
+                          {"pdf": pdf, "pages": pages, "resolution": resolution}))
+    return cases
+
+
+def pdf_workers_cases(args, workdir):
+    from scripts.latex_to_pptx import MIN_CHUNK_PAGES
+
+    pages = max(args.pdf_pages)
+    pdf = os.path.join(workdir, f"synthetic_{pages}.pdf")
+    if not os.path.exists(pdf):
+        make_pdf(pdf, pages)
+    # La ventana crece con los procesos para que cada uno tenga su bloque
+    # (la ventana por defecto es fija y limitaría los bloques en paralelo)
+    return [
+        (f"pdf_workers/{pages}p/{workers}w",
+         {"pdf": pdf, "pages": pages, "dpi": 150, "workers": workers,
+          "window": workers * MIN_CHUNK_PAGES})
+        for workers in args.workers
+    ]
+
+
+def encode_cases(args, workdir):
+    pages = min(args.pdf_pages[-1], 20)
+    cases = [
+        (f"encode/{encoding}/{pages}p", {"encoding": encoding, "pages": pages})
+        for encoding in args.encodings
+    ]
+    if args.target_kb:
+        cases.append((f"encode/auto-{args.target_kb}kb/{pages}p",
+                      {"encoding": "auto", "pages": pages, "target_kb": args.target_kb}))
+    return cases
+
+
+def ai_stream_cases(args, workdir):
+    slides = min(args.sizes[0], 20)
+    return [
+        (f"ai_stream/{mode}/{slides}", {"mode": mode, "slides": slides,
+                                        "latency": FAKE_PROVIDER_LATENCY * 2,
+                                        "token_delay": FAKE_PROVIDER_TOKEN_DELAY})
+        for mode in ("blocking", "stream")
+    ]
+
+
+def startup_cases(args, workdir):
+    return [(f"startup/{name}", {"code": code}) for name, code in STARTUP_TARGETS.items()]
+
+
+def ai_async_cases(args, workdir):
+    return [
+        (f"ai_async/{args.topics}t/c{concurrency}",
+         {"topics": args.topics, "concurrency": concurrency, "latency": FAKE_PROVIDER_LATENCY})
+        for concurrency in args.concurrency
+    ]
+
+
+# Grupo -> (generador de casos, runner)
+GROUPS = {
+    "text": (text_cases, run_text_case),
+    "parse": (parse_cases, run_parse_case),
+    "paginate": (paginate_cases, run_paginate_case),
+    "pdf": (pdf_cases, run_pdf_case),
+    "pdf_workers": (pdf_workers_cases, run_pdf_case),
+    "encode": (encode_cases, run_encode_case),
+    "ai_async": (ai_async_cases, run_ai_async_case),
+    "ai_stream": (ai_stream_cases, run_ai_stream_case),
+    "startup": (startup_cases, run_startup_case),
+}
+
+
+def _run_in_child(group, params):
+    """Ejecuta un caso dentro del proceso hijo y agrega el pico de RSS"""
+    runner = GROUPS[group][1]
+    with tempfile.TemporaryDirectory() as workdir:
+        # Silenciar los mensajes de progreso de los conversores
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                metrics = runner(params, workdir)
+            finally:
+                sys.stdout = stdout
+    metrics["peak_rss_mb"] = peak_rss_mb()
+    return metrics
+
+
+def run_case(group, name, params, repeat):
+    """Ejecuta un caso `repeat` veces (cada una en un proceso nuevo) y guarda el mejor"""
+    best = None
+    for _ in range(repeat):
+        # "spawn" para que el pico de RSS no herede la memoria del proceso padre
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            metrics = executor.submit(_run_in_child, group, params).result()
+        if best is None or metrics["wall_s"] < best["wall_s"]:
+            best = metrics
+    params = {k: v for k, v in params.items() if k != "pdf"}
+    return {"name": name, "group": group, "params": params, **best}
+
+
+# ========== COMANDOS ==========
+
+def run(args):
+    """Ejecuta los grupos seleccionados y guarda los resultados"""
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for group in args.groups:
+            make_cases = GROUPS[group][0]
+            for name, params in make_cases(args, workdir):
+                print(f"⏳ {name}...", end=" ", flush=True)
+                try:
+                    result = run_case(group, name, params, args.repeat)
+                except Exception as e:
+                    print(f"⚠️  omitido ({type(e).__name__}: {e})")
+                    results.append({"name": name, "group": group, "skipped": f"{type(e).__name__}: {e}"})
+                    continue
+                rss = result["peak_rss_mb"]
+                print(f"{result['wall_s']:.3f} s"
+                      + (f", {rss:.0f} MB" if rss is not None else "")
+                      + (f", {result['output_bytes'] / 1024:.0f} KB" if "output_bytes" in result else "")
+                      + (f", codificación {result['encode_s']:.3f} s" if "encode_s" in result else "")
+                      + (f", {result['decks_per_s']:.1f} presentaciones/s" if "decks_per_s" in result else "")
+                      + (f", primera diapositiva {result['first_slide_s']:.3f} s" if "first_slide_s" in result else "")
+                      + (f", importación {result['import_s'] * 1000:.1f} ms, {result['modules']} módulos"
+                         + (" (con SDK de IA)" if result["sdk_imported"] else "")
+                         if "import_s" in result else ""))
+                results.append(result)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n✅ Resultados guardados en: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        return report_regressions(baseline, report, args.threshold)
+    return 0
+
+
+def find_regressions(baseline, current, threshold):
+    """
+    Compara dos reportes y devuelve las métricas que empeoraron
+
+    Args:
+        baseline: Reporte de referencia
+        current: Reporte nuevo
+        threshold: Empeoramiento relativo tolerado (0.1 = 10%)
+
+    Returns:
+        list: Tuplas (caso, métrica, valor base, valor nuevo)
+    """
+    base_by_name = {r["name"]: r for r in baseline["results"] if "skipped" not in r}
+    regressions = []
+    for result in current["results"]:
+        base = base_by_name.get(result["name"])
+        if base is None or "skipped" in result:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = base.get(metric), result.get(metric)
+            if (old and new is not None and new > old * (1 + threshold)
+                    and new - old > NOISE_FLOOR[metric]):
+                regressions.append((result["name"], metric, old, new))
+    return regressions
+
+
+def report_regressions(baseline, current, threshold):
+    """Imprime las regresiones encontradas y devuelve el código de salida"""
+    regressions = find_regressions(baseline, current, threshold)
+    if not regressions:
+        print(f"✅ Sin regresiones (tolerancia {threshold:.0%})")
+        return 0
+
+    print(f"❌ {len(regressions)} regresiones (tolerancia {threshold:.0%}):")
+    for name, metric, old, new in regressions:
+        print(f"   - {name} {metric}: {old:.3f} → {new:.3f} (+{(new / old - 1):.0%})")
+    return 1
+
+
+def compare(args):
+    """Compara dos archivos de resultados"""
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, "r", encoding="utf-8") as f:
+        current = json.load(f)
+    return report_regressions(baseline, current, args.threshold)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks offline de los conversores")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Ejecuta los benchmarks")
+    run_parser.add_argument("--groups", nargs="+", choices=list(GROUPS), default=list(GROUPS))
+    run_parser.add_argument("--output", default="bench_results.json", help="Archivo JSON de resultados")
+    run_parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES,
+                            help="Número de diapositivas (grupos text, parse y paginate)")
+    run_parser.add_argument("--themes", nargs="+", default=None, help="Temas (por defecto, todos)")
+    run_parser.add_argument("--pdf-pages", nargs="+", type=int, default=DEFAULT_PDF_PAGES)
+    run_parser.add_argument("--dpis", nargs="+", type=int, default=DEFAULT_DPIS)
+    run_parser.add_argument("--resolutions", nargs="+", default=DEFAULT_RESOLUTIONS,
+                            help="Resoluciones de destino ANCHOxALTO (grupo pdf)")
+    run_parser.add_argument("--workers", nargs="+", type=int, default=DEFAULT_WORKERS,
+                            help="Procesos de rasterizado (grupo pdf_workers)")
+    run_parser.add_argument("--encodings", nargs="+", default=DEFAULT_ENCODINGS,
+                            help="Modos de codificación (grupo encode)")
+    run_parser.add_argument("--target-kb", type=int, default=None,
+                            help="Agrega un caso auto con tamaño máximo por diapositiva (grupo encode)")
+    run_parser.add_argument("--concurrency", nargs="+", type=int, default=DEFAULT_CONCURRENCY,
+                            help="Límites de peticiones simultáneas del grupo ai_async")
+    run_parser.add_argument("--topics", type=int, default=64,
+                            help="Presentaciones generadas en cada caso del grupo ai_async")
+    run_parser.add_argument("--repeat", type=int, default=1, help="Repeticiones por caso (se guarda la mejor)")
+    run_parser.add_argument("--baseline", help="Reporte de referencia para detectar regresiones")
+    run_parser.add_argument("--threshold", type=float, default=0.10,
+                            help="Empeoramiento relativo tolerado (por defecto 0.10)")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser("compare", help="Compara dos archivos de resultados")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# benchmarks/fake_provider.py
+"""
+Proveedor de IA simulado para pruebas de carga sin API keys ni conexión
+
+Servidor HTTP local que imita POST /v1/messages de la API de Anthropic:
+espera `latency` segundos y responde una presentación en formato SLIDE N:
+sobre el tema del prompt, más `token_delay` segundos por palabra generada.
+Con "stream": true envía los eventos SSE de la API, una palabra por evento.
+El SDK oficial se apunta a él con ANTHROPIC_BASE_URL (o base_url).
+
+Uso:
+    with FakeProvider(latency=0.1) as provider:
+        os.environ["ANTHROPIC_BASE_URL"] = provider.url
+        ai = ClaudeIntegration(provider="claude", api_key="prueba")
+        ...
+        print(provider.requests, provider.connections, provider.max_in_flight)
+"""
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def fake_deck(topic, num_slides):
+    """Contenido en formato SLIDE N: como el que devuelve la IA"""
+    slides = []
+    for n in range(1, num_slides + 1):
+        slides.append(
+            f"SLIDE {n}: {topic} — parte {n}\n"
+            f"- Primera idea sobre {topic}\n"
+            f"- Segunda idea de la parte {n}\n"
+            f"- Tercera idea"
+        )
+    return "\n\n".join(slides) + "\n"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1: las conexiones se mantienen abiertas entre peticiones
+    protocol_version = "HTTP/1.1"
+    # Sin Nagle: cabeceras y cuerpo no esperan al ACK retrasado del cliente
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        provider = self.server.provider
+        with provider._lock:
+            provider.connections += 1
+
+    def do_POST(self):
+        provider = self.server.provider
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        prompt = body.get("messages", [{}])[-1].get("content", "")
+        topic = re.search(r'sobre "(.*?)"', prompt)
+        num_slides = re.search(r"con (\d+) diapositivas", prompt)
+        text = fake_deck(topic.group(1) if topic else "Tema",
+                         int(num_slides.group(1)) if num_slides else 3)
+        tokens = re.findall(r"\S+\s*|\s+", text)
+
+        with provider._lock:
+            provider.requests += 1
+            provider.in_flight += 1
+            provider.max_in_flight = max(provider.max_in_flight, provider.in_flight)
+        try:
+            time.sleep(provider.latency)
+            if body.get("stream"):
+                self._stream(body, prompt, tokens)
+                return
+            time.sleep(provider.token_delay * len(tokens))
+        finally:
+            with provider._lock:
+                provider.in_flight -= 1
+
+        payload = json.dumps({
+            "id": f"msg_fake_{provider.requests}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "fake"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": len(prompt.split()), "output_tokens": len(text.split())},
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _stream(self, body, prompt, tokens):
+        """Envía la respuesta como eventos SSE, una palabra por evento"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def event(name, data):
+            self.wfile.write(f"event: {name}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        event("message_start", {"type": "message_start", "message": {
+            "id": f"msg_fake_{self.server.provider.requests}", "type": "message",
+            "role": "assistant", "model": body.get("model", "fake"), "content": [],
+            "stop_reason": None, "stop_sequence": None,
+            "usage": {"input_tokens": len(prompt.split()), "output_tokens": 1},
+        }})
+        event("content_block_start", {"type": "content_block_start", "index": 0,
+                                      "content_block": {"type": "text", "text": ""}})
+        for token in tokens:
+            event("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                          "delta": {"type": "text_delta", "text": token}})
+            time.sleep(self.server.provider.token_delay)
+        event("content_block_stop", {"type": "content_block_stop", "index": 0})
+        event("message_delta", {"type": "message_delta",
+                                 "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                                 "usage": {"output_tokens": len(tokens)}})
+        event("message_stop", {"type": "message_stop"})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Cola de conexiones pendientes amplia: muchas peticiones llegan a la vez
+    request_queue_size = 256
+
+
+class FakeProvider:
+    """Servidor local que imita la API de mensajes de Anthropic"""
+
+    def __init__(self, latency=0.1, token_delay=0.0):
+        """
+        Args:
+            latency: Segundos hasta el inicio de cada respuesta
+            token_delay: Segundos por palabra generada
+        """
+        self.latency = latency
+        self.token_delay = token_delay
+        self.requests = 0
+        # Conexiones TCP aceptadas (con keep-alive, menos que peticiones)
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.provider = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
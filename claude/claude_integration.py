@@ -2,18 +2,46 @@
 """
 Integración con APIs de IA (Google Gemini y Anthropic Claude) para generación de contenido de presentaciones.
 Soporta detección automática del proveedor disponible.
+
+Importar este módulo es barato: el archivo .env se lee al crear la primera
+integración, y el SDK del proveedor (que tarda cerca de un segundo en
+importarse) y su cliente se crean en la primera petición a la API. Detectar
+el proveedor solo consulta variables de entorno.
+
+Los clientes se comparten entre integraciones (ver claude/client_registry.py),
+así que crear muchas no abre conexiones nuevas.
 """
 
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+try:
+    from claude.client_registry import registry
+except ImportError:  # ejecutado directamente como script
+    from client_registry import registry
+
+
+# Modelo por defecto de cada proveedor
+DEFAULT_MODELS = {
+    "gemini": "gemini-2.5-flash",
+    "claude": "claude-3-5-sonnet-20241022",
+}
+
+_env_loaded = False
+
+
+def load_env():
+    """Carga el archivo .env una sola vez (no sobrescribe variables ya definidas)"""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
 
 
 class ClaudeIntegration:
     """Clase para interactuar con APIs de IA (Claude o Gemini)"""
     
-    def __init__(self, api_key=None, model=None, provider="auto"):
+    def __init__(self, api_key=None, model=None, provider="auto", cache=None):
         """
         Inicializa la integración con la API de IA
         
@@ -21,11 +49,16 @@ class ClaudeIntegration:
             api_key: Clave API (opcional, se busca en variables de entorno)
             model: Modelo a usar (opcional, se usa el predeterminado del proveedor)
             provider: Proveedor de IA ("claude", "gemini", o "auto" para detectar automáticamente)
+            cache: ResponseCache para reutilizar respuestas de peticiones
+                idénticas (None = llamar siempre a la API); ver
+                claude/response_cache.py
         """
+        load_env()
         self.provider = provider
         self.api_key = None
         self.model = model
-        self.client = None
+        self.cache = cache
+        self._client = None
         
         if provider == "auto":
             gemini_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
@@ -53,18 +86,26 @@ class ClaudeIntegration:
                     raise ValueError("No se encontró ANTHROPIC_API_KEY en las variables de entorno")
         
         if self.provider == "gemini":
-            import google.generativeai as genai
-            genai.configure(api_key=self.api_key)
-            self.model = model or "gemini-2.5-flash"
-            self.client = genai.GenerativeModel(self.model)
+            self.model = model or DEFAULT_MODELS["gemini"]
             print(f"✅ Usando Google Gemini ({self.model})")
         elif self.provider == "claude":
-            from anthropic import Anthropic
-            self.client = Anthropic(api_key=self.api_key)
-            self.model = model or "claude-3-5-sonnet-20241022"
+            self.model = model or DEFAULT_MODELS["claude"]
             print(f"✅ Usando Anthropic Claude ({self.model})")
     
-    def generate_presentation_content(self, topic, num_slides=5, style="professional"):
+    @property
+    def client(self):
+        """
+        Cliente del SDK del proveedor, obtenido en el primer uso
+        
+        Es el cliente compartido del registro: todas las integraciones con
+        el mismo proveedor, API key y modelo usan el mismo pool de conexiones.
+        """
+        if self._client is None:
+            self._client = registry.get(self.provider, self.api_key, self.model)
+        return self._client
+    
+    def generate_presentation_content(self, topic, num_slides=5, style="professional",
+                                      refresh=False, use_cache=True):
         """
         Genera contenido para una presentación usando la IA configurada
         
@@ -72,12 +113,138 @@ class ClaudeIntegration:
             topic: Tema de la presentación
             num_slides: Número de diapositivas a generar
             style: Estilo de la presentación
+            refresh: Ignorar la respuesta guardada en la caché y reemplazarla
+                por una nueva
+            use_cache: False para no leer ni escribir la caché
         
         Returns:
             str: Contenido generado en formato de texto estructurado
         """
         prompt = self._create_prompt(topic, num_slides, style)
+        key, content = self._cache_lookup(prompt, num_slides, style, refresh, use_cache)
+        if content is not None:
+            return content
+        
+        content = self._request(prompt)
+        self._cache_store(key, content)
+        return content
+    
+    def stream_presentation_content(self, topic, num_slides=5, style="professional",
+                                    refresh=False, use_cache=True):
+        """
+        Genera el contenido en streaming, produciendo el texto a medida que llega
+        
+        Para obtener cada diapositiva en cuanto se completa:
+            iter_slides(iter_lines(ai.stream_presentation_content(topic)))
+        (ver scripts/text_to_pptx.py). Los argumentos son los de
+        generate_presentation_content; una respuesta de la caché se produce
+        en un solo fragmento.
+        
+        Yields:
+            str: Fragmentos del texto generado
+        """
+        prompt = self._create_prompt(topic, num_slides, style)
+        key, content = self._cache_lookup(prompt, num_slides, style, refresh, use_cache)
+        if content is not None:
+            yield content
+            return
+        
+        parts = []
+        for text in self._request_stream(prompt):
+            parts.append(text)
+            yield text
+        # Solo se guarda la respuesta completa
+        self._cache_store(key, "".join(parts))
+    
+    async def agenerate_presentation_content(self, topic, num_slides=5, style="professional",
+                                             refresh=False, use_cache=True):
+        """
+        Versión asíncrona de generate_presentation_content
         
+        Usa los clientes asíncronos de los SDK, así que muchas peticiones
+        pueden esperar a la vez en un solo hilo (ver generate_many). Los
+        argumentos y el resultado son los mismos.
+        """
+        import asyncio
+        
+        # La caché lee y escribe SQLite en disco: en un hilo aparte para no
+        # bloquear el bucle de eventos (y con él las demás peticiones)
+        loop = asyncio.get_running_loop()
+        prompt = self._create_prompt(topic, num_slides, style)
+        key, content = await loop.run_in_executor(
+            None, self._cache_lookup, prompt, num_slides, style, refresh, use_cache)
+        if content is not None:
+            return content
+        
+        content = await self._arequest(prompt)
+        await loop.run_in_executor(None, self._cache_store, key, content)
+        return content
+    
+    async def generate_many(self, topics, concurrency=4, num_slides=5, style="professional",
+                            refresh=False):
+        """
+        Genera varias presentaciones con un límite de peticiones simultáneas
+        
+        Los resultados se producen a medida que terminan (no en el orden de
+        `topics`); un error en un tema no detiene los demás.
+        
+        Ejemplo:
+            async for topic, content, error in ai.generate_many(topics, concurrency=8):
+                ...
+        
+        Args:
+            topics: Temas de las presentaciones
+            concurrency: Máximo de peticiones a la API en curso a la vez
+            num_slides: Número de diapositivas de cada presentación
+            style: Estilo de las presentaciones
+            refresh: Ignorar las respuestas guardadas en la caché
+        
+        Yields:
+            tuple: (tema, contenido, excepción); contenido es None si hubo error
+        """
+        import asyncio
+        
+        if concurrency < 1:
+            raise ValueError(f"concurrency debe ser al menos 1: {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def generate(topic):
+            async with semaphore:
+                try:
+                    content = await self.agenerate_presentation_content(
+                        topic, num_slides=num_slides, style=style, refresh=refresh)
+                    return topic, content, None
+                except Exception as e:
+                    return topic, None, e
+        
+        tasks = [asyncio.ensure_future(generate(topic)) for topic in topics]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Si el llamador deja de iterar, no quedan peticiones huérfanas
+            for task in tasks:
+                task.cancel()
+    
+    def _cache_lookup(self, prompt, num_slides, style, refresh, use_cache):
+        """
+        Busca una respuesta en la caché
+        
+        Returns:
+            tuple: (clave para guardar la respuesta o None si no se usa la
+                caché, respuesta guardada o None)
+        """
+        if self.cache is None or not use_cache:
+            return None, None
+        key = self.cache.key(self.provider, self.model, prompt, num_slides, style)
+        return key, None if refresh else self.cache.get(key)
+    
+    def _cache_store(self, key, content):
+        if key is not None:
+            self.cache.put(key, content, provider=self.provider, model=self.model)
+    
+    def _request(self, prompt):
+        """Envía el prompt al proveedor y devuelve el texto de la respuesta"""
         try:
             if self.provider == "gemini":
                 response = self.client.generate_content(prompt)
@@ -95,131 +262,53 @@ class ClaudeIntegration:
         except Exception as e:
             raise Exception(f"Error al generar contenido con {self.provider}: {str(e)}")
     
-    def _create_prompt(self, topic, num_slides, style):
-        """Crea el prompt para la IA"""
-        return f"""Genera el contenido para una presentación sobre "{topic}" con {num_slides} diapositivas.
-
-Estilo: {style}
-
-Formato de salida:
-- Cada diapositiva debe empezar con "SLIDE N:" donde N es el número
-- Luego el título de la diapositiva
-- Seguido de viñetas con el contenido (usando guiones -)
-- Deja una línea en blanco entre diapositivas
-
-Ejemplo:
-SLIDE 1: Título de la primera diapositiva
-- Primera viñeta
-- Segunda viñeta
-- Tercera viñeta
-
-SLIDE 2: Título de la segunda diapositiva
-- Primera viñeta
-- Segunda viñeta
-
-Genera contenido relevante, conciso y bien estructurado. Incluye una diapositiva de introducción y una de conclusión.
-"""
-    
-    def save_to_file(self, content, output_file):
-        """
-        Guarda el contenido generado en un archivo
-        
-        Args:
-            content: Contenido a guardar
-            output_file: Ruta del archivo de salida
-        """
+    def _request_stream(self, prompt):
+        """Envía el prompt al proveedor y produce el texto de la respuesta en fragmentos"""
         try:
-            # Crear directorio si no existe
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-                
-        except Exception as e:
-            raise Exception(f"Error al guardar el archivo: {str(e)}")
-
-
-# Funciones legacy para compatibilidad
-def ask_claude(prompt, max_tokens=1000):
-    """Función legacy - usar ClaudeIntegration en su lugar"""
-    api_key = os.getenv("ANTHROPIC_API_KEY") or os.getenv("CLAUDE_API_KEY")
-    if not api_key:
-        raise EnvironmentError("Set ANTHROPIC_API_KEY or CLAUDE_API_KEY env var.")
-    
-    from anthropic import Anthropic
-    client = Anthropic(api_key=api_key)
-    message = client.messages.create(
-        model="claude-3-5-sonnet-20241022",
-        max_tokens=max_tokens,
-        messages=[{"role": "user", "content": prompt}]
-    )
-    return message.content[0].text
-
-
-def prompt_for_presentation(topic, slides=5):
-    """
-    Prompt que pide a la IA devolver JSON con la estructura de slides.
-    """
-    return f"""
-Genera una presentación sobre "{topic}" con {slides} slides en formato JSON.
-Cada slide debe ser un objeto con "title", "bullets" (lista) y opcional "image" (URL).
-Devuelve **solo** JSON válido: [{{"title": "...", "bullets": ["..."]}}].
-No expliques nada fuera del JSON.
-"""
-
-
-if __name__ == "__main__":
-    # Prueba básica
-    try:
-        ai = ClaudeIntegration(provider="auto")
-        print(f"✅ Integración inicializada correctamente")
-        print(f"✅ Proveedor: {ai.provider}")
-        print(f"✅ Modelo: {ai.model}")
-        
-        # Generar contenido de ejemplo
-        content = ai.generate_presentation_content(
-            topic="RPA con Python",
-            num_slides=3,
-            style="professional"
-        )
-        print("\n--- Contenido generado ---")
-        print(content[:500] + "...")
+            if self.provider == "gemini":
+                for chunk in self.client.generate_content(prompt, stream=True):
+                    yield chunk.text
+            elif self.provider == "claude":
+                with self.client.messages.stream(
+                    model=self.model,
+                    max_tokens=4096,
+                    messages=[{"role": "user", "content": prompt}]
+                ) as stream:
+                    yield from stream.text_stream
         
-    except Exception as e:
-        print(f"❌ Error: {e}")
+        except Exception as e:
+            raise Exception(f"Error al generar contenido con {self.provider}: {str(e)}")
     
-    def generate_presentation_content(self, topic, num_slides=5, style="professional"):
-        """
-        Genera contenido para una presentación usando Claude
-        
-        Args:
-            topic: Tema de la presentación
-            num_slides: Número de diapositivas a generar
-            style: Estilo de la presentación (professional, casual, academic, etc.)
-        
-        Returns:
-            str: Contenido generado en formato de texto estructurado
-        """
-        prompt = self._create_prompt(topic, num_slides, style)
-        
+    async def _arequest(self, prompt):
+        """Versión asíncrona de _request"""
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            if self.provider == "gemini":
+                response = await self._get_async_client().generate_content_async(prompt)
+                content = response.text
+            elif self.provider == "claude":
+                message = await self._get_async_client().messages.create(
+                    model=self.model,
+                    max_tokens=4096,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                content = message.content[0].text
             
-            # Extraer el contenido de la respuesta
-            content = message.content[0].text
             return content
             
         except Exception as e:
-            raise Exception(f"Error al generar contenido con Claude: {str(e)}")
+            raise Exception(f"Error al generar contenido con {self.provider}: {str(e)}")
+    
+    def _get_async_client(self):
+        """
+        Cliente asíncrono del proveedor para el bucle de eventos en curso
+        
+        Sus conexiones pertenecen al bucle de eventos que lo creó, así que el
+        registro comparte uno por bucle (p.ej. por cada asyncio.run).
+        """
+        return registry.get_async(self.provider, self.api_key, self.model)
     
     def _create_prompt(self, topic, num_slides, style):
-        """Crea el prompt para Claude"""
+        """Crea el prompt para la IA"""
         return f"""Genera el contenido para una presentación sobre "{topic}" con {num_slides} diapositivas.
 
 Estilo: {style}
@@ -265,13 +354,14 @@ Genera contenido relevante, conciso y bien estructurado. Incluye una diapositiva
 # Funciones legacy para compatibilidad
 def ask_claude(prompt, max_tokens=1000):
     """Función legacy - usar ClaudeIntegration en su lugar"""
+    load_env()
     api_key = os.getenv("ANTHROPIC_API_KEY") or os.getenv("CLAUDE_API_KEY")
     if not api_key:
         raise EnvironmentError("Set ANTHROPIC_API_KEY or CLAUDE_API_KEY env var.")
     
-    client = Anthropic(api_key=api_key)
+    client = registry.get("claude", api_key, DEFAULT_MODELS["claude"])
     message = client.messages.create(
-        model="claude-3-5-sonnet-20241022",
+        model=DEFAULT_MODELS["claude"],
         max_tokens=max_tokens,
         messages=[{"role": "user", "content": prompt}]
     )
@@ -280,7 +370,7 @@ def ask_claude(prompt, max_tokens=1000):
 
 def prompt_for_presentation(topic, slides=5):
     """
-    Prompt que pide a Claude devolver JSON con la estructura de slides.
+    Prompt que pide a la IA devolver JSON con la estructura de slides.
     """
     return f"""
 Genera una presentación sobre "{topic}" con {slides} slides en formato JSON.
@@ -293,13 +383,14 @@ No expliques nada fuera del JSON.
 if __name__ == "__main__":
     # Prueba básica
     try:
-        claude = ClaudeIntegration()
-        print(f"✅ Claude Integration inicializado correctamente")
-        print(f"✅ Modelo: {claude.model}")
+        ai = ClaudeIntegration(provider="auto")
+        print(f"✅ Integración inicializada correctamente")
+        print(f"✅ Proveedor: {ai.provider}")
+        print(f"✅ Modelo: {ai.model}")
         
         # Generar contenido de ejemplo
-        content = claude.generate_presentation_content(
-            topic="RPA con Python y Claude",
+        content = ai.generate_presentation_content(
+            topic="RPA con Python",
             num_slides=3,
             style="professional"
         )
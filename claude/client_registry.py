@@ -0,0 +1,189 @@
+# claude/client_registry.py
+"""
+Registro de clientes de los proveedores de IA compartido por todo el proceso
+
+Crear un cliente de Anthropic abre un pool de conexiones HTTP nuevo, así que
+cada integración (o cada llamada a ask_claude) pagaba de nuevo la conexión
+TCP y el saludo TLS. El registro entrega el mismo cliente a todas las
+integraciones con el mismo proveedor, API key y modelo, y sus conexiones
+keep-alive se reutilizan entre peticiones, instancias e hilos.
+
+El tamaño del pool se configura con configure_pool() o con las variables de
+entorno PPTX_AI_MAX_CONNECTIONS y PPTX_AI_MAX_KEEPALIVE. Gemini usa un solo
+canal gRPC que multiplexa las peticiones, así que para él no aplica.
+
+Los clientes asíncronos (get_async) se comparten solo dentro de un mismo
+bucle de eventos, porque sus conexiones quedan atadas al bucle que las creó.
+"""
+import os
+import threading
+
+
+# Conexiones simultáneas por cliente y conexiones inactivas que se conservan
+DEFAULT_MAX_CONNECTIONS = int(os.environ.get("PPTX_AI_MAX_CONNECTIONS", 100))
+DEFAULT_MAX_KEEPALIVE = int(os.environ.get("PPTX_AI_MAX_KEEPALIVE", 20))
+
+# Segundos que una conexión inactiva sigue abierta
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+
+class ClientRegistry:
+    """Clientes de los SDK de IA compartidos, uno por (proveedor, API key, modelo)"""
+
+    def __init__(self, max_connections=DEFAULT_MAX_CONNECTIONS, max_keepalive=DEFAULT_MAX_KEEPALIVE,
+                 keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY):
+        """
+        Inicializa el registro
+
+        Args:
+            max_connections: Conexiones simultáneas de cada cliente de Anthropic
+            max_keepalive: Conexiones inactivas que se conservan abiertas
+            keepalive_expiry: Segundos antes de cerrar una conexión inactiva
+        """
+        self._lock = threading.Lock()
+        self._clients = {}
+        # Clientes asíncronos por bucle de eventos: bucle -> {clave: cliente}
+        self._async_clients = {}
+        self._gemini_key = None
+        self.configure_pool(max_connections, max_keepalive, keepalive_expiry)
+
+    def configure_pool(self, max_connections=None, max_keepalive=None, keepalive_expiry=None):
+        """
+        Cambia el tamaño de los pools de conexiones
+
+        Afecta a los clientes que se creen después: los ya registrados se
+        olvidan (quien los tenga puede seguir usándolos) y la próxima
+        petición de cada clave crea uno nuevo con los límites nuevos.
+
+        Args:
+            max_connections: Conexiones simultáneas por cliente (None = no cambiar)
+            max_keepalive: Conexiones inactivas conservadas (None = no cambiar)
+            keepalive_expiry: Segundos antes de cerrar una conexión inactiva
+                (None = no cambiar)
+        """
+        with self._lock:
+            if max_connections is not None:
+                self.max_connections = max_connections
+            if max_keepalive is not None:
+                self.max_keepalive = max_keepalive
+            if keepalive_expiry is not None:
+                self.keepalive_expiry = keepalive_expiry
+            self._clients.clear()
+            self._async_clients.clear()
+
+    def get(self, provider, api_key, model):
+        """
+        Obtiene el cliente compartido de un proveedor, creándolo la primera vez
+
+        Args:
+            provider: "gemini" o "claude"
+            api_key: Clave API
+            model: Modelo (Gemini crea un GenerativeModel por modelo)
+
+        Returns:
+            GenerativeModel de Gemini o cliente Anthropic
+        """
+        # La URL base de Anthropic se lee del entorno al crear el cliente
+        key = (provider, api_key, model, os.environ.get("ANTHROPIC_BASE_URL"))
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._create(provider, api_key, model)
+                self._clients[key] = client
+            return client
+
+    def get_async(self, provider, api_key, model):
+        """
+        Obtiene el cliente asíncrono de un proveedor para el bucle de eventos en curso
+
+        Sus conexiones (el pool HTTP de Anthropic o el canal gRPC asíncrono
+        de Gemini) pertenecen al bucle que lo creó, así que cada bucle
+        (p.ej. cada asyncio.run) tiene el suyo, compartido por todas las
+        integraciones que se usan en él.
+
+        Args:
+            provider: "gemini" o "claude"
+            api_key: Clave API
+            model: Modelo
+
+        Returns:
+            GenerativeModel de Gemini o cliente AsyncAnthropic
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        key = (provider, api_key, model, os.environ.get("ANTHROPIC_BASE_URL"))
+        with self._lock:
+            # Los clientes de bucles ya cerrados no se pueden volver a usar
+            for closed in [other for other in self._async_clients if other.is_closed()]:
+                del self._async_clients[closed]
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                client = self._create_async(provider, api_key, model)
+                clients[key] = client
+            return client
+
+    def clear(self):
+        """Olvida todos los clientes registrados"""
+        with self._lock:
+            self._clients.clear()
+            self._async_clients.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._clients)
+
+    def _create(self, provider, api_key, model):
+        """Crea un cliente (llamar con el lock tomado)"""
+        if provider == "gemini":
+            import google.generativeai as genai
+            # configure() reinicia los clientes internos del SDK: solo se
+            # llama cuando cambia la API key (la configuración del SDK es
+            # global, así que usar dos keys de Gemini a la vez no es posible)
+            if self._gemini_key != api_key:
+                genai.configure(api_key=api_key)
+                self._gemini_key = api_key
+            return genai.GenerativeModel(model)
+        if provider == "claude":
+            from anthropic import Anthropic, DefaultHttpxClient
+            return Anthropic(api_key=api_key, http_client=DefaultHttpxClient(limits=self._limits()))
+        raise ValueError(f"Proveedor desconocido: {provider!r}")
+
+    def _create_async(self, provider, api_key, model):
+        """Crea un cliente asíncrono en el bucle en curso (llamar con el lock tomado)"""
+        if provider == "gemini":
+            from google.generativeai import client as genai_client
+            gemini = self._create(provider, api_key, model)
+            # generate_content_async usa un cliente gRPC asíncrono global del
+            # SDK, atado al primer bucle que lo usó: este GenerativeModel
+            # recibe uno propio, creado en el bucle en curso
+            gemini._async_client = genai_client._client_manager.make_client("generative_async")
+            return gemini
+        if provider == "claude":
+            from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+            return AsyncAnthropic(api_key=api_key, http_client=DefaultAsyncHttpxClient(limits=self._limits()))
+        raise ValueError(f"Proveedor desconocido: {provider!r}")
+
+    def _limits(self):
+        """Límites del pool con la clase Limits del cliente HTTP que trae el SDK"""
+        from anthropic import DEFAULT_CONNECTION_LIMITS
+        return type(DEFAULT_CONNECTION_LIMITS)(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+# Registro compartido por todas las integraciones del proceso
+registry = ClientRegistry()
+
+
+def get_client(provider, api_key, model):
+    """Obtiene un cliente del registro compartido"""
+    return registry.get(provider, api_key, model)
+
+
+def configure_pool(max_connections=None, max_keepalive=None, keepalive_expiry=None):
+    """Cambia el tamaño de los pools de conexiones del registro compartido"""
+    registry.configure_pool(max_connections, max_keepalive, keepalive_expiry)
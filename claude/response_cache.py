@@ -0,0 +1,228 @@
+# claude/response_cache.py
+"""
+Caché persistente (SQLite) de las respuestas de la IA
+
+Generar el mismo tema con el mismo proveedor, modelo, número de
+diapositivas y estilo devuelve la respuesta guardada en milisegundos en
+lugar de repetir la llamada a la API. Las entradas caducan después de un
+tiempo (TTL) y el tamaño total está limitado: se expulsan primero las
+usadas hace más tiempo (LRU).
+
+Uso:
+    python claude/response_cache.py stats
+    python claude/response_cache.py clear
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing, contextmanager
+
+
+# Archivo por defecto (se puede cambiar con la variable de entorno PPTX_RESPONSE_CACHE)
+DEFAULT_CACHE_FILE = os.environ.get(
+    "PPTX_RESPONSE_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "rpa-pptx", "responses.sqlite3")
+)
+
+# Las respuestas se reutilizan durante una semana
+DEFAULT_TTL = 7 * 24 * 3600
+
+# Tamaño máximo por defecto del texto guardado
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    content TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class ResponseCache:
+    """Caché LRU con caducidad de respuestas de la IA, guardada en SQLite"""
+
+    def __init__(self, cache_file=DEFAULT_CACHE_FILE, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Inicializa la caché
+
+        Args:
+            cache_file: Ruta de la base de datos SQLite
+            ttl: Segundos que una respuesta se considera vigente (None = siempre)
+            max_bytes: Tamaño máximo total de las respuestas guardadas
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @staticmethod
+    def key(provider, model, prompt, num_slides, style):
+        """
+        Calcula la clave de una petición
+
+        Args:
+            provider: Proveedor de IA ("gemini" o "claude")
+            model: Modelo usado
+            prompt: Texto completo del prompt (ver ClaudeIntegration._create_prompt)
+            num_slides: Número de diapositivas pedidas
+            style: Estilo de la presentación
+
+        Returns:
+            str: Hash SHA-256 en hexadecimal
+        """
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        text = f"{provider}\n{model}\n{prompt_hash}\n{num_slides}\n{style}"
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """
+        Busca una respuesta vigente y la marca como usada recientemente
+
+        Returns:
+            str: Respuesta guardada, o None si no está o ya caducó
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute("SELECT content, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+
+            if row is None:
+                self._increment(conn, "misses")
+                return None
+
+            conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self._increment(conn, "hits")
+            return row[0]
+
+    def put(self, key, content, provider="", model=""):
+        """
+        Guarda una respuesta (reemplaza la anterior con la misma clave)
+
+        Args:
+            key: Clave calculada con key()
+            content: Texto generado por la IA
+            provider: Proveedor, para las estadísticas
+            model: Modelo, para las estadísticas
+        """
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, provider, model, content, size, created, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, model, content, size, now, now)
+            )
+            self._evict(conn)
+
+    def stats(self):
+        """
+        Estadísticas de uso
+
+        Returns:
+            dict: "hits", "misses", "hit_rate", "entries", "total_bytes",
+                "max_bytes" y "ttl"
+        """
+        with self._connect() as conn:
+            counters = dict(conn.execute("SELECT name, value FROM stats"))
+            entries, total_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": entries,
+            "total_bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+        }
+
+    def clear(self):
+        """Elimina todas las respuestas y las estadísticas"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+            conn.execute("DELETE FROM stats")
+
+    @contextmanager
+    def _connect(self):
+        """Conexión de una sola operación, confirmada al salir"""
+        with self._lock:
+            if not self._initialized:
+                os.makedirs(os.path.dirname(os.path.abspath(self.cache_file)), exist_ok=True)
+            with closing(sqlite3.connect(self.cache_file, timeout=10)) as conn:
+                if not self._initialized:
+                    # WAL: otros procesos pueden leer mientras uno escribe
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                    self._initialized = True
+                with conn:
+                    yield conn
+
+    @staticmethod
+    def _increment(conn, name):
+        conn.execute(
+            "INSERT INTO stats (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,)
+        )
+
+    def _evict(self, conn):
+        """Elimina las respuestas caducadas y las usadas hace más tiempo hasta respetar max_bytes"""
+        if self.ttl is not None:
+            conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,))
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Administra la caché de respuestas de la IA")
+    parser.add_argument("command", choices=["stats", "clear"])
+    parser.add_argument("--cache-file", default=DEFAULT_CACHE_FILE, help="Base de datos de la caché")
+    args = parser.parse_args(argv)
+
+    cache = ResponseCache(args.cache_file)
+    if args.command == "clear":
+        cache.clear()
+        print(f"🧹 Caché eliminada: {args.cache_file}")
+        return 0
+
+    stats = cache.stats()
+    print(f"📁 Caché: {args.cache_file}")
+    print(f"   Entradas: {stats['entries']} "
+          f"({stats['total_bytes'] / 1024:.1f} KB / {stats['max_bytes'] / 1024 / 1024:.0f} MB)")
+    print(f"   Aciertos: {stats['hits']}  Fallos: {stats['misses']}  "
+          f"Tasa de acierto: {stats['hit_rate']:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,9 +11,9 @@ import threading
 # Agregar el directorio raíz al path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from claude.claude_integration import ClaudeIntegration
-from scripts.text_to_pptx import TextToPptxConverter
-from scripts.latex_to_pptx import LatexToPptxConverter
+# Los backends (integración con la IA, conversores, pdf2image) se importan
+# al usarlos, para que la ventana aparezca sin esperarlos
+from scripts.themes import available_themes
 
 # Configuración de apariencia
 ctk.set_appearance_mode("dark")  # Modes: "System" (default), "Dark", "Light"
@@ -203,13 +203,22 @@ class ModernPresentationApp(ctk.CTk):
         
         self.theme_combo = ctk.CTkComboBox(
             theme_container,
-            values=["modern_blue", "dark", "professional", "vibrant"],
+            values=available_themes(),
             width=150,
             height=35
         )
         self.theme_combo.pack(anchor="w", pady=(5, 0))
         self.theme_combo.set("modern_blue")
         
+        # Reutilizar respuestas de temas ya generados (desmarcar para pedir una nueva)
+        self.reuse_cache_var = ctk.BooleanVar(value=True)
+        ctk.CTkCheckBox(
+            form_frame,
+            text="♻️ Reutilizar respuestas guardadas para el mismo tema",
+            variable=self.reuse_cache_var,
+            font=ctk.CTkFont(size=12)
+        ).grid(row=3, column=0, sticky="w", pady=(0, 5))
+        
         # Botón generar
         self.generate_btn = ctk.CTkButton(
             form_frame,
@@ -219,11 +228,11 @@ class ModernPresentationApp(ctk.CTk):
             font=ctk.CTkFont(size=15, weight="bold"),
             state="disabled"
         )
-        self.generate_btn.grid(row=3, column=0, pady=(10, 0))
+        self.generate_btn.grid(row=4, column=0, pady=(10, 0))
         
         # Barra de progreso
         self.progress_generate = ctk.CTkProgressBar(form_frame, mode="indeterminate")
-        self.progress_generate.grid(row=4, column=0, sticky="ew", pady=(15, 0))
+        self.progress_generate.grid(row=5, column=0, sticky="ew", pady=(15, 0))
         self.progress_generate.grid_remove()  # Ocultar inicialmente
     
     def setup_edit_tab(self):
@@ -335,13 +344,20 @@ class ModernPresentationApp(ctk.CTk):
             text_color="gray70"
         ).grid(row=1, column=0, sticky="w", padx=20, pady=(0, 15))
         
+        self.pages_entry = ctk.CTkEntry(
+            option2_frame,
+            placeholder_text="Páginas (ej. 1-3, 40-55; vacío = todas)",
+            width=300
+        )
+        self.pages_entry.grid(row=2, column=0, padx=20, pady=(0, 10))
+        
         ctk.CTkButton(
             option2_frame,
             text="📄 LaTeX/PDF → PPTX",
             command=self.convert_latex_to_pptx,
             height=50,
             font=ctk.CTkFont(size=14, weight="bold")
-        ).grid(row=2, column=0, padx=20, pady=(0, 15))
+        ).grid(row=3, column=0, padx=20, pady=(0, 15))
         
         # Barra de progreso
         self.progress_convert = ctk.CTkProgressBar(self.tab_convert, mode="indeterminate")
@@ -376,7 +392,10 @@ class ModernPresentationApp(ctk.CTk):
         """Inicializa la conexión con la IA"""
         def init_thread():
             try:
-                self.ai_instance = ClaudeIntegration(provider="auto")
+                from claude.claude_integration import ClaudeIntegration
+                from claude.response_cache import ResponseCache
+                
+                self.ai_instance = ClaudeIntegration(provider="auto", cache=ResponseCache())
                 provider = self.ai_instance.provider.upper()
                 model = self.ai_instance.model
                 
@@ -413,6 +432,7 @@ class ModernPresentationApp(ctk.CTk):
             return
         
         style = self.style_combo.get()
+        refresh = not self.reuse_cache_var.get()
         
         # Deshabilitar botón y mostrar progreso
         self.generate_btn.configure(state="disabled")
@@ -422,12 +442,32 @@ class ModernPresentationApp(ctk.CTk):
         
         def generate_thread():
             try:
-                content = self.ai_instance.generate_presentation_content(
+                from scripts.text_to_pptx import iter_lines, iter_slides
+                
+                # El editor se llena a medida que llega el texto
+                chunks = self.ai_instance.stream_presentation_content(
                     topic=topic,
                     num_slides=num_slides,
-                    style=style
+                    style=style,
+                    refresh=refresh
                 )
+                parts = []
                 
+                def show_live(chunks):
+                    for chunk in chunks:
+                        if not parts:
+                            self.after(0, self.on_generation_started)
+                        parts.append(chunk)
+                        self.after(0, lambda text=chunk: self.content_textbox.insert("end", text))
+                        yield chunk
+                
+                for number, _ in enumerate(iter_slides(iter_lines(show_live(chunks))), start=1):
+                    self.after(0, lambda n=number: self.status_label.configure(
+                        text=f"⏳ Generando contenido con IA... {n} diapositivas listas",
+                        text_color="orange"
+                    ))
+                
+                content = "".join(parts)
                 self.after(0, lambda: self.on_content_generated(content))
                 
             except Exception as e:
@@ -435,6 +475,11 @@ class ModernPresentationApp(ctk.CTk):
         
         threading.Thread(target=generate_thread, daemon=True).start()
     
+    def on_generation_started(self):
+        """Callback al recibir el primer fragmento: muestra el editor vacío"""
+        self.content_textbox.delete("1.0", "end")
+        self.tabview.set("✏️ Editar Contenido")
+    
     def on_content_generated(self, content):
         """Callback cuando el contenido se genera exitosamente"""
         self.progress_generate.stop()
@@ -529,15 +574,6 @@ class ModernPresentationApp(ctk.CTk):
         if not output_path:
             return
         
-        # Guardar contenido temporalmente
-        temp_file = "temp_content.txt"
-        try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudo crear archivo temporal:\n{str(e)}")
-            return
-        
         theme = self.theme_combo.get()
         
         self.progress_convert.grid()
@@ -546,11 +582,14 @@ class ModernPresentationApp(ctk.CTk):
         
         def convert_thread():
             try:
-                converter = TextToPptxConverter(theme=theme)
-                converter.convert(temp_file, output_path)
+                from scripts.text_to_pptx import TextToPptxConverter
                 
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
+                # Las diapositivas largas se dividen en continuaciones "(cont.)"
+                converter = TextToPptxConverter(theme=theme, auto_paginate=True, fast_bullets=True)
+                # Convertir directamente desde el editor, sin archivo temporal.
+                # Si se vuelve a convertir sobre el mismo archivo, solo se
+                # reconstruyen las diapositivas editadas
+                converter.write_text(content, output_path, incremental=True)
                 
                 self.after(0, lambda: self.on_conversion_success(output_path))
                 
@@ -561,6 +600,15 @@ class ModernPresentationApp(ctk.CTk):
     
     def convert_latex_to_pptx(self):
         """Convierte un archivo LaTeX o PDF a PowerPoint"""
+        from scripts.latex_to_pptx import parse_page_ranges
+        
+        pages_spec = self.pages_entry.get().strip()
+        try:
+            pages = parse_page_ranges(pages_spec) if pages_spec else None
+        except ValueError as e:
+            messagebox.showwarning("Advertencia", str(e))
+            return
+        
         input_path = filedialog.askopenfilename(
             title="Seleccionar archivo LaTeX o PDF",
             filetypes=[
@@ -588,8 +636,18 @@ class ModernPresentationApp(ctk.CTk):
         
         def convert_thread():
             try:
-                converter = LatexToPptxConverter()
-                converter.convert(input_path, output_path)
+                from scripts.latex_cache import LatexCache
+                from scripts.latex_to_pptx import LatexToPptxConverter
+                
+                converter = LatexToPptxConverter(latex_cache=LatexCache())
+                # La barra pasa a mostrar el avance real al empezar las páginas
+                converter.convert(
+                    input_path,
+                    output_path,
+                    pages=pages,
+                    progress=lambda done, total, elapsed: self.after(
+                        0, lambda: self.on_conversion_progress(done, total, elapsed))
+                )
                 
                 self.after(0, lambda: self.on_conversion_success(output_path))
                 
@@ -598,10 +656,30 @@ class ModernPresentationApp(ctk.CTk):
         
         threading.Thread(target=convert_thread, daemon=True).start()
     
-    def on_conversion_success(self, output_path):
-        """Callback cuando la conversión es exitosa"""
+    def on_conversion_progress(self, done, total, elapsed):
+        """Callback por página: avance y tiempo restante estimado"""
+        if self.progress_convert.cget("mode") != "determinate":
+            self.progress_convert.stop()
+            self.progress_convert.configure(mode="determinate")
+        self.progress_convert.set(done / total)
+        
+        from scripts.latex_to_pptx import format_eta
+        
+        eta = format_eta(done, total, elapsed)
+        self.status_label.configure(
+            text=f"⏳ Convirtiendo página {done}/{total}" + (f" — quedan ~{eta}" if eta else ""),
+            text_color="orange"
+        )
+    
+    def reset_convert_progress(self):
+        """Oculta la barra de progreso y la deja lista para la próxima conversión"""
         self.progress_convert.stop()
+        self.progress_convert.configure(mode="indeterminate")
         self.progress_convert.grid_remove()
+    
+    def on_conversion_success(self, output_path):
+        """Callback cuando la conversión es exitosa"""
+        self.reset_convert_progress()
         self.status_label.configure(text="✅ Presentación creada exitosamente", text_color="green")
         
         result = messagebox.askyesno(
@@ -614,8 +692,7 @@ class ModernPresentationApp(ctk.CTk):
     
     def on_conversion_error(self, error_msg):
         """Callback cuando hay un error en la conversión"""
-        self.progress_convert.stop()
-        self.progress_convert.grid_remove()
+        self.reset_convert_progress()
         self.status_label.configure(text="❌ Error en la conversión", text_color="red")
         messagebox.showerror("Error", f"No se pudo crear la presentación:\n{error_msg}")
 
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# scripts/batch_convert.py
+"""
+Conversión por lotes de archivos de texto estructurado a PowerPoint
+
+Reparte los archivos entre varios procesos (cada uno con su propio
+TextToPptxConverter) y reporta el rendimiento al terminar.
+
+Uso:
+    python scripts/batch_convert.py entrada/ salida/ --jobs 4
+    python scripts/batch_convert.py "outlines/*.txt" salida/ --theme dark
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.instrumentation import ProfileRecorder
+from scripts.output_paths import output_paths
+from scripts.text_to_pptx import TextToPptxConverter
+from scripts.themes import available_themes, get_theme
+
+
+# Convertidor propio de cada proceso trabajador (se crea una sola vez)
+_worker_converter = None
+_worker_incremental = False
+_worker_profile = False
+
+
+def _init_worker(theme, incremental, paginate, profile=False):
+    """Crea el convertidor del proceso trabajador"""
+    global _worker_converter, _worker_incremental, _worker_profile
+    _worker_converter = TextToPptxConverter(theme=theme, auto_paginate=paginate, fast_bullets=True)
+    _worker_incremental = incremental
+    _worker_profile = profile
+
+
+def _convert_one(input_file, output_file):
+    """
+    Convierte un archivo dentro de un proceso trabajador
+
+    Returns:
+        tuple: (input_file, output_file, num_slides, error, profile), donde
+            profile son los eventos por etapa (None si no se perfila)
+    """
+    recorder = None
+    if _worker_profile:
+        recorder = ProfileRecorder()
+        _worker_converter.observer = recorder
+    try:
+        num_slides = _worker_converter.convert(input_file, output_file, incremental=_worker_incremental)
+        return input_file, output_file, num_slides, None, recorder and recorder.to_dict()
+    except Exception as e:
+        return input_file, output_file, 0, f"{type(e).__name__}: {e}", None
+
+
+def collect_inputs(sources):
+    """
+    Expande directorios y patrones glob en una lista de archivos .txt
+
+    Args:
+        sources: Lista de directorios, patrones glob o rutas de archivo
+
+    Returns:
+        list: Rutas de archivo ordenadas y sin duplicados
+    """
+    files = set()
+    for source in sources:
+        if os.path.isdir(source):
+            files.update(glob.glob(os.path.join(source, "*.txt")))
+        elif glob.has_magic(source):
+            files.update(p for p in glob.glob(source, recursive=True) if os.path.isfile(p))
+        elif os.path.isfile(source):
+            files.add(source)
+        else:
+            raise FileNotFoundError(f"Archivo no encontrado: {source}")
+    return sorted(files)
+
+
+def convert_batch(sources, output_dir, theme="modern_blue", jobs=None, incremental=False,
+                  paginate=False, profile=False):
+    """
+    Convierte muchos archivos de texto a PowerPoint en paralelo
+
+    Los errores de cada archivo (también la caída de un proceso
+    trabajador) se recogen en el resultado en lugar de abortar el lote
+    completo. Los archivos de carpetas distintas con el mismo nombre
+    (a/x.txt y b/x.txt) irían al mismo .pptx, así que no se convierten y
+    se reportan como errores.
+
+    Args:
+        sources: Directorio, patrón glob o lista de ellos
+        output_dir: Directorio donde se guardan los .pptx
+        theme: Tema de colores para todas las presentaciones
+        jobs: Número de procesos trabajadores (None = número de CPUs)
+        incremental: Reconstruir solo las diapositivas que cambiaron
+        paginate: Dividir las diapositivas que desbordan en continuaciones
+        profile: Medir la duración de cada etapa por archivo
+
+    Returns:
+        dict: Resultado con "converted" y "errors" (ordenados por entrada),
+            "files", "slides", "elapsed", "files_per_sec" y "slides_per_sec"
+            (y "profile" si se pidió el perfilado)
+    """
+    if isinstance(sources, str):
+        sources = [sources]
+    get_theme(theme)  # falla antes de lanzar los procesos si el tema no existe
+    inputs = collect_inputs(sources)
+    jobs = jobs or os.cpu_count() or 1
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    converted = []
+    pending, errors = output_paths(inputs, output_dir)
+    profiles = {}
+    start = time.perf_counter()
+
+    if pending:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(pending)),
+            initializer=_init_worker,
+            initargs=(theme, incremental, paginate, profile)
+        ) as executor:
+            futures = {executor.submit(_convert_one, input_file, output_file): input_file
+                       for input_file, output_file in pending}
+
+            for future in as_completed(futures):
+                try:
+                    input_file, output_file, num_slides, error, file_profile = future.result()
+                except Exception as e:
+                    # El trabajador murió (BrokenProcessPool) o el resultado
+                    # no se pudo transferir: se reporta solo este archivo
+                    errors.append({"input": futures[future], "error": f"{type(e).__name__}: {e}"})
+                    continue
+                if file_profile:
+                    profiles[input_file] = file_profile
+                if error:
+                    errors.append({"input": input_file, "error": error})
+                else:
+                    converted.append({
+                        "input": input_file,
+                        "output": output_file,
+                        "slides": num_slides
+                    })
+
+    elapsed = time.perf_counter() - start
+    # as_completed entrega en orden de finalización
+    converted.sort(key=lambda item: item["input"])
+    errors.sort(key=lambda item: item["input"])
+    total_slides = sum(item["slides"] for item in converted)
+
+    result = {
+        "converted": converted,
+        "errors": errors,
+        "files": len(converted),
+        "slides": total_slides,
+        "elapsed": elapsed,
+        "files_per_sec": len(converted) / elapsed if elapsed > 0 else 0.0,
+        "slides_per_sec": total_slides / elapsed if elapsed > 0 else 0.0
+    }
+    if profile:
+        result["profile"] = _merge_profiles(profiles)
+    return result
+
+
+def _merge_profiles(profiles):
+    """
+    Une los perfiles de cada archivo y suma la duración de cada etapa
+
+    Args:
+        profiles: dict ruta -> perfil (ProfileRecorder.to_dict())
+
+    Returns:
+        dict: {"summary": totales por etapa, "files": perfiles por archivo}
+    """
+    totals = {}
+    for file_profile in profiles.values():
+        for name, duration in file_profile["summary"].items():
+            totals[name] = totals.get(name, 0.0) + duration
+    return {"summary": totals, "files": dict(sorted(profiles.items()))}
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Convierte por lotes archivos de texto estructurado a PowerPoint"
+    )
+    parser.add_argument("sources", nargs="+", help="Directorios o patrones glob de archivos .txt")
+    parser.add_argument("output_dir", help="Directorio de salida para los .pptx")
+    parser.add_argument("--theme", default="modern_blue", choices=available_themes(),
+                        help="Tema de colores")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Número de procesos (por defecto, uno por CPU)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reutilizar las diapositivas sin cambios de los .pptx existentes")
+    parser.add_argument("--paginate", action="store_true",
+                        help="Dividir las diapositivas que desbordan en continuaciones \"(cont.)\"")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="Guardar la duración de cada etapa (por archivo y total) en un JSON")
+    args = parser.parse_args(argv)
+
+    result = convert_batch(args.sources, args.output_dir, theme=args.theme, jobs=args.jobs,
+                           incremental=args.incremental, paginate=args.paginate,
+                           profile=bool(args.profile))
+
+    print(f"\n✅ Convertidos: {result['files']} archivos, {result['slides']} diapositivas")
+    print(f"⏱️  Tiempo: {result['elapsed']:.2f} s "
+          f"({result['files_per_sec']:.2f} archivos/s, {result['slides_per_sec']:.1f} slides/s)")
+
+    if args.profile:
+        with open(args.profile, "w", encoding="utf-8") as f:
+            json.dump(result["profile"], f, indent=2, ensure_ascii=False)
+        print(f"📈 Perfil guardado: {args.profile}")
+
+    if result["errors"]:
+        print(f"❌ Errores: {len(result['errors'])}")
+        for item in result["errors"]:
+            print(f"   - {item['input']}: {item['error']}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# scripts/beamer_parser.py
+"""
+Parser de presentaciones beamer sencillas a la estructura de diapositivas
+
+Lee frames, títulos e itemize/enumerate (con anidamiento) directamente del
+código .tex y produce la misma lista de diccionarios {"title", "bullets"}
+que usa TextToPptxConverter, sin compilar con pdflatex. Las viñetas
+anidadas agregan la clave "levels" (nivel de cada viñeta, 0 = primer nivel).
+
+Solo entiende un subconjunto de LaTeX: ante cualquier construcción
+desconocida (matemáticas, figuras, columnas, comandos propios...) lanza
+BeamerParseError para que el conversor use la ruta de rasterizado.
+"""
+import datetime
+import re
+
+
+class BeamerParseError(ValueError):
+    """El documento usa construcciones que el parser no entiende"""
+
+
+# Comandos de formato cuyo argumento se conserva como texto
+_TEXT_COMMANDS = {
+    "textbf", "textit", "emph", "underline", "texttt", "textsc", "textsf",
+    "textrm", "alert", "structure", "mbox", "text",
+}
+
+# Comandos sin efecto en el texto extraído
+_IGNORED_COMMANDS = {
+    "pause", "centering", "raggedright", "raggedleft", "noindent", "par",
+    "smallskip", "medskip", "bigskip", "vfill", "hfill", "newline",
+    "small", "footnotesize", "scriptsize", "tiny", "large", "Large", "LARGE",
+    "huge", "Huge", "normalsize", "bfseries", "itshape", "ttfamily",
+}
+
+# Listas anidadas como máximo: PowerPoint solo tiene los niveles de
+# párrafo 0 a 8 (LaTeX, además, no pasa de 4 niveles de itemize)
+_MAX_LIST_DEPTH = 9
+
+# Comandos permitidos entre frames (se ignoran)
+_OUTLINE_COMMANDS = {"section", "subsection", "subsubsection"}
+
+# Secuencias de escape de un carácter
+_ESCAPES = {"&": "&", "%": "%", "$": "$", "#": "#", "_": "_", "{": "{", "}": "}", " ": " "}
+
+_LIST_ENVIRONMENTS = ("itemize", "enumerate")
+
+_COMMENT = re.compile(r"(?<!\\)%.*")
+_DOCUMENTCLASS = re.compile(r"\\documentclass\s*(?:\[[^\]]*\])?\s*\{([^}]*)\}")
+_COMMAND = re.compile(r"\\([A-Za-z]+)\*?|\\(.)")
+_BEGIN_DOCUMENT = re.compile(r"^[^%\n]*?\\begin\s*\{document\}", re.MULTILINE)
+
+
+def split_preamble(source):
+    """
+    Separa un documento LaTeX en preámbulo y cuerpo
+
+    Args:
+        source: Código fuente completo
+
+    Returns:
+        tuple: (preámbulo, cuerpo desde \\begin{document}), o (None, source)
+            si no hay \\begin{document}
+    """
+    match = _BEGIN_DOCUMENT.search(source)
+    if not match:
+        return None, source
+    start = source.rindex("\\begin", 0, match.end())
+    return source[:start], source[start:]
+
+
+def _read_group(source, pos, open_char="{", close_char="}"):
+    """
+    Lee un grupo delimitado con llaves balanceadas a partir de `pos`
+
+    Returns:
+        tuple: (contenido, posición siguiente) o (None, pos) si no hay grupo
+    """
+    start = pos
+    while pos < len(source) and source[pos] in " \t\n":
+        pos += 1
+    if pos >= len(source) or source[pos] != open_char:
+        return None, start
+
+    depth = 0
+    for end in range(pos, len(source)):
+        char = source[end]
+        if char == "\\":
+            continue
+        if end > 0 and source[end - 1] == "\\":
+            continue
+        if char == open_char:
+            depth += 1
+        elif char == close_char:
+            depth -= 1
+            if depth == 0:
+                return source[pos + 1:end], end + 1
+    raise BeamerParseError(f"Llave sin cerrar cerca de: {source[pos:pos + 40]!r}")
+
+
+def _today():
+    today = datetime.date.today()
+    return f"{today.day:02d}/{today.month:02d}/{today.year}"
+
+
+class _FrameParser:
+    """Recorre el contenido de un frame y arma sus viñetas"""
+
+    def __init__(self, source):
+        self.source = source
+        self.title = ""
+        self.is_title_page = False
+        self.bullets = []
+        self.levels = []
+        self.depth = 0          # listas abiertas
+        self.counters = []      # contador de cada lista (None = itemize)
+        self.text = []          # texto del párrafo o viñeta en curso
+
+    def parse(self):
+        self._parse_text(self.source, top=True)
+        self._flush()
+        if self.depth:
+            raise BeamerParseError("Lista sin cerrar")
+
+    def _flush(self):
+        """Cierra la viñeta o el párrafo en curso"""
+        text = " ".join("".join(self.text).split())
+        self.text = []
+        if not text:
+            return
+        self.bullets.append(text)
+        self.levels.append(max(self.depth - 1, 0))
+
+    def _parse_text(self, source, top=False):
+        """Procesa texto con comandos; `top` indica el nivel del frame"""
+        pos = 0
+        while pos < len(source):
+            char = source[pos]
+
+            if char == "\\":
+                pos = self._parse_command(source, pos, top)
+            elif char == "{":
+                group, pos = _read_group(source, pos)
+                self._parse_text(group)
+            elif char == "}":
+                raise BeamerParseError("Llave de cierre sin abrir")
+            elif char in "$^_&#":
+                raise BeamerParseError(f"Carácter especial no soportado: {char}")
+            elif char == "~":
+                self.text.append(" ")
+                pos += 1
+            elif source.startswith("---", pos):
+                self.text.append("—")
+                pos += 3
+            elif source.startswith("--", pos):
+                self.text.append("–")
+                pos += 2
+            elif source.startswith("``", pos) or source.startswith("''", pos):
+                self.text.append("\"")
+                pos += 2
+            elif source.startswith("\n\n", pos) and top and not self.depth:
+                # Línea en blanco: nuevo párrafo
+                self._flush()
+                pos += 2
+            else:
+                self.text.append(char)
+                pos += 1
+
+    def _parse_command(self, source, pos, top):
+        match = _COMMAND.match(source, pos)
+        if match is None:
+            raise BeamerParseError("Barra invertida al final del frame")
+        name, symbol = match.groups()
+        pos = match.end()
+
+        if symbol is not None:
+            if symbol == "\\":
+                self.text.append(" ")
+            elif symbol in _ESCAPES:
+                self.text.append(_ESCAPES[symbol])
+            else:
+                raise BeamerParseError(f"Comando no soportado: \\{symbol}")
+            return pos
+
+        if name in _TEXT_COMMANDS:
+            # \alert<2>{...}: se ignora la especificación de overlay
+            pos = self._skip_overlay(source, pos)
+            group, pos = _read_group(source, pos)
+            if group is None:
+                raise BeamerParseError(f"\\{name} sin argumento")
+            self._parse_text(group)
+        elif name in _IGNORED_COMMANDS:
+            pass
+        elif name == "today":
+            self.text.append(_today())
+        elif name == "and":
+            self.text = ["".join(self.text).rstrip(), ", "]
+        elif name == "frametitle" and top:
+            pos = self._skip_overlay(source, pos)
+            group, pos = _read_group(source, pos)
+            self.title = _plain_text(group or "")
+        elif name == "framesubtitle" and top:
+            _, pos = _read_group(source, pos)
+        elif name == "titlepage" and top:
+            self.is_title_page = True
+        elif name == "item" and self.depth:
+            self._flush()
+            pos = self._skip_overlay(source, pos)
+            label, pos = _read_group(source, pos, "[", "]")
+            counter = self.counters[-1]
+            if label is not None:
+                self.text.append(_plain_text(label) + " ")
+            elif counter is not None:
+                self.counters[-1] = counter + 1
+                self.text.append(f"{counter + 1}. ")
+        elif name in ("begin", "end"):
+            env, pos = _read_group(source, pos)
+            if env not in _LIST_ENVIRONMENTS:
+                raise BeamerParseError(f"Entorno no soportado: {env}")
+            self._flush()
+            if name == "begin":
+                pos = self._skip_overlay(source, pos)
+                _, pos = _read_group(source, pos, "[", "]")
+                self.depth += 1
+                if self.depth > _MAX_LIST_DEPTH:
+                    raise BeamerParseError(f"Listas anidadas en más de {_MAX_LIST_DEPTH} niveles")
+                self.counters.append(0 if env == "enumerate" else None)
+            else:
+                if not self.depth:
+                    raise BeamerParseError(f"\\end{{{env}}} sin \\begin")
+                self.depth -= 1
+                self.counters.pop()
+        else:
+            raise BeamerParseError(f"Comando no soportado: \\{name}")
+        return pos
+
+    @staticmethod
+    def _skip_overlay(source, pos):
+        """Salta una especificación de overlay de beamer (<2->, <+->...)"""
+        _, pos = _read_group(source, pos, "<", ">")
+        return pos
+
+
+def _plain_text(source):
+    """Texto plano de un fragmento LaTeX (títulos, etiquetas...)"""
+    parser = _FrameParser("")
+    parser._parse_text(source)
+    return " ".join("".join(parser.text).split())
+
+
+def _metadata(preamble, command):
+    """Argumento de \\title, \\author... en el preámbulo (sin el título corto)"""
+    match = re.search(r"\\" + command + r"\s*(?:\[[^\]]*\])?\s*(?=\{)", preamble)
+    if not match:
+        return ""
+    group, _ = _read_group(preamble, match.end())
+    return _plain_text(group or "")
+
+
+def parse_beamer(source):
+    """
+    Convierte el código de una presentación beamer en estructura de slides
+
+    La primera diapositiva es la portada (título, subtítulo, autor y fecha);
+    el documento debe empezar con un frame \\titlepage o con \\maketitle.
+
+    Args:
+        source: Código fuente .tex completo
+
+    Returns:
+        list: Diccionarios con "title", "bullets" y, si hay viñetas
+            anidadas, "levels"
+
+    Raises:
+        BeamerParseError: Si el documento usa construcciones no soportadas
+    """
+    source = _COMMENT.sub("", source)
+
+    documentclass = _DOCUMENTCLASS.search(source)
+    if not documentclass or documentclass.group(1).strip() != "beamer":
+        raise BeamerParseError("No es un documento beamer")
+
+    preamble, body = split_preamble(source)
+    if preamble is None:
+        raise BeamerParseError("Falta \\begin{document}")
+    end = body.find("\\end{document}")
+    body = body[len("\\begin{document}"):end if end >= 0 else len(body)]
+
+    cover = {
+        "title": _metadata(preamble, "title"),
+        "bullets": [
+            text for text in (
+                _metadata(preamble, "subtitle"),
+                _metadata(preamble, "author"),
+                _metadata(preamble, "date") if "\\date" in preamble else _today(),
+            ) if text
+        ],
+    }
+
+    slides = []
+    pos = 0
+    while True:
+        start = body.find("\\begin{frame}", pos)
+        between = body[pos:start if start >= 0 else len(body)]
+        for name in re.findall(r"\\([A-Za-z]+)", between):
+            if name == "maketitle" and not slides:
+                slides.append(cover)
+            elif name not in _OUTLINE_COMMANDS:
+                raise BeamerParseError(f"Comando no soportado fuera de un frame: \\{name}")
+        if start < 0:
+            break
+
+        frame_end = body.find("\\end{frame}", start)
+        if frame_end < 0:
+            raise BeamerParseError("Frame sin cerrar")
+        content = body[start + len("\\begin{frame}"):frame_end]
+        pos = frame_end + len("\\end{frame}")
+
+        # \begin{frame}<overlay>[opciones]{título}{subtítulo}
+        offset = _FrameParser._skip_overlay(content, 0)
+        _, offset = _read_group(content, offset, "[", "]")
+        title, offset = _read_group(content, offset)
+        _, offset = _read_group(content, offset) if title is not None else (None, offset)
+
+        frame = _FrameParser(content[offset:])
+        frame.parse()
+        if title is not None:
+            frame.title = _plain_text(title)
+
+        if frame.is_title_page:
+            if slides:
+                raise BeamerParseError("\\titlepage solo se admite en el primer frame")
+            slides.append(cover)
+            continue
+        if not slides:
+            raise BeamerParseError("El primer frame debe ser la portada (\\titlepage)")
+
+        slide = {"title": frame.title, "bullets": frame.bullets}
+        if any(frame.levels):
+            slide["levels"] = frame.levels
+        slides.append(slide)
+
+    if not slides:
+        raise BeamerParseError("El documento no tiene frames")
+    return slides
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# scripts/generate_presentation.py
+"""
+Genera una presentación con IA y la convierte a PowerPoint en un solo paso
+
+En modo streaming (por defecto) cada diapositiva se construye en el PPTX
+en cuanto la IA termina de escribirla, sin esperar la respuesta completa,
+y se mide el tiempo hasta la primera diapositiva.
+
+Uso:
+    python scripts/generate_presentation.py "Machine Learning" salida.pptx --slides 8
+    python scripts/generate_presentation.py "RPA con Python" salida.pptx --no-stream --theme dark
+"""
+import argparse
+import os
+import sys
+import time
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from claude.claude_integration import ClaudeIntegration
+from claude.response_cache import ResponseCache
+from scripts.text_to_pptx import TextToPptxConverter, iter_lines, iter_slides
+from scripts.themes import available_themes
+
+
+def generate_presentation(ai, topic, output_file, num_slides=5, style="professional",
+                          theme="modern_blue", stream=True, refresh=False, text_file=None,
+                          on_slide=None):
+    """
+    Genera el contenido de una presentación y escribe el PPTX
+
+    Args:
+        ai: ClaudeIntegration configurada
+        topic: Tema de la presentación
+        output_file: Ruta del archivo PPTX de salida
+        num_slides: Número de diapositivas a pedir
+        style: Estilo del contenido
+        theme: Tema de colores del PPTX
+        stream: Construir cada diapositiva en cuanto llega (False = esperar
+            la respuesta completa)
+        refresh: Ignorar la respuesta guardada en la caché de la IA
+        text_file: Ruta donde guardar también el texto generado (opcional)
+        on_slide: Función on_slide(número, diapositiva) que se llama cuando
+            se completa cada diapositiva
+
+    Returns:
+        dict: "slides" (diapositivas del PPTX), "first_slide_s" (segundos
+            hasta la primera diapositiva completa) y "total_s"
+    """
+    start = time.perf_counter()
+    timings = {"first_slide_s": None}
+    parts = []
+
+    if stream:
+        chunks = ai.stream_presentation_content(topic, num_slides, style, refresh=refresh)
+    else:
+        chunks = [ai.generate_presentation_content(topic, num_slides, style, refresh=refresh)]
+
+    def collect(chunks):
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+
+    def timed_slides():
+        for number, slide in enumerate(iter_slides(iter_lines(collect(chunks))), start=1):
+            if number == 1:
+                timings["first_slide_s"] = time.perf_counter() - start
+            if on_slide is not None:
+                on_slide(number, slide)
+            yield slide
+
+    converter = TextToPptxConverter(theme=theme, auto_paginate=True, fast_bullets=True)
+    num_created = converter.write_slides(timed_slides(), output_file)
+
+    if text_file:
+        os.makedirs(os.path.dirname(text_file) or '.', exist_ok=True)
+        with open(text_file, 'w', encoding='utf-8') as f:
+            f.write("".join(parts))
+
+    return {
+        "slides": num_created,
+        "first_slide_s": timings["first_slide_s"],
+        "total_s": time.perf_counter() - start,
+    }
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Genera una presentación con IA y la guarda como PowerPoint")
+    parser.add_argument("topic", help="Tema de la presentación")
+    parser.add_argument("output", help="Archivo .pptx de salida")
+    parser.add_argument("--slides", type=int, default=5, help="Número de diapositivas")
+    parser.add_argument("--style", default="professional",
+                        help="Estilo del contenido (professional, casual, academic, creative)")
+    parser.add_argument("--theme", default="modern_blue", choices=available_themes(),
+                        help="Tema de colores")
+    parser.add_argument("--provider", default="auto", choices=["auto", "gemini", "claude"])
+    parser.add_argument("--no-stream", action="store_true",
+                        help="Esperar la respuesta completa antes de construir el PPTX")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Pedir una respuesta nueva aunque el tema esté en la caché")
+    parser.add_argument("--no-cache", action="store_true", help="No usar la caché de respuestas")
+    parser.add_argument("--save-text", metavar="FILE", help="Guardar también el texto generado")
+    args = parser.parse_args(argv)
+
+    ai = ClaudeIntegration(provider=args.provider, cache=None if args.no_cache else ResponseCache())
+    stats = generate_presentation(
+        ai, args.topic, args.output,
+        num_slides=args.slides,
+        style=args.style,
+        theme=args.theme,
+        stream=not args.no_stream,
+        refresh=args.refresh,
+        text_file=args.save_text,
+        on_slide=lambda number, slide: print(f"   📄 {number}. {slide['title']}")
+    )
+
+    if stats["first_slide_s"] is not None:
+        print(f"⏱️  Primera diapositiva: {stats['first_slide_s']:.2f} s")
+    print(f"✅ {stats['slides']} diapositivas en {stats['total_s']:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# scripts/image_encoding.py
+"""
+Codificación de las páginas rasterizadas antes de insertarlas en el PPTX
+
+Las diapositivas de beamer son casi siempre colores planos y texto, así que
+un PNG a color sin pérdida desperdicia mucho espacio. Modos disponibles:
+
+    png            PNG a color sin pérdida (comportamiento original)
+    png-palette    PNG cuantizado a una paleta de hasta 256 colores
+    png-optimized  PNG sin pérdida con nivel de compresión configurable
+    jpeg           JPEG con la calidad indicada
+    auto           Elige por página según su número de colores
+"""
+import io
+
+from PIL import Image
+
+
+ENCODINGS = ("png", "png-palette", "png-optimized", "jpeg", "auto")
+
+# En modo auto: con hasta este número de colores la página se guarda como
+# PNG con paleta (texto antialiasado sobre fondos planos); con más, se
+# considera una imagen fotográfica y se usa JPEG
+AUTO_PALETTE_MAX_COLORS = 4096
+
+# Calidades JPEG que se prueban, en orden, para alcanzar el tamaño objetivo
+TARGET_QUALITY_STEPS = (85, 75, 65, 50, 35)
+
+
+class PageEncoder:
+    """Codifica imágenes PIL en memoria según el modo configurado"""
+
+    def __init__(self, mode="png", compress_level=9, quality=85, target_bytes=None):
+        """
+        Inicializa el codificador
+
+        Args:
+            mode: Uno de ENCODINGS
+            compress_level: Nivel de compresión zlib (0-9) de png-optimized
+            quality: Calidad JPEG (1-95)
+            target_bytes: Tamaño máximo por diapositiva; si una página lo
+                supera se recodifica como JPEG con calidad decreciente
+                (None = sin límite)
+        """
+        if mode not in ENCODINGS:
+            raise ValueError(
+                f"Codificación desconocida: {mode}. Disponibles: {', '.join(ENCODINGS)}"
+            )
+        if not 0 <= compress_level <= 9:
+            raise ValueError(f"Nivel de compresión inválido: {compress_level} (0-9)")
+        if not 1 <= quality <= 95:
+            raise ValueError(f"Calidad JPEG inválida: {quality} (1-95)")
+        self.mode = mode
+        self.compress_level = compress_level
+        self.quality = quality
+        self.target_bytes = target_bytes
+
+    def encode(self, img):
+        """
+        Codifica una página
+
+        Args:
+            img: Imagen PIL
+
+        Returns:
+            tuple: (BytesIO posicionado al inicio, modo usado)
+        """
+        mode = self._choose_mode(img) if self.mode == "auto" else self.mode
+        stream = self._encode_as(img, mode, self.quality)
+
+        if self.target_bytes and stream.getbuffer().nbytes > self.target_bytes:
+            stream, mode = self._fit_target(img, stream, mode)
+
+        stream.seek(0)
+        return stream, mode
+
+    def _encode_as(self, img, mode, quality):
+        stream = io.BytesIO()
+        if mode == "png":
+            img.save(stream, "PNG")
+        elif mode == "png-palette":
+            palette_img = img if img.mode == "P" else img.convert("RGB").quantize(
+                colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE
+            )
+            palette_img.save(stream, "PNG", optimize=True)
+        elif mode == "png-optimized":
+            img.save(stream, "PNG", optimize=True, compress_level=self.compress_level)
+        else:
+            img.convert("RGB").save(stream, "JPEG", quality=quality, optimize=True)
+        return stream
+
+    @staticmethod
+    def _choose_mode(img):
+        """Modo para una página según su número de colores"""
+        if img.getcolors(maxcolors=AUTO_PALETTE_MAX_COLORS) is not None:
+            return "png-palette"
+        return "jpeg"
+
+    def _fit_target(self, img, stream, mode):
+        """Recodifica como JPEG hasta caber en target_bytes (o el más pequeño)"""
+        best, best_mode = stream, mode
+        for quality in TARGET_QUALITY_STEPS:
+            if mode == "jpeg" and quality >= self.quality:
+                continue
+            candidate = self._encode_as(img, "jpeg", quality)
+            if candidate.getbuffer().nbytes < best.getbuffer().nbytes:
+                best, best_mode = candidate, "jpeg"
+            if candidate.getbuffer().nbytes <= self.target_bytes:
+                break
+        return best, best_mode
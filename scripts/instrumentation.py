@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# scripts/instrumentation.py
+"""
+Medición por etapas de las conversiones (parseo, construcción, guardado...)
+
+Los convertidores reciben un observador y le notifican el inicio y el fin
+de cada etapa con su duración y contadores. El observador por defecto no
+hace nada y los convertidores lo detectan para no medir nada, así que el
+costo sin perfilado es prácticamente nulo.
+
+Uso:
+    recorder = ProfileRecorder()
+    TextToPptxConverter(observer=recorder).convert("in.txt", "out.pptx")
+    recorder.save("profile.json")
+"""
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """Pico de memoria residente del proceso actual en MB (None si no se puede medir)"""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux lo reporta en KB, macOS en bytes
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    except (ImportError, AttributeError):
+        return None
+
+
+class ConversionObserver:
+    """Interfaz de observador de etapas; esta implementación no hace nada"""
+
+    def stage_start(self, stage, **info):
+        """
+        Se llama al empezar una etapa
+
+        Args:
+            stage: Nombre de la etapa ("parse", "build", "save", ...)
+            **info: Datos adicionales de la etapa
+        """
+
+    def stage_end(self, stage, duration, **counts):
+        """
+        Se llama al terminar una etapa
+
+        Args:
+            stage: Nombre de la etapa
+            duration: Duración en segundos
+            **counts: Contadores de la etapa (slides, pages, bytes, ...)
+        """
+
+
+# Observador por defecto (no hace nada)
+NULL_OBSERVER = ConversionObserver()
+
+
+class ProfileRecorder(ConversionObserver):
+    """Observador que guarda los eventos para exportarlos como JSON"""
+
+    def __init__(self):
+        self.events = []
+        self._origin = time.perf_counter()
+
+    def stage_start(self, stage, **info):
+        self.events.append({
+            "event": "start",
+            "stage": stage,
+            "time": time.perf_counter() - self._origin,
+            **info
+        })
+
+    def stage_end(self, stage, duration, **counts):
+        self.events.append({
+            "event": "end",
+            "stage": stage,
+            "time": time.perf_counter() - self._origin,
+            "duration": duration,
+            **counts
+        })
+
+    def summary(self):
+        """Duración total por etapa, en segundos"""
+        totals = {}
+        for event in self.events:
+            if event["event"] == "end":
+                totals[event["stage"]] = totals.get(event["stage"], 0.0) + event["duration"]
+        return totals
+
+    def to_dict(self):
+        return {"events": self.events, "summary": self.summary()}
+
+    def save(self, path):
+        """Guarda los eventos y el resumen en un archivo JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+
+@contextmanager
+def stage(observer, name, **info):
+    """
+    Mide una etapa completa
+
+    Produce un dict donde el bloque puede anotar contadores que se envían
+    con el evento de fin.
+
+    Ejemplo:
+        with stage(observer, "save") as counts:
+            prs.save(path)
+            counts["slides"] = len(prs.slides)
+    """
+    counts = {}
+    if observer is NULL_OBSERVER:
+        yield counts
+        return
+
+    observer.stage_start(name, **info)
+    start = time.perf_counter()
+    try:
+        yield counts
+    finally:
+        observer.stage_end(name, time.perf_counter() - start, **counts)
+
+
+class StageTimer:
+    """
+    Acumula el tiempo de una etapa que ocurre intercalada con otras
+
+    Por ejemplo, la codificación de cada página ocurre dentro del bucle que
+    construye las diapositivas. Se inicia con start(), cada tramo se mide con
+    `with timer:` y el evento de fin se envía con finish().
+    """
+
+    def __init__(self, observer, name):
+        self.observer = observer
+        self.name = name
+        self.elapsed = 0.0
+        self.items = 0
+        self._start = None
+
+    def start(self, **info):
+        self.observer.stage_start(self.name, **info)
+        return self
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed += time.perf_counter() - self._start
+        return False
+
+    def finish(self, exclude=None, **counts):
+        """
+        Envía el evento de fin con el tiempo acumulado
+
+        Args:
+            exclude: Otro StageTimer (o una tupla de ellos) cuyo tiempo está
+                incluido en este y debe descontarse (etapas anidadas)
+            **counts: Contadores de la etapa
+        """
+        if isinstance(exclude, StageTimer):
+            exclude = (exclude,)
+        duration = self.elapsed - sum(timer.elapsed for timer in exclude or ())
+        self.observer.stage_end(self.name, duration, **counts)
+
+
+def timed_iter(timer, iterable):
+    """
+    Itera sobre `iterable` acumulando en `timer` el tiempo de producir cada elemento
+
+    Útil para medir etapas en streaming (p.ej. el parseo línea a línea).
+    """
+    iterator = iter(iterable)
+    while True:
+        with timer:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        timer.items += 1
+        yield item
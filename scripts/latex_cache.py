@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# scripts/latex_cache.py
+"""
+Caché en disco de los PDF compilados a partir de archivos LaTeX
+
+La clave de cada entrada es un hash del código fuente .tex, de sus
+dependencias (\\input, \\include, \\includegraphics...) y del motor de LaTeX
+con su versión, así que un acierto permite saltarse pdflatex por completo.
+El tamaño total está limitado y se expulsan primero las entradas usadas
+hace más tiempo (LRU).
+
+Uso:
+    python scripts/latex_cache.py stats
+    python scripts/latex_cache.py clear
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# Carpeta por defecto (se puede cambiar con la variable de entorno PPTX_LATEX_CACHE)
+DEFAULT_CACHE_DIR = os.environ.get(
+    "PPTX_LATEX_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "rpa-pptx", "latex")
+)
+
+# Tamaño máximo por defecto de la caché
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Comandos que incluyen otros archivos y extensiones con las que se buscan
+_DEPENDENCY_PATTERN = re.compile(
+    r"\\(input|include|includegraphics|includepdf|bibliography|addbibresource)"
+    r"\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}"
+)
+_DEPENDENCY_EXTENSIONS = {
+    "input": ("", ".tex"),
+    "include": (".tex",),
+    "includegraphics": ("", ".pdf", ".png", ".jpg", ".jpeg", ".eps"),
+    "includepdf": ("", ".pdf"),
+    "bibliography": (".bib",),
+    "addbibresource": ("",),
+}
+_COMMENT = re.compile(r"(?<!\\)%.*")
+
+
+@contextmanager
+def _file_lock(path):
+    """Bloqueo exclusivo entre procesos sobre un archivo de bloqueo"""
+    with open(path, "a+b") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@lru_cache(maxsize=None)
+def engine_version(engine):
+    """Primera línea de `engine --version` ("desconocida" si no está instalado)"""
+    try:
+        result = subprocess.run([engine, "--version"], capture_output=True, text=True, timeout=10)
+        return result.stdout.splitlines()[0] if result.stdout else "desconocida"
+    except (OSError, subprocess.TimeoutExpired):
+        return "desconocida"
+
+
+def find_dependencies(tex_file):
+    """
+    Busca recursivamente los archivos de los que depende un .tex
+
+    Args:
+        tex_file: Ruta del archivo .tex principal
+
+    Returns:
+        list: Tuplas (nombre tal como aparece, ruta encontrada o None),
+            en orden de aparición y sin repetir
+    """
+    base_dir = os.path.dirname(os.path.abspath(tex_file))
+    found = []
+    seen = set()
+    pending = [tex_file]
+
+    while pending:
+        current = pending.pop(0)
+        with open(current, "r", encoding="utf-8", errors="replace") as f:
+            source = _COMMENT.sub("", f.read())
+
+        for command, names in _DEPENDENCY_PATTERN.findall(source):
+            for name in names.split(","):
+                name = name.strip()
+                if not name or (command, name) in seen:
+                    continue
+                seen.add((command, name))
+
+                path = None
+                for extension in _DEPENDENCY_EXTENSIONS[command]:
+                    candidate = os.path.join(base_dir, name + extension)
+                    if os.path.isfile(candidate):
+                        path = candidate
+                        break
+                found.append((name, path))
+
+                if path and command in ("input", "include"):
+                    pending.append(path)
+    return found
+
+
+class LatexCache:
+    """Caché LRU de PDF compilados, limitada en tamaño"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Inicializa la caché
+
+        Args:
+            cache_dir: Carpeta donde se guardan los PDF
+            max_bytes: Tamaño máximo total de los PDF guardados
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def key(self, tex_file, engine="pdflatex"):
+        """
+        Calcula la clave de un archivo .tex
+
+        Args:
+            tex_file: Ruta del archivo .tex
+            engine: Motor de LaTeX con el que se compila
+
+        Returns:
+            str: Hash SHA-256 en hexadecimal
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{engine}\n{engine_version(engine)}\n".encode("utf-8"))
+        with open(tex_file, "rb") as f:
+            digest.update(f.read())
+
+        for name, path in find_dependencies(tex_file):
+            digest.update(f"\n{name}\n".encode("utf-8"))
+            if path is None:
+                digest.update(b"<no encontrado>")
+                continue
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Busca un PDF en la caché y lo marca como usado recientemente
+
+        Returns:
+            str: Ruta del PDF en la caché, o None si no está
+        """
+        pdf_file = self._pdf_path(key)
+        with self._lock:
+            try:
+                os.utime(pdf_file)
+            except FileNotFoundError:
+                self._update_stats(misses=1)
+                return None
+            meta = self._read_meta(key)
+            self._update_stats(
+                hits=1,
+                bytes_saved=os.path.getsize(pdf_file),
+                seconds_saved=meta.get("compile_s", 0.0)
+            )
+        return pdf_file
+
+    def put(self, key, pdf_file, compile_s=0.0):
+        """
+        Guarda una copia de un PDF compilado
+
+        Args:
+            key: Clave calculada con key()
+            pdf_file: PDF recién compilado (no se modifica)
+            compile_s: Segundos que tardó la compilación
+
+        Returns:
+            str: Ruta del PDF dentro de la caché
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        target = self._pdf_path(key)
+
+        # Copia atómica: otro proceso nunca ve un PDF a medio escribir
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(pdf_file, tmp_path)
+        os.replace(tmp_path, target)
+
+        with self._lock:
+            with open(self._meta_path(key), "w", encoding="utf-8") as f:
+                json.dump({"compile_s": compile_s, "size": os.path.getsize(target)}, f)
+            self._evict()
+        return target
+
+    def stats(self):
+        """
+        Estadísticas de uso
+
+        Returns:
+            dict: "hits", "misses", "hit_rate", "bytes_saved", "seconds_saved",
+                "entries", "total_bytes" y "max_bytes"
+        """
+        stats = self._read_stats()
+        lookups = stats["hits"] + stats["misses"]
+        entries = self._entries()
+        return {
+            **stats,
+            "hit_rate": stats["hits"] / lookups if lookups else 0.0,
+            "entries": len(entries),
+            "total_bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self):
+        """Elimina todas las entradas y las estadísticas"""
+        with self._lock:
+            if os.path.isdir(self.cache_dir):
+                shutil.rmtree(self.cache_dir)
+
+    def _pdf_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def _meta_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_meta(self, key):
+        try:
+            with open(self._meta_path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _entries(self):
+        """Lista de (ruta, tamaño, último uso) de los PDF guardados"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".pdf"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                info = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, info.st_size, info.st_mtime))
+        return entries
+
+    def _evict(self):
+        """Elimina las entradas usadas hace más tiempo hasta respetar max_bytes"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            for victim in (path, path[:-len(".pdf")] + ".json"):
+                try:
+                    os.remove(victim)
+                except FileNotFoundError:
+                    pass
+            total -= size
+
+    def _stats_path(self):
+        return os.path.join(self.cache_dir, "stats.json")
+
+    def _read_stats(self):
+        stats = {"hits": 0, "misses": 0, "bytes_saved": 0, "seconds_saved": 0.0}
+        try:
+            with open(self._stats_path(), "r", encoding="utf-8") as f:
+                stats.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        return stats
+
+    def _update_stats(self, **increments):
+        """
+        Suma los incrementos a stats.json
+
+        La lectura y la escritura ocurren con el bloqueo de archivo tomado,
+        así que varios procesos que usan la misma caché no pierden
+        incrementos; el reemplazo atómico evita que un lector vea el
+        archivo a medio escribir.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with _file_lock(self._stats_path() + ".lock"):
+            stats = self._read_stats()
+            for name, value in increments.items():
+                stats[name] += value
+            tmp_path = self._stats_path() + f".{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(stats, f)
+            os.replace(tmp_path, self._stats_path())
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Administra la caché de compilación de LaTeX")
+    parser.add_argument("command", choices=["stats", "clear"])
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Carpeta de la caché")
+    args = parser.parse_args(argv)
+
+    cache = LatexCache(args.cache_dir)
+    if args.command == "clear":
+        cache.clear()
+        print(f"🧹 Caché eliminada: {args.cache_dir}")
+        return 0
+
+    stats = cache.stats()
+    print(f"📁 Caché: {args.cache_dir}")
+    print(f"   Entradas: {stats['entries']} "
+          f"({stats['total_bytes'] / 1024 / 1024:.1f} / {stats['max_bytes'] / 1024 / 1024:.0f} MB)")
+    print(f"   Aciertos: {stats['hits']}  Fallos: {stats['misses']}  "
+          f"Tasa de acierto: {stats['hit_rate']:.0%}")
+    print(f"   Ahorrado: {stats['bytes_saved'] / 1024 / 1024:.1f} MB de PDF, "
+          f"{stats['seconds_saved']:.1f} s de compilación")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
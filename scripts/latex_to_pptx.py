@@ -3,61 +3,448 @@
 """
 Convierte archivos LaTeX/PDF en presentaciones PowerPoint
 """
+import argparse
+import copy
 import sys
+import io
 import os
+import re
+import shutil
 import subprocess
-from pdf2image import convert_from_path
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pdf2image import convert_from_path, pdfinfo_from_path
 from pptx import Presentation
-from pptx.util import Inches
+from pptx.util import Emu, Inches
+
+try:
+    from scripts.beamer_parser import BeamerParseError, parse_beamer
+    from scripts.image_encoding import ENCODINGS, PageEncoder
+    from scripts.latex_cache import LatexCache
+    from scripts.output_paths import output_paths
+    from scripts.text_to_pptx import TextToPptxConverter
+    from scripts.instrumentation import (
+        NULL_OBSERVER, ProfileRecorder, StageTimer, peak_rss_mb, stage, timed_iter
+    )
+except ImportError:  # ejecutado directamente como script
+    from beamer_parser import BeamerParseError, parse_beamer
+    from image_encoding import ENCODINGS, PageEncoder
+    from latex_cache import LatexCache
+    from output_paths import output_paths
+    from text_to_pptx import TextToPptxConverter
+    from instrumentation import NULL_OBSERVER, ProfileRecorder, StageTimer, peak_rss_mb, stage, timed_iter
+
+
+# Motor con el que se compilan los .tex
+LATEX_ENGINE = "pdflatex"
+
+# Tiempo máximo de compilación: base más un margen por página estimada
+COMPILE_TIMEOUT_BASE = 30
+COMPILE_TIMEOUT_PER_PAGE = 2
+
+# Ancho de las diapositivas cuando su tamaño se ajusta al del PDF
+SLIDE_WIDTH = Inches(10)
+
+# Páginas mínimas por bloque al rasterizar en paralelo: cada bloque lanza su
+# propio proceso de poppler, que vuelve a abrir el PDF
+MIN_CHUNK_PAGES = 4
+
+# Páginas decodificadas a la vez por defecto: un valor fijo para que el pico
+# de memoria no crezca con el número de CPUs (se puede subir con `window`)
+DEFAULT_WINDOW_PAGES = 16
+
+
+def page_chunks(page_count, workers, min_chunk=MIN_CHUNK_PAGES, first_page=1):
+    """
+    Divide un rango de páginas en bloques contiguos, uno por trabajador
+    
+    Args:
+        page_count: Número de páginas del rango
+        workers: Número máximo de bloques
+        min_chunk: Páginas mínimas por bloque
+        first_page: Primera página del rango (numeradas desde 1)
+        
+    Returns:
+        list: Tuplas (primera, última) con páginas numeradas desde 1
+    """
+    chunks_count = max(1, min(workers, page_count // min_chunk))
+    size, extra = divmod(page_count, chunks_count)
+    chunks = []
+    first = first_page
+    for i in range(chunks_count):
+        last = first + size - 1 + (1 if i < extra else 0)
+        chunks.append((first, last))
+        first = last + 1
+    return chunks
+
+
+def parse_page_ranges(spec):
+    """
+    Interpreta una selección de páginas como "1-3, 7, 40-55" o "40-"
+    
+    Args:
+        spec: Texto con rangos separados por comas; "N-" llega hasta el final
+        
+    Returns:
+        list: Tuplas (primera, última) con páginas numeradas desde 1
+            (última es None en los rangos abiertos)
+    """
+    ranges = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        match = re.fullmatch(r"(\d+)\s*(?:(-)\s*(\d*))?", part)
+        if not match:
+            raise ValueError(f"Rango de páginas inválido: {part!r} (use p.ej. 1-3,7,40-55)")
+        first = int(match.group(1))
+        if match.group(2) is None:
+            last = first
+        else:
+            last = int(match.group(3)) if match.group(3) else None
+        ranges.append((first, last))
+    if not ranges:
+        raise ValueError("La selección de páginas está vacía")
+    return ranges
+
+
+def resolve_page_ranges(ranges, page_count):
+    """
+    Valida una lista de rangos contra el número de páginas del PDF
+    
+    Los rangos se ordenan y los que se solapan o son contiguos se unen, así
+    que cada página se rasteriza una sola vez y en el orden del PDF.
+    
+    Args:
+        ranges: Tuplas (primera, última) o None para todas las páginas
+        page_count: Número de páginas del PDF
+        
+    Returns:
+        list: Tuplas (primera, última) ordenadas y sin solapamientos
+    """
+    if ranges is None:
+        return [(1, page_count)] if page_count else []
+    
+    resolved = []
+    for first, last in sorted((first, page_count if last is None else last)
+                              for first, last in ranges):
+        if first < 1 or last < first:
+            raise ValueError(f"Rango de páginas inválido: {first}-{last}")
+        if last > page_count:
+            raise ValueError(f"El rango {first}-{last} excede las {page_count} páginas del PDF")
+        if resolved and first <= resolved[-1][1] + 1:
+            resolved[-1] = (resolved[-1][0], max(resolved[-1][1], last))
+        else:
+            resolved.append((first, last))
+    return resolved
+
+
+def estimate_pages(tex_file):
+    """
+    Estima el número de páginas de un .tex sin compilarlo
+    
+    Cuenta los frames de beamer; en otros documentos, una página por cada
+    3000 caracteres de código fuente.
+    """
+    with open(tex_file, 'r', encoding='utf-8', errors='replace') as f:
+        source = f.read()
+    frames = len(re.findall(r"\\begin\s*\{frame\}", source))
+    return frames or max(1, len(source) // 3000)
+
+
+def _parse_size(value):
+    """(ancho, alto) en puntos de un valor "595 x 842 pts", o None"""
+    match = re.match(r"\s*([\d.]+) x ([\d.]+)", str(value))
+    if not match:
+        return None
+    return float(match.group(1)), float(match.group(2))
+
+
+def page_sizes_pts(info):
+    """
+    Tamaño de cada página de un PDF según pdfinfo
+    
+    pdfinfo solo informa el tamaño de cada página ("Page N size") cuando se
+    le pide un rango con first_page/last_page; si no, da solo el de la
+    primera ("Page size").
+    
+    Args:
+        info: Resultado de pdfinfo_from_path
+        
+    Returns:
+        dict: Número de página -> (ancho, alto) en puntos
+    """
+    sizes = {}
+    for key, value in info.items():
+        match = re.fullmatch(r"Page\s+(\d+) size", key)
+        size = _parse_size(value) if match else None
+        if size:
+            sizes[int(match.group(1))] = size
+    if not sizes:
+        size = _parse_size(info.get("Page size", ""))
+        if size:
+            sizes[1] = size
+    return sizes
+
+
+def page_size_pts(info):
+    """
+    Tamaño de página predominante de un PDF según pdfinfo
+    
+    Args:
+        info: Resultado de pdfinfo_from_path
+        
+    Returns:
+        tuple: (ancho, alto) en puntos del tamaño más repetido (a igualdad,
+            el que aparece primero), o None si no se conoce
+    """
+    sizes = page_sizes_pts(info)
+    if not sizes:
+        return None
+    return Counter(sizes[page] for page in sorted(sizes)).most_common(1)[0][0]
 
 
 class LatexToPptxConverter:
     """Clase para convertir archivos LaTeX/PDF a PowerPoint"""
     
-    def __init__(self, dpi=150):
+    def __init__(self, dpi=150, observer=None, workers=None, window=None, encoding="png",
+                 jpeg_quality=85, compress_level=9, target_slide_kb=None, latex_cache=None,
+                 native_beamer=False, theme="modern_blue",
+                 target_resolution=None, compile_timeout=None, scratch_root=None):
         """
         Inicializa el convertidor
         
         Args:
             dpi: Resolución para convertir PDF a imágenes
+            observer: ConversionObserver que recibe la duración de cada etapa
+                ("compile", "rasterize", "encode", "build", "save"); ver
+                scripts/instrumentation.py
+            workers: Procesos de poppler que rasterizan bloques de páginas en
+                paralelo (None = uno por CPU, 1 = sin paralelismo)
+            window: Páginas que se rasterizan a la vez; el pico de memoria
+                depende de este valor y no del número de páginas ni de
+                trabajadores; una ventana más grande reparte más bloques en
+                paralelo (None = DEFAULT_WINDOW_PAGES)
+            encoding: Codificación de cada página ("png", "png-palette",
+                "png-optimized", "jpeg" o "auto"); ver scripts/image_encoding.py
+            jpeg_quality: Calidad JPEG (1-95)
+            compress_level: Nivel de compresión de "png-optimized" (0-9)
+            target_slide_kb: Tamaño máximo por diapositiva en KB; las páginas
+                que lo superan se recodifican como JPEG (None = sin límite)
+            latex_cache: LatexCache para reutilizar los PDF ya compilados
+                (None = compilar siempre); ver scripts/latex_cache.py
+            native_beamer: Convertir los .tex beamer sencillos directamente a
+                diapositivas editables, sin pdflatex ni rasterizado; si el
+                documento usa algo que el parser no entiende se usa la ruta
+                normal (ver scripts/beamer_parser.py)
+            theme: Tema de TextToPptxConverter para la conversión nativa
+            target_resolution: (ancho, alto) en píxeles de la pantalla de
+                destino; cada página se rasteriza a exactamente el tamaño
+                que ocupa en ella (en lugar de a `dpi`) y las diapositivas
+                toman la proporción del PDF (None = usar dpi y 10"x7.5")
+            compile_timeout: Tiempo máximo en segundos de cada compilación
+                (None = COMPILE_TIMEOUT_BASE más COMPILE_TIMEOUT_PER_PAGE por
+                página estimada)
+            scratch_root: Carpeta donde se crean los directorios de trabajo
+                de cada compilación (None = carpeta temporal del sistema)
         """
         self.dpi = dpi
+        self.observer = observer or NULL_OBSERVER
+        self.workers = workers or os.cpu_count() or 1
+        self.window = window or DEFAULT_WINDOW_PAGES
+        self.encoder = PageEncoder(
+            encoding,
+            compress_level=compress_level,
+            quality=jpeg_quality,
+            target_bytes=target_slide_kb * 1024 if target_slide_kb else None
+        )
+        self.latex_cache = latex_cache
+        self.native_beamer = native_beamer
+        self.theme = theme
+        self.target_resolution = target_resolution
+        self.compile_timeout = compile_timeout
+        self.scratch_root = scratch_root
     
-    def convert(self, input_file, output_file):
+    def convert(self, input_file, output_file, pages=None, progress=None):
         """
         Convierte un archivo LaTeX o PDF a PowerPoint
         
         Args:
             input_file: Ruta del archivo LaTeX (.tex) o PDF (.pdf)
             output_file: Ruta del archivo PPTX de salida
+            pages: Rangos (primera, última) de páginas del PDF a convertir,
+                numeradas desde 1 (última None = hasta el final); solo se
+                rasterizan esas páginas (None = todas)
+            progress: Función progress(hechas, total, segundos) que se llama
+                después de agregar cada página
         """
         if not os.path.exists(input_file):
             raise FileNotFoundError(f"Archivo no encontrado: {input_file}")
         
-        # Si es un archivo LaTeX, primero compilarlo a PDF
+        # Beamer sencillo: diapositivas editables sin compilar. Los rangos
+        # se refieren a páginas del PDF, así que con rangos se compila
+        if self.native_beamer and pages is None and input_file.endswith('.tex'):
+            if self._convert_beamer(input_file, output_file, progress):
+                return
+        
+        # Si es un archivo LaTeX, primero compilarlo a PDF (o tomarlo de la caché)
+        compiled = False
         if input_file.endswith('.tex'):
-            pdf_file = self._compile_latex(input_file)
+            with stage(self.observer, "compile") as counts:
+                pdf_file, compiled = self._get_pdf(input_file)
+                counts["cached"] = not compiled
         elif input_file.endswith('.pdf'):
             pdf_file = input_file
         else:
             raise ValueError(f"Formato no soportado: {input_file}. Use .tex o .pdf")
         
         # Convertir PDF a PPTX
-        self._pdf_to_pptx(pdf_file, output_file)
+        try:
+            self._pdf_to_pptx(pdf_file, output_file, pages=pages, progress=progress)
+        finally:
+            # Limpiar el directorio de trabajo si se compiló desde LaTeX,
+            # también si el rasterizado falla (los PDF de la caché se conservan)
+            if compiled:
+                shutil.rmtree(os.path.dirname(pdf_file), ignore_errors=True)
+    
+    def convert_many(self, input_files, output_dir, jobs=None, pages=None):
+        """
+        Convierte varios archivos LaTeX/PDF en paralelo
+        
+        Cada compilación ocurre en su propio directorio de trabajo, así que
+        varios documentos de la misma carpeta pueden compilarse a la vez.
+        Los errores de cada archivo se recogen en lugar de abortar el lote;
+        las entradas que generarían el mismo .pptx (a/x.tex y b/x.tex, o
+        x.tex y x.pdf) se reportan como errores sin convertirlas.
         
-        # Limpiar archivo PDF temporal si se compiló desde LaTeX
-        if input_file.endswith('.tex') and pdf_file != input_file:
-            try:
-                os.remove(pdf_file)
-            except:
-                pass
+        Args:
+            input_files: Rutas de los archivos .tex o .pdf
+            output_dir: Directorio donde se guardan los .pptx
+            jobs: Conversiones simultáneas (None = número de CPUs)
+            pages: Rangos de páginas a convertir de cada archivo (ver convert)
+            
+        Returns:
+            dict: "converted" (lista de {"input", "output"}) y "errors"
+                (lista de {"input", "error"}), ordenados por entrada
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        converted = []
+        pending, errors = output_paths(input_files, output_dir)
+        cpus = os.cpu_count() or 1
+        jobs = jobs or cpus
+        
+        # Cada conversión lanza hasta `workers` procesos de poppler: se
+        # reparten las CPUs entre las conversiones simultáneas en lugar de
+        # lanzar jobs * cpus procesos
+        converter = copy.copy(self)
+        converter.workers = min(self.workers, max(1, cpus // jobs))
+        
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {}
+            for input_file, output_file in pending:
+                futures[executor.submit(converter.convert, input_file, output_file, pages)] = (input_file, output_file)
+            
+            for future in as_completed(futures):
+                input_file, output_file = futures[future]
+                try:
+                    future.result()
+                    converted.append({"input": input_file, "output": output_file})
+                except Exception as e:
+                    errors.append({"input": input_file, "error": f"{type(e).__name__}: {e}"})
+        
+        converted.sort(key=lambda item: item["input"])
+        errors.sort(key=lambda item: item["input"])
+        return {"converted": converted, "errors": errors}
+    
+    def _convert_beamer(self, tex_file, output_file, progress=None):
+        """
+        Convierte un .tex beamer con el parser nativo y TextToPptxConverter
+        
+        Args:
+            tex_file: Ruta del archivo .tex
+            output_file: Ruta del archivo PPTX de salida
+            progress: Función progress(hechas, total, segundos); se llama
+                una vez al terminar
+            
+        Returns:
+            bool: False si el documento no es compatible y hay que rasterizar
+        """
+        start = time.perf_counter()
+        with open(tex_file, 'r', encoding='utf-8') as f:
+            source = f.read()
+        
+        try:
+            with stage(self.observer, "parse") as counts:
+                structure = parse_beamer(source)
+                counts["slides"] = len(structure)
+        except BeamerParseError as e:
+            print(f"Conversión nativa no disponible ({e}); se usará pdflatex")
+            return False
+        
+        converter = TextToPptxConverter(theme=self.theme, auto_paginate=True, fast_bullets=True,
+                                        observer=self.observer)
+        converter.write_slides(structure, output_file)
+        if progress is not None:
+            progress(len(structure), len(structure), time.perf_counter() - start)
+        return True
+    
+    def _get_pdf(self, tex_file):
+        """
+        Obtiene el PDF de un archivo LaTeX, desde la caché si está disponible
+        
+        Args:
+            tex_file: Ruta del archivo .tex
+            
+        Returns:
+            tuple: (ruta del PDF, True si se compiló ahora en un directorio
+                de trabajo temporal)
+        """
+        if self.latex_cache is None:
+            return self._compile(tex_file), True
+        
+        key = self.latex_cache.key(tex_file, LATEX_ENGINE)
+        cached_pdf = self.latex_cache.get(key)
+        if cached_pdf:
+            return cached_pdf, False
+        
+        start = time.perf_counter()
+        pdf_file = self._compile(tex_file)
+        self.latex_cache.put(key, pdf_file, compile_s=time.perf_counter() - start)
+        return pdf_file, True
     
-    def _compile_latex(self, tex_file):
+    def _compile(self, tex_file):
+        """
+        Compila un .tex en un directorio de trabajo propio
+        
+        Los archivos auxiliares (.aux, .log, .nav...) y el PDF quedan en un
+        directorio temporal que el llamador elimina, no junto al .tex.
+        
+        Args:
+            tex_file: Ruta del archivo .tex
+            
+        Returns:
+            str: Ruta del archivo PDF generado (dentro del directorio de trabajo)
+        """
+        scratch_dir = tempfile.mkdtemp(prefix="latex_", dir=self.scratch_root)
+        timeout = self.compile_timeout or (
+            COMPILE_TIMEOUT_BASE + COMPILE_TIMEOUT_PER_PAGE * estimate_pages(tex_file)
+        )
+        try:
+            return self._compile_latex(tex_file, scratch_dir, timeout=timeout)
+        except Exception:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+            raise
+    
+    def _compile_latex(self, tex_file, output_dir=None, timeout=COMPILE_TIMEOUT_BASE):
         """
         Compila un archivo LaTeX a PDF
         
         Args:
             tex_file: Ruta del archivo .tex
+            output_dir: Carpeta para el PDF y los auxiliares (None = la del .tex)
+            timeout: Tiempo máximo en segundos
             
         Returns:
             str: Ruta del archivo PDF generado
@@ -65,15 +452,19 @@ class LatexToPptxConverter:
         # Obtener el directorio y nombre base del archivo
         tex_dir = os.path.dirname(tex_file) or '.'
         tex_basename = os.path.splitext(os.path.basename(tex_file))[0]
-        pdf_file = os.path.join(tex_dir, f"{tex_basename}.pdf")
+        output_dir = os.path.abspath(output_dir or tex_dir)
+        pdf_file = os.path.join(output_dir, f"{tex_basename}.pdf")
         
         try:
-            # Intentar compilar con pdflatex
+            # Intentar compilar con pdflatex desde la carpeta del .tex, para
+            # que \input e \includegraphics relativos se resuelvan igual
             result = subprocess.run(
-                ['pdflatex', '-interaction=nonstopmode', f'-output-directory={tex_dir}', tex_file],
+                [LATEX_ENGINE, '-interaction=nonstopmode', f'-output-directory={output_dir}',
+                 os.path.basename(tex_file)],
+                cwd=tex_dir,
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=timeout
             )
             
             if not os.path.exists(pdf_file):
@@ -87,55 +478,314 @@ class LatexToPptxConverter:
                 "Por favor, instala una distribución de LaTeX (MiKTeX, TeX Live, etc.)"
             )
         except subprocess.TimeoutExpired:
-            raise Exception("La compilación de LaTeX tardó demasiado tiempo")
+            raise Exception(f"La compilación de LaTeX tardó más de {timeout} s")
         except Exception as e:
             raise Exception(f"Error al compilar LaTeX: {str(e)}")
     
-    def _pdf_to_pptx(self, pdf_path, pptx_path):
+    def convert_pdf_bytes(self, pdf_bytes, pages=None, progress=None):
+        """
+        Convierte un PDF en memoria a PowerPoint en memoria
+        
+        Args:
+            pdf_bytes: Contenido del archivo PDF
+            pages: Rangos de páginas a convertir (ver convert)
+            progress: Función progress(hechas, total, segundos)
+            
+        Returns:
+            bytes: Contenido del archivo PPTX
+        """
+        buffer = io.BytesIO()
+        self.write_pdf_bytes(pdf_bytes, buffer, pages=pages, progress=progress)
+        return buffer.getvalue()
+    
+    def write_pdf_bytes(self, pdf_bytes, output, pages=None, progress=None):
+        """
+        Convierte un PDF en memoria y escribe el PPTX en un archivo binario
+        
+        El PDF se escribe una sola vez en un archivo temporal (poppler solo
+        lee archivos) que comparten pdfinfo y todos los bloques de páginas.
+        
+        Args:
+            pdf_bytes: Contenido del archivo PDF
+            output: Archivo binario abierto (cualquier objeto con write) o ruta
+                del archivo PPTX de salida
+            pages: Rangos de páginas a convertir (ver convert)
+            progress: Función progress(hechas, total, segundos)
+        """
+        # convert_from_bytes escribiría el PDF completo a disco en cada bloque
+        with tempfile.NamedTemporaryFile(suffix=".pdf", dir=self.scratch_root, delete=False) as f:
+            f.write(pdf_bytes)
+        try:
+            info = self._pdfinfo(f.name)
+            ranges = resolve_page_ranges(pages, info["Pages"])
+            images = self._iter_pages(f.name, convert_from_path, info, ranges)
+            self._pages_to_pptx(images, output, page_size=page_size_pts(info),
+                                total=sum(last - first + 1 for first, last in ranges),
+                                progress=progress)
+        finally:
+            os.remove(f.name)
+    
+    def iter_pdf_pages(self, pdf_path, pages=None):
+        """
+        Rasteriza bajo demanda las páginas de un PDF
+        
+        Las páginas se producen por ventanas (ver _iter_pages): solo se
+        decodifican las que se van pidiendo, así que dejar de iterar evita
+        rasterizar el resto. El llamador debe cerrar cada imagen.
+        
+        Args:
+            pdf_path: Ruta del archivo PDF
+            pages: Rangos de páginas a rasterizar (ver convert)
+            
+        Yields:
+            Image: Imagen PIL de cada página, en el orden del PDF
+        """
+        info = self._pdfinfo(pdf_path)
+        ranges = resolve_page_ranges(pages, info["Pages"])
+        yield from self._iter_pages(pdf_path, convert_from_path, info, ranges)
+    
+    def _pdf_to_pptx(self, pdf_path, pptx_path, pages=None, progress=None):
         """
         Convierte un PDF a PowerPoint
         
         Args:
             pdf_path: Ruta del archivo PDF
             pptx_path: Ruta del archivo PPTX de salida
+            pages: Rangos de páginas a convertir (ver convert)
+            progress: Función progress(hechas, total, segundos)
         """
         if not os.path.exists(pdf_path):
             raise FileNotFoundError(f"PDF no encontrado: {pdf_path}")
         
-        # Convertir páginas del PDF a imágenes
-        pages = convert_from_path(pdf_path, dpi=self.dpi)
+        # Convertir páginas del PDF a imágenes, por ventanas
+        info = self._pdfinfo(pdf_path)
+        ranges = resolve_page_ranges(pages, info["Pages"])
+        images = self._iter_pages(pdf_path, convert_from_path, info, ranges)
+        self._pages_to_pptx(images, pptx_path, page_size=page_size_pts(info),
+                            total=sum(last - first + 1 for first, last in ranges),
+                            progress=progress)
+    
+    def _pdfinfo(self, pdf_path):
+        """
+        pdfinfo del PDF; con target_resolution incluye el tamaño de cada página
+        
+        Cada página se escala según su propio tamaño, así que hace falta
+        pedírselo a pdfinfo con un rango (una segunda llamada).
+        """
+        info = pdfinfo_from_path(pdf_path)
+        if self.target_resolution and info["Pages"] > 1:
+            info = pdfinfo_from_path(pdf_path, first_page=1, last_page=info["Pages"])
+        return info
+    
+    def _render_options(self, page_size):
+        """
+        Opciones de resolución para pdf2image
+        
+        Con target_resolution, la página se escala para ocupar la pantalla
+        de destino sin deformarse: se fija el lado que limita y el otro
+        conserva la proporción de la página.
+        """
+        if not self.target_resolution or page_size is None:
+            return {"dpi": self.dpi}
+        
+        width_px, height_px = self.target_resolution
+        page_width, page_height = page_size
+        if page_width / page_height >= width_px / height_px:
+            return {"size": (width_px, None)}
+        return {"size": (None, height_px)}
+    
+    def _iter_pages(self, pdf, convert, info, ranges=None):
+        """
+        Rasteriza un PDF por ventanas de páginas y las produce en orden
+        
+        Solo hay una ventana (self.window páginas) decodificada a la vez: la
+        siguiente se rasteriza cuando la anterior ya se agregó a la
+        presentación. Dentro de cada ventana, cada bloque de páginas
+        contiguas lo procesa un proceso de poppler distinto (los hilos solo
+        esperan a su subproceso).
+        
+        Args:
+            pdf: Ruta del PDF
+            convert: convert_from_path (o una función con la misma firma)
+            info: Resultado de pdfinfo para el PDF
+            ranges: Rangos validados con resolve_page_ranges (None = todas
+                las páginas); las demás páginas nunca se rasterizan
+            
+        Yields:
+            Image: Imagen PIL de cada página
+        """
+        if ranges is None:
+            ranges = resolve_page_ranges(None, info["Pages"])
+        sizes = page_sizes_pts(info)
+        default_size = page_size_pts(info)
+        
+        def page_options(page):
+            return self._render_options(sizes.get(page, default_size))
+        
+        def render(first, last):
+            # Un convert por tramo de páginas con las mismas opciones: en un
+            # PDF con páginas de distinta proporción cada una se escala según
+            # la suya
+            pages = []
+            run_first = first
+            for page in range(first, last + 1):
+                options = page_options(page)
+                if page == last or page_options(page + 1) != options:
+                    pages.extend(convert(pdf, first_page=run_first, last_page=page, **options))
+                    run_first = page + 1
+            return pages
+        
+        windows = [
+            (first, min(first + self.window - 1, range_last))
+            for range_first, range_last in ranges
+            for first in range(range_first, range_last + 1, self.window)
+        ]
+        for first, last in windows:
+            chunks = page_chunks(last - first + 1, self.workers, first_page=first)
+            
+            if len(chunks) == 1:
+                window_pages = render(first, last)
+            else:
+                with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                    results = executor.map(lambda chunk: render(*chunk), chunks)
+                    window_pages = [page for chunk_pages in results for page in chunk_pages]
+            
+            # Entregar y soltar cada página para que la ventana se libere
+            window_pages.reverse()
+            while window_pages:
+                yield window_pages.pop()
+    
+    def _pages_to_pptx(self, pages, output, page_size=None, total=None, progress=None):
+        """
+        Crea una presentación con una imagen de página por diapositiva
+        
+        Args:
+            pages: Imágenes PIL (una por página); puede ser un iterador, cada
+                imagen se cierra después de agregarla
+            output: Ruta del archivo PPTX de salida o archivo binario abierto
+            page_size: (ancho, alto) predominante del PDF en puntos; con
+                target_resolution, las diapositivas toman su proporción
+            total: Número de páginas esperado, para el progreso (None = len(pages))
+            progress: Función progress(hechas, total, segundos) que se llama
+                después de agregar cada página
+        """
+        observer = self.observer
+        if total is None and progress is not None:
+            total = len(pages)
+        
+        # El rasterizado y la codificación de cada página ocurren dentro del
+        # bucle de construcción: se acumulan aparte y se descuentan de "build"
+        build_timer = StageTimer(observer, "build")
+        encode_timer = StageTimer(observer, "encode")
+        rasterize_timer = StageTimer(observer, "rasterize")
+        if observer is not NULL_OBSERVER:
+            build_timer.start()
+            rasterize_timer.start(dpi=self.dpi, resolution=self.target_resolution,
+                                  workers=self.workers, window=self.window)
+            encode_timer.start(encoding=self.encoder.mode)
+            pages = timed_iter(rasterize_timer, pages)
+        if progress is not None:
+            pages = self._report_progress(pages, progress, total)
         
         # Crear presentación
         prs = Presentation()
         blank_slide_layout = prs.slide_layouts[6]  # layout vacío
         
-        for i, img in enumerate(pages):
-            slide = prs.slides.add_slide(blank_slide_layout)
+        if self.target_resolution and page_size:
+            # Misma proporción que el PDF (p.ej. 16:9 en beamer) para no deformar
+            prs.slide_width = SLIDE_WIDTH
+            prs.slide_height = Emu(round(SLIDE_WIDTH * page_size[1] / page_size[0]))
+        
+        with build_timer:
+            encoded = self._add_page_slides(prs, blank_slide_layout, pages, encode_timer)
+        
+        num_slides = len(prs.slides)
+        if observer is not NULL_OBSERVER:
+            rasterize_timer.finish(pages=num_slides, peak_rss_mb=peak_rss_mb())
+            encode_timer.finish(pages=num_slides, **encoded)
+            build_timer.finish(exclude=(rasterize_timer, encode_timer), slides=num_slides)
+        
+        if not isinstance(output, (str, os.PathLike)):
+            with stage(observer, "save"):
+                prs.save(output)
+            return
+        
+        # Crear directorio si no existe
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+        
+        with stage(observer, "save") as counts:
+            prs.save(output)
+            counts["bytes"] = os.path.getsize(output)
+        
+        rss = peak_rss_mb()
+        print(f"Presentación guardada: {output} ({num_slides} páginas"
+              + (f", pico de memoria: {rss:.0f} MB)" if rss is not None else ")"))
+    
+    @staticmethod
+    def _report_progress(pages, progress, total):
+        """
+        Llama a progress(hechas, total, segundos) cada vez que se pide la
+        página siguiente, es decir, cuando la anterior ya se agregó
+        """
+        start = time.perf_counter()
+        done = 0
+        for img in pages:
+            yield img
+            done += 1
+            progress(done, total, time.perf_counter() - start)
+    
+    def _add_page_slides(self, prs, layout, pages, encode_timer):
+        """
+        Agrega una diapositiva con la imagen de cada página
+        
+        Args:
+            prs: Presentación destino
+            layout: Layout de diapositiva (vacío)
+            pages: Imágenes PIL (lista o iterador)
+            encode_timer: StageTimer donde se acumula la codificación
+            
+        Returns:
+            dict: "bytes" (total codificado) y páginas por modo ("png", "jpeg", ...)
+        """
+        encoded = {"bytes": 0}
+        for img in pages:
+            slide = prs.slides.add_slide(layout)
             
-            # Guardar imagen temporalmente
-            img_path = f"_tmp_slide_{i}.png"
-            img.save(img_path, "PNG")
+            # Codificar la imagen en memoria (sin archivos temporales)
+            with encode_timer:
+                image_stream, mode = self.encoder.encode(img)
+            encoded["bytes"] += image_stream.getbuffer().nbytes
+            encoded[mode] = encoded.get(mode, 0) + 1
             
             # Insertar imagen ocupando todo el slide
-            slide.shapes.add_picture(
-                img_path,
-                Inches(0),
-                Inches(0),
-                width=prs.slide_width,
-                height=prs.slide_height
-            )
+            slide.shapes.add_picture(image_stream, *self._picture_box(prs, img))
             
-            # Limpiar imagen temporal
-            try:
-                os.remove(img_path)
-            except:
-                pass
+            # Liberar el mapa de bits decodificado antes de la siguiente página
+            img.close()
+            del img
+        return encoded
+    
+    def _picture_box(self, prs, img):
+        """
+        Posición y tamaño de la imagen de una página en la diapositiva
         
-        # Crear directorio si no existe
-        os.makedirs(os.path.dirname(pptx_path) or '.', exist_ok=True)
+        Normalmente ocupa todo el slide. Con target_resolution, una página
+        con otra proporción que la del slide (PDF con páginas de distintos
+        tamaños) se centra sin deformarse.
         
-        prs.save(pptx_path)
-        print(f"Presentación guardada: {pptx_path}")
+        Returns:
+            tuple: (izquierda, arriba, ancho, alto) en EMU
+        """
+        slide_width, slide_height = prs.slide_width, prs.slide_height
+        if not self.target_resolution:
+            return 0, 0, slide_width, slide_height
+        
+        scale = min(slide_width / img.width, slide_height / img.height)
+        width, height = round(img.width * scale), round(img.height * scale)
+        # Diferencias de redondeo del rasterizado: ocupa todo el slide
+        if abs(width - slide_width) <= slide_width // 100 and abs(height - slide_height) <= slide_height // 100:
+            return 0, 0, slide_width, slide_height
+        return (slide_width - width) // 2, (slide_height - height) // 2, width, height
 
 
 # Función legacy para compatibilidad
@@ -147,20 +797,115 @@ def pdf_to_pptx(pdf_path, pptx_path, dpi=150):
     prs = Presentation()
     blank_slide_layout = prs.slide_layouts[6]  # layout vacío
 
-    for i, img in enumerate(pages):
+    for img in pages:
         slide = prs.slides.add_slide(blank_slide_layout)
-        img_path = f"_tmp_slide_{i}.png"
-        img.save(img_path, "PNG")
+        image_stream = io.BytesIO()
+        img.save(image_stream, "PNG")
+        image_stream.seek(0)
         # insertar imagen ocupando todo el slide
-        slide.shapes.add_picture(img_path, Inches(0), Inches(0), width=prs.slide_width, height=prs.slide_height)
-        os.remove(img_path)
+        slide.shapes.add_picture(image_stream, Inches(0), Inches(0), width=prs.slide_width, height=prs.slide_height)
 
     prs.save(pptx_path)
     print("Saved:", pptx_path)
 
 
+def format_eta(done, total, elapsed):
+    """Tiempo restante estimado como texto ("12 s", "3 min 05 s"), o "" al empezar"""
+    if not done or done >= total:
+        return ""
+    remaining = round(elapsed / done * (total - done))
+    if remaining < 60:
+        return f"{remaining} s"
+    return f"{remaining // 60} min {remaining % 60:02d} s"
+
+
+def print_progress(done, total, elapsed):
+    """Callback de progreso que muestra una línea actualizable en la terminal"""
+    eta = format_eta(done, total, elapsed)
+    line = f"\r   Página {done}/{total} ({done / total:.0%})" + (f", quedan ~{eta}" if eta else "")
+    print(line.ljust(48), end="\n" if done >= total else "", flush=True)
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Convierte archivos LaTeX o PDF a PowerPoint")
+    parser.add_argument("inputs", nargs="+", help="Archivos .tex o .pdf")
+    parser.add_argument("output", help="Archivo .pptx de salida (o directorio si hay varias entradas)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Documentos convertidos a la vez con varias entradas (por defecto, uno por CPU)")
+    parser.add_argument("--timeout", type=int, default=None,
+                        help="Tiempo máximo de cada compilación en segundos "
+                             "(por defecto, según el número de páginas estimado)")
+    parser.add_argument("--pages", default=None,
+                        help="Páginas a convertir, p.ej. 1-3,40-55 o 40- (por defecto, todas)")
+    parser.add_argument("--dpi", type=int, default=150, help="Resolución de las imágenes")
+    parser.add_argument("--resolution", metavar="ANCHOxALTO", default=None,
+                        help="Rasterizar al tamaño exacto para esta pantalla (p.ej. 1920x1080) "
+                             "y ajustar las diapositivas a la proporción del PDF")
+    parser.add_argument("--workers", "-j", type=int, default=None,
+                        help="Procesos de rasterizado en paralelo (por defecto, uno por CPU)")
+    parser.add_argument("--window", type=int, default=None,
+                        help=f"Páginas decodificadas a la vez (limita el pico de memoria; "
+                             f"por defecto {DEFAULT_WINDOW_PAGES})")
+    parser.add_argument("--encoding", default="png", choices=ENCODINGS,
+                        help="Codificación de las páginas (auto elige por número de colores)")
+    parser.add_argument("--quality", type=int, default=85, help="Calidad JPEG (1-95)")
+    parser.add_argument("--compress-level", type=int, default=9,
+                        help="Nivel de compresión de png-optimized (0-9)")
+    parser.add_argument("--target-kb", type=int, default=None,
+                        help="Tamaño máximo por diapositiva en KB")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reutilizar los PDF compilados de la caché (ver scripts/latex_cache.py)")
+    parser.add_argument("--native", action="store_true",
+                        help="Convertir beamer sencillo a diapositivas editables sin pdflatex")
+    parser.add_argument("--theme", default="modern_blue", help="Tema de la conversión nativa")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="Guardar la duración de cada etapa en un archivo JSON")
+    args = parser.parse_args(argv)
+
+    target_resolution = None
+    if args.resolution:
+        try:
+            target_resolution = tuple(int(n) for n in args.resolution.lower().split("x"))
+        except ValueError:
+            target_resolution = ()
+        if len(target_resolution) != 2:
+            parser.error(f"Resolución inválida: {args.resolution} (use ANCHOxALTO, p.ej. 1920x1080)")
+
+    pages = None
+    if args.pages:
+        try:
+            pages = parse_page_ranges(args.pages)
+        except ValueError as e:
+            parser.error(str(e))
+
+    recorder = ProfileRecorder() if args.profile else None
+    converter = LatexToPptxConverter(dpi=args.dpi, observer=recorder, workers=args.workers,
+                                     window=args.window, encoding=args.encoding,
+                                     jpeg_quality=args.quality, compress_level=args.compress_level,
+                                     target_slide_kb=args.target_kb,
+                                     latex_cache=LatexCache() if args.cache else None,
+                                     native_beamer=args.native, theme=args.theme,
+                                     target_resolution=target_resolution,
+                                     compile_timeout=args.timeout)
+
+    status = 0
+    if len(args.inputs) == 1 and not os.path.isdir(args.output):
+        converter.convert(args.inputs[0], args.output, pages=pages, progress=print_progress)
+    else:
+        result = converter.convert_many(args.inputs, args.output, jobs=args.jobs, pages=pages)
+        print(f"\n✅ Convertidos: {len(result['converted'])} archivos")
+        if result["errors"]:
+            print(f"❌ Errores: {len(result['errors'])}")
+            for item in result["errors"]:
+                print(f"   - {item['input']}: {item['error']}")
+            status = 1
+
+    if recorder:
+        recorder.save(args.profile)
+        print(f"Perfil guardado: {args.profile}")
+    return status
+
+
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python scripts/latex_to_pptx.py input.pdf output.pptx")
-        sys.exit(1)
-    pdf_to_pptx(sys.argv[1], sys.argv[2])
+    sys.exit(main())
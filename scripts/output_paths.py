@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# scripts/output_paths.py
+"""
+Nombres de los archivos de salida de las conversiones por lotes
+
+Lo usan tanto batch_convert.py (texto) como LatexToPptxConverter.convert_many
+(LaTeX/PDF) para que dos entradas nunca escriban el mismo archivo.
+"""
+import os
+
+
+def output_paths(inputs, output_dir, extension=".pptx"):
+    """
+    Asigna a cada entrada su archivo de salida en output_dir
+
+    Args:
+        inputs: Rutas de los archivos de entrada
+        output_dir: Directorio de salida
+        extension: Extensión de los archivos de salida
+
+    Returns:
+        tuple: (lista de (entrada, salida) sin conflictos, lista de
+            {"input", "error"} de las entradas cuyo nombre de salida se
+            repite: dos procesos escribiendo el mismo archivo lo corromperían)
+    """
+    by_output = {}
+    for input_file in inputs:
+        basename = os.path.splitext(os.path.basename(input_file))[0]
+        output_file = os.path.join(output_dir, basename + extension)
+        by_output.setdefault(os.path.normcase(output_file), (output_file, []))[1].append(input_file)
+
+    jobs = []
+    errors = []
+    for output_file, sources in by_output.values():
+        if len(sources) == 1:
+            jobs.append((sources[0], output_file))
+            continue
+        for input_file in sources:
+            others = ", ".join(other for other in sources if other != input_file)
+            errors.append({
+                "input": input_file,
+                "error": f"Nombre de salida repetido: {os.path.basename(output_file)} "
+                         f"(también lo generaría {others})"
+            })
+    return jobs, errors
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# scripts/text_metrics.py
+"""
+Medición aproximada de texto para estimar cuánto ocupa una viñeta
+
+Usa tablas de anchos de glifo por fuente (en milésimas de em) que se
+construyen una sola vez: con Pillow si la fuente TrueType está instalada
+(solo se consulta el avance de cada carácter, sin rasterizar), o con una
+tabla aproximada de Calibri incluida aquí. Los anchos de cada palabra y el
+número de líneas de cada texto se memorizan, así que medir miles de
+diapositivas cuesta muy poco.
+"""
+import unicodedata
+from functools import lru_cache
+
+
+# Fuente por defecto de los cuadros de texto de python-pptx (tema Office)
+DEFAULT_FONT = "Calibri"
+
+# Alto de línea relativo al tamaño de fuente (interlineado sencillo)
+LINE_HEIGHT = 1.2
+
+# Ancho de un carácter desconocido, en milésimas de em
+_DEFAULT_WIDTH = 500
+
+# Anchos aproximados de Calibri para ASCII imprimible, en milésimas de em
+_CALIBRI_WIDTHS = dict(zip(
+    " !\"#$%&'()*+,-./0123456789:;<=>?@"
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`"
+    "abcdefghijklmnopqrstuvwxyz{|}~",
+    [
+        226, 268, 348, 507, 507, 715, 682, 192, 303, 303, 507, 507, 250, 306, 252, 386,
+        507, 507, 507, 507, 507, 507, 507, 507, 507, 507, 268, 268, 507, 507, 507, 463, 895,
+        579, 544, 533, 615, 488, 459, 631, 623, 252, 319, 520, 420, 855, 646, 662, 517,
+        673, 543, 459, 487, 642, 567, 890, 519, 487, 468, 307, 386, 307, 507, 498, 291,
+        479, 525, 423, 525, 498, 305, 471, 525, 230, 239, 455, 230, 799, 525, 527, 525,
+        525, 349, 391, 335, 525, 452, 715, 433, 453, 395, 314, 460, 314, 507,
+    ]
+))
+_CALIBRI_WIDTHS.update({
+    "●": 600,   # viñeta usada por TextToPptxConverter
+    "–": 498,
+    "—": 905,
+    "¿": 463,
+    "¡": 268,
+    "«": 498,
+    "»": 498,
+    "“": 418,
+    "”": 418,
+    "‘": 250,
+    "’": 250,
+    "…": 750,
+})
+
+
+@lru_cache(maxsize=None)
+def get_width_table(font_name=DEFAULT_FONT):
+    """
+    Obtiene la tabla de anchos de glifo de una fuente (se construye una vez)
+
+    Args:
+        font_name: Nombre de la fuente
+
+    Returns:
+        dict: Carácter -> ancho en milésimas de em
+    """
+    try:
+        from PIL import ImageFont
+        font = ImageFont.truetype(f"{font_name.lower()}.ttf", 1000)
+    except (ImportError, OSError):
+        return _CALIBRI_WIDTHS
+
+    table = {}
+    for char in list(map(chr, range(32, 256))) + list(_CALIBRI_WIDTHS):
+        table[char] = font.getlength(char)
+    return table
+
+
+def _char_width(char, table):
+    """Ancho de un carácter; los acentuados usan el de su letra base"""
+    width = table.get(char)
+    if width is None:
+        base = unicodedata.normalize("NFD", char)[:1]
+        width = table.get(base, _DEFAULT_WIDTH)
+    return width
+
+
+@lru_cache(maxsize=65536)
+def word_width(word, font_name=DEFAULT_FONT):
+    """Ancho de una palabra en em"""
+    table = get_width_table(font_name)
+    return sum(_char_width(char, table) for char in word) / 1000.0
+
+
+@lru_cache(maxsize=65536)
+def count_lines(text, width_em, font_name=DEFAULT_FONT):
+    """
+    Estima en cuántas líneas se ajusta un texto
+
+    Args:
+        text: Texto del párrafo
+        width_em: Ancho disponible expresado en em (ancho / tamaño de fuente)
+        font_name: Nombre de la fuente
+
+    Returns:
+        int: Número de líneas (al menos 1)
+    """
+    # Con un ancho nulo o negativo (cuadro más estrecho que la sangría)
+    # cada palabra no se podría cortar nunca: se toma al menos 1 em
+    width_em = max(width_em, 1.0)
+    space = word_width(" ", font_name)
+    lines = 1
+    line_width = 0.0
+    for word in text.split():
+        width = word_width(word, font_name)
+        if line_width and line_width + space + width > width_em:
+            lines += 1
+            line_width = 0.0
+        if not line_width:
+            # Una palabra más ancha que la línea se corta en varias líneas
+            while width > width_em:
+                lines += 1
+                width -= width_em
+            line_width = width
+        else:
+            line_width += space + width
+    return lines
+
+
+def paragraph_height_pt(text, font_size_pt, box_width_pt, space_before_pt=0, space_after_pt=0,
+                        font_name=DEFAULT_FONT):
+    """
+    Estima el alto que ocupa un párrafo en un cuadro de texto
+
+    Args:
+        text: Texto del párrafo
+        font_size_pt: Tamaño de fuente en puntos
+        box_width_pt: Ancho útil del cuadro de texto en puntos
+        space_before_pt: Espaciado anterior en puntos
+        space_after_pt: Espaciado posterior en puntos
+        font_name: Nombre de la fuente
+
+    Returns:
+        float: Alto en puntos
+    """
+    lines = count_lines(text, box_width_pt / font_size_pt, font_name)
+    return lines * font_size_pt * LINE_HEIGHT + space_before_pt + space_after_pt
@@ -3,86 +3,235 @@
 """
 Convierte archivos de texto estructurados en presentaciones PowerPoint
 """
+import argparse
+import copy
+import hashlib
+import io
+import json
 import os
 import re
+import sys
 from pptx import Presentation
 from pptx.util import Pt, Inches
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+
+try:
+    from scripts.instrumentation import NULL_OBSERVER, ProfileRecorder, StageTimer, stage, timed_iter
+    from scripts.text_metrics import paragraph_height_pt
+    from scripts.themes import get_theme
+except ImportError:  # ejecutado directamente como script
+    from instrumentation import NULL_OBSERVER, ProfileRecorder, StageTimer, stage, timed_iter
+    from text_metrics import paragraph_height_pt
+    from themes import get_theme
+
+
+# Marcador de inicio de diapositiva ("SLIDE 3:"). Nunca abarca un salto de
+# línea, así que puede buscarse línea a línea.
+_SLIDE_MARKER = re.compile(r'SLIDE \d+:')
+
+# XML decorativo prearmado por tema: {colores del tema: {decoración: elemento}}
+_SKELETON_CACHE = {}
+
+# Párrafo de viñeta prearmado por tema: {colores del tema: elemento <a:p>}
+_BULLET_TEMPLATE_CACHE = {}
+
+# Caracteres de control que python-pptx convierte en <a:br/> o escapa como _xHHHH_
+_CONTROL_CHARS = re.compile(r'[\x00-\x1F]')
+
+
+def iter_slides(lines):
+    """
+    Parsea el formato SLIDE N: de forma incremental
+    
+    Consume las líneas de una en una y produce cada slide en cuanto se
+    encuentra el marcador de la siguiente (o se acaba la entrada), por lo
+    que la memoria usada está acotada por el tamaño de una diapositiva.
+    
+    Args:
+        lines: Iterable de líneas (p.ej. un archivo abierto en modo texto)
+        
+    Yields:
+        dict: Diccionario {"title", "bullets"} de cada slide
+    """
+    title_parts = None
+    bullets = []
+    
+    for raw_line in lines:
+        for j, line in enumerate(_SLIDE_MARKER.split(raw_line)):
+            if j > 0:
+                # Empieza una nueva diapositiva: emitir la anterior
+                if title_parts is not None:
+                    yield {"title": " ".join(title_parts), "bullets": bullets}
+                title_parts = None
+                bullets = []
+            
+            line = line.strip()
+            if not line:
+                continue
+            
+            if title_parts is None:
+                # La primera línea es el título
+                title_parts = [line]
+            elif line.startswith('-'):
+                # Las siguientes líneas que empiezan con - son bullets
+                bullets.append(line[1:].strip())
+            elif not line.startswith('SLIDE'):
+                # Si no empieza con -, puede ser continuación del título o bullet
+                if not bullets:
+                    title_parts.append(line)
+                else:
+                    bullets.append(line)
+    
+    if title_parts is not None:
+        yield {"title": " ".join(title_parts), "bullets": bullets}
+
+
+def iter_lines(chunks):
+    """
+    Reagrupa fragmentos de texto en líneas
+    
+    Los fragmentos de una respuesta en streaming cortan las líneas en
+    cualquier punto; esta función las recompone para iter_slides.
+    
+    Args:
+        chunks: Iterable de fragmentos de texto
+        
+    Yields:
+        str: Cada línea completa (la última aunque no termine en salto de línea)
+    """
+    pending = ""
+    for chunk in chunks:
+        *lines, pending = (pending + chunk).split("\n")
+        yield from lines
+    if pending:
+        yield pending
 
 
 class TextToPptxConverter:
     """Clase para convertir texto estructurado a PowerPoint"""
     
-    def __init__(self, theme="modern_blue"):
+    # Elementos decorativos que se prearman una vez por tema
+    _DECORATIONS = (
+        "title_background",
+        "content_background",
+        "accent_line",
+        "header_bar",
+        "footer_bar",
+    )
+    
+    # Geometría y formato del área de viñetas (ver _make_content_slide)
+    CONTENT_WIDTH_IN = 8
+    CONTENT_HEIGHT_IN = 5
+    BULLET_FONT_PT = 20
+    BULLET_SPACING_PT = 12
+    BULLET_PREFIX = "● "
+    SUB_BULLET_PREFIX = "– "
+    CONTINUATION_SUFFIX = " (cont.)"
+    
+    # Sangría por nivel de las viñetas anidadas (marL del estilo por
+    # defecto de la presentación: 0.5")
+    LEVEL_INDENT_PT = 36
+    
+    def __init__(self, theme="modern_blue", cache_skeletons=True, auto_paginate=False,
+                 fast_bullets=False, observer=None):
         """
         Inicializa el convertidor
         
         Args:
-            theme: Tema de colores ("modern_blue", "dark", "professional", "vibrant")
+            theme: Nombre del tema de colores ("modern_blue", "dark", "professional",
+                "vibrant" o un tema propio registrado en scripts/themes.py)
+            cache_skeletons: Clonar el XML decorativo prearmado del tema en vez
+                de dibujarlo con python-pptx en cada diapositiva
+            auto_paginate: Dividir las diapositivas cuyas viñetas no caben en
+                el área de contenido en diapositivas de continuación "(cont.)"
+            fast_bullets: Escribir los párrafos de viñetas directamente como
+                XML (<a:p>) en una sola pasada; el resultado es idéntico
+            observer: ConversionObserver que recibe la duración de cada etapa
+                ("parse", "paginate", "load", "build", "save"); ver
+                scripts/instrumentation.py
         """
         self.prs = None
         self.theme = theme
+        self.cache_skeletons = cache_skeletons
+        self.auto_paginate = auto_paginate
+        self.fast_bullets = fast_bullets
+        self.observer = observer or NULL_OBSERVER
         self.colors = self._get_theme_colors(theme)
     
     def _get_theme_colors(self, theme):
-        """Obtiene los colores según el tema seleccionado"""
-        themes = {
-            "modern_blue": {
-                "primary": RGBColor(41, 128, 185),      # Azul moderno
-                "secondary": RGBColor(52, 152, 219),    # Azul claro
-                "accent": RGBColor(46, 204, 113),       # Verde
-                "text": RGBColor(44, 62, 80),           # Gris oscuro
-                "bg_title": RGBColor(236, 240, 241),    # Gris muy claro
-                "bg_content": RGBColor(255, 255, 255)   # Blanco
-            },
-            "dark": {
-                "primary": RGBColor(41, 128, 185),
-                "secondary": RGBColor(142, 68, 173),    # Púrpura
-                "accent": RGBColor(230, 126, 34),       # Naranja
-                "text": RGBColor(236, 240, 241),        # Texto claro
-                "bg_title": RGBColor(44, 62, 80),       # Fondo oscuro
-                "bg_content": RGBColor(52, 73, 94)      # Fondo medio
-            },
-            "professional": {
-                "primary": RGBColor(51, 51, 51),        # Gris oscuro
-                "secondary": RGBColor(0, 114, 188),     # Azul corporativo
-                "accent": RGBColor(255, 185, 0),        # Dorado
-                "text": RGBColor(51, 51, 51),
-                "bg_title": RGBColor(242, 242, 242),
-                "bg_content": RGBColor(255, 255, 255)
-            },
-            "vibrant": {
-                "primary": RGBColor(231, 76, 60),       # Rojo
-                "secondary": RGBColor(155, 89, 182),    # Púrpura
-                "accent": RGBColor(241, 196, 15),       # Amarillo
-                "text": RGBColor(44, 62, 80),
-                "bg_title": RGBColor(236, 240, 241),
-                "bg_content": RGBColor(255, 255, 255)
-            }
-        }
-        return themes.get(theme, themes["modern_blue"])
+        """Obtiene los colores según el tema seleccionado (ver scripts/themes.py)"""
+        return get_theme(theme)
     
-    def convert(self, input_file, output_file):
+    def convert(self, input_file, output_file, incremental=False):
         """
         Convierte un archivo de texto a PowerPoint
         
         Args:
             input_file: Ruta del archivo de texto de entrada
             output_file: Ruta del archivo PPTX de salida
+            incremental: Reconstruir solo las diapositivas que cambiaron
+                respecto a la conversión anterior (ver _create_presentation)
+            
+        Returns:
+            int: Número de diapositivas creadas
         """
         if not os.path.exists(input_file):
             raise FileNotFoundError(f"Archivo no encontrado: {input_file}")
         
-        # Leer el contenido del archivo
+        # Leer y parsear el archivo línea a línea: cada slide se construye
+        # en cuanto termina de leerse, sin cargar el archivo completo
         with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+            return self._create_presentation(iter_slides(f), output_file, incremental)
+    
+    def convert_text(self, content):
+        """
+        Convierte texto estructurado a PowerPoint en memoria
+        
+        Args:
+            content: Texto en formato SLIDE N:
+            
+        Returns:
+            bytes: Contenido del archivo PPTX
+        """
+        buffer = io.BytesIO()
+        self.write_text(content, buffer)
+        return buffer.getvalue()
+    
+    def write_text(self, content, output, incremental=False):
+        """
+        Convierte texto estructurado y escribe el PPTX sin archivos temporales
         
-        # Parsear el contenido
-        structure = self._parse_content(content)
+        Args:
+            content: Texto en formato SLIDE N:
+            output: Archivo binario abierto (cualquier objeto con write) o ruta
+                del archivo PPTX de salida
+            incremental: Reutilizar las diapositivas sin cambios (solo con rutas)
+            
+        Returns:
+            int: Número de diapositivas creadas
+        """
+        # newline=None: mismos saltos de línea que al leer desde un archivo
+        lines = io.StringIO(content, newline=None)
+        return self.write_slides(iter_slides(lines), output, incremental)
+    
+    def write_slides(self, slides, output, incremental=False):
+        """
+        Escribe el PPTX a partir de diapositivas ya parseadas
         
-        # Crear la presentación
-        self._create_presentation(structure, output_file)
+        Args:
+            slides: Iterable de diccionarios {"title", "bullets"} (y "levels"
+                opcional), p.ej. el generador de iter_slides
+            output: Archivo binario abierto (cualquier objeto con write) o ruta
+                del archivo PPTX de salida
+            incremental: Reutilizar las diapositivas sin cambios (solo con rutas)
+            
+        Returns:
+            int: Número de diapositivas creadas
+        """
+        return self._create_presentation(slides, output, incremental)
     
     def _parse_content(self, content):
         """
@@ -94,84 +243,271 @@ class TextToPptxConverter:
         Returns:
             list: Lista de diccionarios con estructura de slides
         """
-        structure = []
-        slides = re.split(r'SLIDE \d+:', content)
+        return list(iter_slides(content.split('\n')))
+    
+    def _create_presentation(self, structure, output_file, incremental=False):
+        """
+        Crea la presentación PowerPoint a partir de la estructura
         
-        for slide_content in slides:
-            if not slide_content.strip():
-                continue
-            
-            lines = [line.strip() for line in slide_content.split('\n') if line.strip()]
-            if not lines:
-                continue
-            
-            # La primera línea es el título
-            title = lines[0]
+        En modo incremental se guarda junto al PPTX un manifiesto con el hash
+        de cada diapositiva (título, viñetas, tema y posición). Si el PPTX y su
+        manifiesto existen y no se modificaron desde la última conversión,
+        se reabre el archivo y solo se reescriben las diapositivas cuyo hash
+        cambió; el resto se reutiliza tal cual.
+        
+        Args:
+            structure: Iterable de diccionarios con estructura de slides
+                (puede ser un generador como iter_slides)
+            output_file: Ruta del archivo PPTX de salida o archivo binario abierto
+            incremental: Reutilizar las diapositivas sin cambios del PPTX existente
+                (requiere una ruta)
             
-            # Las siguientes líneas que empiezan con - son bullets
-            bullets = []
-            for line in lines[1:]:
-                if line.startswith('-'):
-                    bullets.append(line[1:].strip())
-                elif line and not line.startswith('SLIDE'):
-                    # Si no empieza con -, puede ser continuación del título o bullet
-                    if not bullets:
-                        title += " " + line
-                    else:
-                        bullets.append(line)
+        Returns:
+            int: Número de diapositivas creadas
+        """
+        is_path = isinstance(output_file, (str, os.PathLike))
+        if is_path:
+            # pathlib.Path y similares: las rutas auxiliares se arman con str
+            output_file = os.fspath(output_file)
+        if incremental and not is_path:
+            raise ValueError("El modo incremental requiere una ruta de archivo de salida")
+        
+        observer = self.observer
+        previous_hashes = self._load_manifest(output_file) if incremental else None
+        
+        if previous_hashes is not None:
+            with stage(observer, "load") as counts:
+                self.prs = Presentation(output_file)
+                counts["slides"] = len(self.prs.slides)
+        else:
+            previous_hashes = []
+            self.prs = Presentation()
+            self.prs.slide_width = Inches(10)
+            self.prs.slide_height = Inches(7.5)
+        
+        # El parseo y la paginación ocurren en streaming, intercalados con la
+        # construcción: su tiempo se acumula y se descuenta del de "build"
+        parse_timer = paginate_timer = None
+        if observer is not NULL_OBSERVER:
+            parse_timer = StageTimer(observer, "parse").start()
+            structure = timed_iter(parse_timer, structure)
+        
+        if self.auto_paginate:
+            structure = self._paginate(structure)
+            if observer is not NULL_OBSERVER:
+                paginate_timer = StageTimer(observer, "paginate").start()
+                structure = timed_iter(paginate_timer, structure)
+        
+        existing_slides = len(self.prs.slides)
+        slide_hashes = []
+        rebuilt = 0
+        
+        build_timer = StageTimer(observer, "build")
+        if observer is not NULL_OBSERVER:
+            build_timer.start(incremental=incremental)
+        
+        with build_timer:
+            for i, slide_data in enumerate(structure):
+                slide_hash = self._slide_hash(i, slide_data)
+                slide_hashes.append(slide_hash)
+                if i < len(previous_hashes) and previous_hashes[i] == slide_hash:
+                    # Diapositiva sin cambios: se reutiliza
+                    continue
+                
+                # Reescribir en su lugar una diapositiva existente o agregar una nueva
+                slide = None
+                if i < existing_slides:
+                    slide = self.prs.slides[i]
+                    self._clear_slide(slide)
+                rebuilt += 1
+                
+                if i == 0:
+                    # Primera diapositiva como portada
+                    self._make_title_slide(
+                        self.prs,
+                        slide_data.get("title", ""),
+                        slide_data.get("bullets", []),
+                        slide=slide
+                    )
+                else:
+                    # Diapositivas de contenido
+                    self._make_content_slide(
+                        self.prs,
+                        slide_data.get("title", ""),
+                        slide_data.get("bullets", []),
+                        slide=slide,
+                        levels=slide_data.get("levels")
+                    )
             
-            structure.append({
-                "title": title,
-                "bullets": bullets
-            })
+            # Eliminar las diapositivas que sobran de la conversión anterior
+            self._drop_slides_from(len(slide_hashes))
+        
+        if observer is not NULL_OBSERVER:
+            parse_timer.finish(slides=parse_timer.items)
+            if paginate_timer is not None:
+                paginate_timer.finish(exclude=parse_timer, slides=paginate_timer.items)
+            build_timer.finish(exclude=paginate_timer or parse_timer,
+                               slides=len(slide_hashes), rebuilt=rebuilt)
+        
+        if not is_path:
+            with stage(observer, "save") as counts:
+                self.prs.save(output_file)
+                counts["slides"] = len(self.prs.slides)
+            return len(self.prs.slides)
         
-        return structure
+        # Crear directorio si no existe
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        
+        with stage(observer, "save") as counts:
+            self.prs.save(output_file)
+            counts["slides"] = len(self.prs.slides)
+            counts["bytes"] = os.path.getsize(output_file)
+        
+        if incremental:
+            self._save_manifest(output_file, slide_hashes)
+            print(f"Presentación guardada: {output_file} "
+                  f"({rebuilt}/{len(slide_hashes)} diapositivas reconstruidas)")
+        else:
+            print(f"Presentación guardada: {output_file}")
+        return len(self.prs.slides)
     
-    def _create_presentation(self, structure, output_file):
+    def _paginate(self, structure):
         """
-        Crea la presentación PowerPoint a partir de la estructura
+        Divide las diapositivas de contenido cuyas viñetas desbordan el área
+        
+        El alto de cada viñeta se estima con las tablas de anchos de
+        scripts/text_metrics.py; cuando la suma supera el alto del área de
+        contenido, las viñetas restantes pasan a una diapositiva "(cont.)".
+        La portada (primera diapositiva) no se divide.
         
         Args:
-            structure: Lista de diccionarios con estructura de slides
-            output_file: Ruta del archivo PPTX de salida
+            structure: Iterable de diccionarios con estructura de slides
+            
+        Yields:
+            dict: Diccionarios de slides, con las continuaciones intercaladas
         """
-        self.prs = Presentation()
-        self.prs.slide_width = Inches(10)
-        self.prs.slide_height = Inches(7.5)
+        # Ancho y alto útiles descontando los márgenes internos del cuadro
+        # de texto (0.1" a los lados y 0.05" arriba y abajo)
+        box_width_pt = (self.CONTENT_WIDTH_IN - 0.2) * 72
+        box_height_pt = (self.CONTENT_HEIGHT_IN - 0.1) * 72
         
         for i, slide_data in enumerate(structure):
-            if i == 0:
-                # Primera diapositiva como portada
-                self._make_title_slide(
-                    self.prs,
-                    slide_data.get("title", ""),
-                    slide_data.get("bullets", [])
-                )
-            else:
-                # Diapositivas de contenido
-                self._make_content_slide(
-                    self.prs,
-                    slide_data.get("title", ""),
-                    slide_data.get("bullets", [])
+            bullets = slide_data.get("bullets", [])
+            if i == 0 or not bullets:
+                yield slide_data
+                continue
+            
+            title = slide_data.get("title", "")
+            levels = slide_data.get("levels")
+            chunk = []
+            chunk_levels = []
+            used_pt = 0.0
+            for index, bullet in enumerate(bullets):
+                level = levels[index] if levels else 0
+                height = paragraph_height_pt(
+                    (self.SUB_BULLET_PREFIX if level else self.BULLET_PREFIX) + bullet,
+                    self.BULLET_FONT_PT,
+                    box_width_pt - level * self.LEVEL_INDENT_PT,
+                    self.BULLET_SPACING_PT,
+                    self.BULLET_SPACING_PT
                 )
+                if chunk and used_pt + height > box_height_pt:
+                    yield self._paginated_slide(slide_data, title, chunk, chunk_levels)
+                    title = slide_data.get("title", "") + self.CONTINUATION_SUFFIX
+                    chunk = []
+                    chunk_levels = []
+                    used_pt = 0.0
+                chunk.append(bullet)
+                chunk_levels.append(level)
+                used_pt += height
+            yield self._paginated_slide(slide_data, title, chunk, chunk_levels)
+    
+    @staticmethod
+    def _paginated_slide(slide_data, title, bullets, levels):
+        """Diapositiva (o continuación) con un tramo de las viñetas"""
+        if "levels" not in slide_data:
+            return dict(slide_data, title=title, bullets=bullets)
+        return dict(slide_data, title=title, bullets=bullets, levels=levels)
+    
+    # ========== RECONSTRUCCIÓN INCREMENTAL ==========
+    
+    @staticmethod
+    def _manifest_path(output_file):
+        """Ruta del manifiesto que acompaña al PPTX"""
+        return output_file + ".manifest.json"
+    
+    def _slide_hash(self, position, slide_data):
+        """Hash del contenido de una diapositiva en su posición, con el tema actual"""
+        fields = [
+            position,
+            slide_data.get("title", ""),
+            slide_data.get("bullets", []),
+            self.theme,
+            {name: str(color) for name, color in self.colors.items()},
+        ]
+        if slide_data.get("levels"):
+            fields.append(slide_data["levels"])
+        key = json.dumps(fields, ensure_ascii=False)
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+    
+    def _load_manifest(self, output_file):
+        """
+        Lee los hashes de la conversión anterior
         
-        # Crear directorio si no existe
-        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
-        
-        self.prs.save(output_file)
-        print(f"Presentación guardada: {output_file}")
+        Returns:
+            list: Hashes por diapositiva, o None si no hay manifiesto válido o
+                el PPTX se modificó desde que se escribió
+        """
+        manifest_file = self._manifest_path(output_file)
+        if not os.path.exists(output_file) or not os.path.exists(manifest_file):
+            return None
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            stat = os.stat(output_file)
+            if manifest["pptx_size"] != stat.st_size or manifest["pptx_mtime_ns"] != stat.st_mtime_ns:
+                return None
+            return list(manifest["slides"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_manifest(self, output_file, slide_hashes):
+        """Guarda los hashes por diapositiva junto al PPTX"""
+        stat = os.stat(output_file)
+        manifest = {
+            "pptx_size": stat.st_size,
+            "pptx_mtime_ns": stat.st_mtime_ns,
+            "slides": slide_hashes
+        }
+        with open(self._manifest_path(output_file), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1)
     
-    def _make_title_slide(self, prs, title, bullets):
-        """Crea una diapositiva de título (portada)"""
+    @staticmethod
+    def _clear_slide(slide):
+        """Quita el fondo y todas las formas de una diapositiva"""
+        c_sld = slide._element.cSld
+        if c_sld.bg is not None:
+            c_sld.remove(c_sld.bg)
+        sp_tree = slide.shapes._spTree
+        for element in list(sp_tree.iter_shape_elms()):
+            sp_tree.remove(element)
+    
+    def _drop_slides_from(self, index):
+        """Elimina de la presentación las diapositivas desde la posición index"""
+        sld_id_lst = self.prs.slides._sldIdLst
+        for sld_id in list(sld_id_lst)[index:]:
+            sld_id_lst.remove(sld_id)
+            self.prs.part.drop_rel(sld_id.rId)
+    
+    def _make_title_slide(self, prs, title, bullets, slide=None):
+        """Crea una diapositiva de título (portada), o la dibuja en `slide` si se indica"""
         # Usar layout en blanco
-        slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(slide_layout)
+        if slide is None:
+            slide_layout = prs.slide_layouts[6]
+            slide = prs.slides.add_slide(slide_layout)
         
         # Fondo de la diapositiva
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self.colors["primary"]
+        self._add_decoration(slide, "title_background")
         
         # Título principal
         left = Inches(1)
@@ -204,37 +540,23 @@ class TextToPptxConverter:
             p_sub.font.color.rgb = RGBColor(255, 255, 255)
         
         # Línea decorativa
-        line_top = Inches(4.2)
-        line = slide.shapes.add_shape(
-            1,  # Rectángulo
-            Inches(3.5), line_top,
-            Inches(3), Inches(0.05)
-        )
-        line.fill.solid()
-        line.fill.fore_color.rgb = self.colors["accent"]
-        line.line.fill.background()
+        self._add_decoration(slide, "accent_line")
     
-    def _make_content_slide(self, prs, title, bullets):
-        """Crea una diapositiva de contenido con diseño moderno"""
+    def _make_content_slide(self, prs, title, bullets, slide=None, levels=None):
+        """
+        Crea una diapositiva de contenido con diseño moderno, o la dibuja en `slide` si se indica
+        
+        `levels` indica el nivel de cada viñeta (0 = primer nivel) para
+        listas anidadas; None equivale a todas en el primer nivel.
+        """
         # Usar layout en blanco
-        slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(slide_layout)
+        if slide is None:
+            slide_layout = prs.slide_layouts[6]
+            slide = prs.slides.add_slide(slide_layout)
         
-        # Fondo blanco/claro
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self.colors["bg_content"]
-        
-        # Barra superior decorativa
-        header_shape = slide.shapes.add_shape(
-            1,  # Rectángulo
-            Inches(0), Inches(0),
-            Inches(10), Inches(0.8)
-        )
-        header_shape.fill.solid()
-        header_shape.fill.fore_color.rgb = self.colors["primary"]
-        header_shape.line.fill.background()
+        # Fondo blanco/claro y barra superior decorativa
+        self._add_decoration(slide, "content_background")
+        self._add_decoration(slide, "header_bar")
         
         # Título en la barra superior
         title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.15), Inches(9), Inches(0.6))
@@ -251,35 +573,192 @@ class TextToPptxConverter:
         if bullets:
             content_left = Inches(1.2)
             content_top = Inches(1.5)
-            content_width = Inches(8)
-            content_height = Inches(5)
+            content_width = Inches(self.CONTENT_WIDTH_IN)
+            content_height = Inches(self.CONTENT_HEIGHT_IN)
             
             content_box = slide.shapes.add_textbox(content_left, content_top, content_width, content_height)
             text_frame = content_box.text_frame
             text_frame.word_wrap = True
             text_frame.vertical_anchor = 1  # Centro vertical
             
-            for i, bullet in enumerate(bullets):
-                if i > 0:
-                    text_frame.add_paragraph()
-                
-                p = text_frame.paragraphs[i]
-                p.text = bullet
-                p.level = 0
-                p.font.size = Pt(20)
-                p.font.color.rgb = self.colors["text"]
-                p.space_before = Pt(12)
-                p.space_after = Pt(12)
-                
-                # Agregar viñeta personalizada
-                p.font.bold = False
-                
-                # Icono de viñeta (bullet point)
-                run = p.runs[0]
-                run.text = f"● {bullet}"
-                run.font.color.rgb = self.colors["secondary"]
+            if self.fast_bullets and not any(levels or ()) and self._can_write_bullets_fast(bullets):
+                self._write_bullets_fast(text_frame, bullets)
+            else:
+                self._write_bullets(text_frame, bullets, levels)
         
         # Barra inferior decorativa
+        self._add_decoration(slide, "footer_bar")
+    
+    def _write_bullets(self, text_frame, bullets, levels=None):
+        """Escribe las viñetas con la API de python-pptx"""
+        for i, bullet in enumerate(bullets):
+            if i > 0:
+                text_frame.add_paragraph()
+            
+            level = levels[i] if levels else 0
+            p = text_frame.paragraphs[i]
+            p.text = bullet
+            p.level = level
+            p.font.size = Pt(self.BULLET_FONT_PT)
+            p.font.color.rgb = self.colors["text"]
+            p.space_before = Pt(self.BULLET_SPACING_PT)
+            p.space_after = Pt(self.BULLET_SPACING_PT)
+            
+            # Agregar viñeta personalizada
+            p.font.bold = False
+            
+            # Icono de viñeta (bullet point)
+            run = p.runs[0]
+            prefix = self.SUB_BULLET_PREFIX if level else self.BULLET_PREFIX
+            run.text = f"{prefix}{bullet}"
+            run.font.color.rgb = self.colors["secondary"]
+    
+    @staticmethod
+    def _can_write_bullets_fast(bullets):
+        """
+        Indica si las viñetas pueden escribirse por la vía rápida
+        
+        Las viñetas vacías o con caracteres de control (que python-pptx
+        convierte en saltos de línea o escapa) usan la vía normal.
+        """
+        return all(bullet and not _CONTROL_CHARS.search(bullet) for bullet in bullets)
+    
+    def _write_bullets_fast(self, text_frame, bullets):
+        """
+        Escribe las viñetas generando directamente los elementos <a:p>
+        
+        Produce el mismo XML que _write_bullets, pero clona un párrafo
+        prearmado por tema en lugar de pasar por los objetos proxy de
+        python-pptx para cada propiedad.
+        """
+        template = self._get_bullet_template()
+        txBody = text_frame._txBody
+        
+        paragraphs = []
+        for bullet in bullets:
+            p = copy.deepcopy(template)
+            p[-1][-1].text = f"{self.BULLET_PREFIX}{bullet}"  # <a:r><a:t>
+            paragraphs.append(p)
+        
+        # Reemplazar el párrafo vacío que crea add_textbox()
+        for p in txBody.p_lst:
+            txBody.remove(p)
+        txBody.extend(paragraphs)
+    
+    def _get_bullet_template(self):
+        """Obtiene el párrafo <a:p> de viñeta del tema actual (se arma una vez)"""
+        key = tuple(sorted(self.colors.items()))
+        template = _BULLET_TEMPLATE_CACHE.get(key)
+        if template is None:
+            spacing = self.BULLET_SPACING_PT * 100
+            template = parse_xml(
+                f'<a:p {nsdecls("a")}>'
+                f'<a:pPr>'
+                f'<a:spcBef><a:spcPts val="{spacing}"/></a:spcBef>'
+                f'<a:spcAft><a:spcPts val="{spacing}"/></a:spcAft>'
+                f'<a:defRPr sz="{self.BULLET_FONT_PT * 100}" b="0">'
+                f'<a:solidFill><a:srgbClr val="{self.colors["text"]}"/></a:solidFill>'
+                f'</a:defRPr>'
+                f'</a:pPr>'
+                f'<a:r>'
+                f'<a:rPr><a:solidFill><a:srgbClr val="{self.colors["secondary"]}"/></a:solidFill></a:rPr>'
+                f'<a:t/>'
+                f'</a:r>'
+                f'</a:p>'
+            )
+            _BULLET_TEMPLATE_CACHE[key] = template
+        return template
+    
+    # ========== ELEMENTOS DECORATIVOS ==========
+    
+    def _add_decoration(self, slide, name):
+        """
+        Agrega un elemento decorativo (fondo, barras, línea) a la diapositiva
+        
+        Con la caché activada se clona el XML prearmado del tema; si no,
+        se dibuja con python-pptx mediante el método _draw_<name>.
+        
+        Args:
+            slide: Diapositiva destino
+            name: Nombre del elemento (ver _DECORATIONS)
+        """
+        if not self.cache_skeletons:
+            getattr(self, f"_draw_{name}")(slide)
+            return
+        
+        element = copy.deepcopy(self._get_skeleton()[name])
+        sp_tree = slide.shapes._spTree
+        
+        if element.tag == qn('p:bg'):
+            sp_tree.addprevious(element)
+            return
+        
+        # Mantener ids y nombres únicos como lo haría add_shape()
+        shape_id = slide.shapes._next_shape_id
+        c_nv_pr = element.nvSpPr.cNvPr
+        c_nv_pr.id = shape_id
+        c_nv_pr.name = f"Rectangle {shape_id - 1}"
+        sp_tree.append(element)
+    
+    def _get_skeleton(self):
+        """
+        Obtiene el XML decorativo del tema actual, construyéndolo una sola vez
+        
+        Returns:
+            dict: Elementos XML por nombre de decoración
+        """
+        key = tuple(sorted(self.colors.items()))
+        skeleton = _SKELETON_CACHE.get(key)
+        if skeleton is None:
+            scratch = Presentation()
+            layout = scratch.slide_layouts[6]
+            skeleton = {}
+            for name in self._DECORATIONS:
+                slide = scratch.slides.add_slide(layout)
+                getattr(self, f"_draw_{name}")(slide)
+                if name.endswith("background"):
+                    skeleton[name] = slide._element.cSld.bg
+                else:
+                    skeleton[name] = slide.shapes._spTree[-1]
+            _SKELETON_CACHE[key] = skeleton
+        return skeleton
+    
+    def _draw_title_background(self, slide):
+        """Fondo de la portada"""
+        fill = slide.background.fill
+        fill.solid()
+        fill.fore_color.rgb = self.colors["primary"]
+    
+    def _draw_content_background(self, slide):
+        """Fondo de las diapositivas de contenido"""
+        fill = slide.background.fill
+        fill.solid()
+        fill.fore_color.rgb = self.colors["bg_content"]
+    
+    def _draw_accent_line(self, slide):
+        """Línea decorativa bajo el título de la portada"""
+        line = slide.shapes.add_shape(
+            1,  # Rectángulo
+            Inches(3.5), Inches(4.2),
+            Inches(3), Inches(0.05)
+        )
+        line.fill.solid()
+        line.fill.fore_color.rgb = self.colors["accent"]
+        line.line.fill.background()
+    
+    def _draw_header_bar(self, slide):
+        """Barra superior de las diapositivas de contenido"""
+        header_shape = slide.shapes.add_shape(
+            1,  # Rectángulo
+            Inches(0), Inches(0),
+            Inches(10), Inches(0.8)
+        )
+        header_shape.fill.solid()
+        header_shape.fill.fore_color.rgb = self.colors["primary"]
+        header_shape.line.fill.background()
+    
+    def _draw_footer_bar(self, slide):
+        """Barra inferior de las diapositivas de contenido"""
         footer_shape = slide.shapes.add_shape(
             1,  # Rectángulo
             Inches(0), Inches(7.2),
@@ -319,8 +798,35 @@ def create_pptx_from_structure(structure, out="output.pptx"):
     print("Saved:", out)
 
 
+def main(argv=None):
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Convierte un archivo de texto estructurado a PowerPoint")
+    parser.add_argument("input", help="Archivo de texto en formato SLIDE N:")
+    parser.add_argument("output", help="Archivo .pptx de salida")
+    parser.add_argument("--theme", default="modern_blue", help="Tema de colores")
+    parser.add_argument("--paginate", action="store_true",
+                        help="Dividir las diapositivas que desbordan en continuaciones \"(cont.)\"")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reutilizar las diapositivas sin cambios del .pptx existente")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="Guardar la duración de cada etapa en un archivo JSON")
+    args = parser.parse_args(argv)
+
+    recorder = ProfileRecorder() if args.profile else None
+    converter = TextToPptxConverter(theme=args.theme, auto_paginate=args.paginate,
+                                    fast_bullets=True, observer=recorder)
+    converter.convert(args.input, args.output, incremental=args.incremental)
+
+    if recorder:
+        recorder.save(args.profile)
+        print(f"Perfil guardado: {args.profile}")
+    return 0
+
+
 # ejemplo de uso
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(main())
     sample = [
         {"title":"Slide 1", "bullets":["Punto A", "Punto B"]},
         {"title":"Slide 2", "bullets":["Otro punto"]}
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# scripts/themes.py
+"""
+Registro de temas de colores para las presentaciones
+
+Los temas integrados se construyen una sola vez, en el primer uso, como
+objetos inmutables (listar los nombres no importa python-pptx). Se pueden
+agregar temas propios con archivos JSON o TOML en la carpeta themes/ del
+proyecto o en las carpetas indicadas en la variable de entorno
+PPTX_THEMES_PATH (separadas por os.pathsep). Cada archivo se parsea una sola
+vez y solo se vuelve a leer si cambia su fecha de modificación. Un archivo
+que no se puede leer o un tema con colores inválidos se ignoran con un
+aviso; el error solo se lanza al pedir uno de esos temas.
+
+Formato de un archivo de temas (JSON):
+    {
+        "corporativo": {
+            "primary": "#003366", "secondary": "#0072BC", "accent": "#FFB900",
+            "text": "#333333", "bg_title": "#F2F2F2", "bg_content": "#FFFFFF"
+        }
+    }
+
+Los colores pueden escribirse como "#RRGGBB" o como lista [r, g, b].
+"""
+import json
+import os
+import threading
+from types import MappingProxyType
+
+
+# Claves de color que debe definir todo tema
+THEME_KEYS = ("primary", "secondary", "accent", "text", "bg_title", "bg_content")
+
+# Extensiones de archivo de temas soportadas
+THEME_FILE_EXTENSIONS = (".json", ".toml")
+
+# Carpeta de temas propios del proyecto
+DEFAULT_THEMES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "themes")
+
+_BUILTIN_THEMES = {
+    "modern_blue": {
+        "primary": (41, 128, 185),      # Azul moderno
+        "secondary": (52, 152, 219),    # Azul claro
+        "accent": (46, 204, 113),       # Verde
+        "text": (44, 62, 80),           # Gris oscuro
+        "bg_title": (236, 240, 241),    # Gris muy claro
+        "bg_content": (255, 255, 255)   # Blanco
+    },
+    "dark": {
+        "primary": (41, 128, 185),
+        "secondary": (142, 68, 173),    # Púrpura
+        "accent": (230, 126, 34),       # Naranja
+        "text": (236, 240, 241),        # Texto claro
+        "bg_title": (44, 62, 80),       # Fondo oscuro
+        "bg_content": (52, 73, 94)      # Fondo medio
+    },
+    "professional": {
+        "primary": (51, 51, 51),        # Gris oscuro
+        "secondary": (0, 114, 188),     # Azul corporativo
+        "accent": (255, 185, 0),        # Dorado
+        "text": (51, 51, 51),
+        "bg_title": (242, 242, 242),
+        "bg_content": (255, 255, 255)
+    },
+    "vibrant": {
+        "primary": (231, 76, 60),       # Rojo
+        "secondary": (155, 89, 182),    # Púrpura
+        "accent": (241, 196, 15),       # Amarillo
+        "text": (44, 62, 80),
+        "bg_title": (236, 240, 241),
+        "bg_content": (255, 255, 255)
+    }
+}
+
+
+def _parse_color(value, where):
+    """Convierte "#RRGGBB" o [r, g, b] en RGBColor"""
+    from pptx.dml.color import RGBColor
+
+    if isinstance(value, str):
+        hex_value = value.lstrip("#")
+        if len(hex_value) != 6:
+            raise ValueError(f"Color inválido en {where}: {value!r}")
+        return RGBColor.from_string(hex_value.upper())
+    if isinstance(value, (list, tuple)) and len(value) == 3:
+        if not all(isinstance(c, int) and 0 <= c <= 255 for c in value):
+            raise ValueError(f"Color inválido en {where}: {value!r}")
+        return RGBColor(*value)
+    raise ValueError(f"Color inválido en {where}: {value!r}")
+
+
+def make_theme(colors, where="tema"):
+    """
+    Construye un tema inmutable a partir de un diccionario de colores
+
+    Args:
+        colors: Diccionario con las claves de THEME_KEYS
+        where: Descripción del origen, para los mensajes de error
+
+    Returns:
+        MappingProxyType: Mapeo de solo lectura clave -> RGBColor
+    """
+    if not isinstance(colors, dict):
+        raise ValueError(f"El {where} debe ser un objeto con colores")
+    missing = [key for key in THEME_KEYS if key not in colors]
+    if missing:
+        raise ValueError(f"Faltan colores en {where}: {', '.join(missing)}")
+    return MappingProxyType({
+        key: _parse_color(colors[key], f"{where}.{key}") for key in THEME_KEYS
+    })
+
+
+def _load_theme_file(path):
+    """
+    Parsea un archivo de temas JSON o TOML
+
+    Returns:
+        dict: Temas del archivo por nombre; los temas inválidos quedan como
+            la excepción ValueError que se lanzará al pedirlos
+
+    Raises:
+        ValueError, OSError: Si el archivo no se puede leer o parsear
+    """
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError(
+                    f"No se puede leer {path}: los temas TOML requieren Python 3.11+ o el paquete tomli"
+                )
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    if not isinstance(data, dict):
+        raise ValueError(f"El archivo de temas {path} debe contener un objeto")
+
+    themes = {}
+    for name, colors in data.items():
+        try:
+            themes[name] = make_theme(colors, f"{os.path.basename(path)}:{name}")
+        except ValueError as e:
+            print(f"⚠️  Tema ignorado: {e}")
+            themes[name] = e
+    return themes
+
+
+class ThemeRegistry:
+    """Registro de temas integrados y temas cargados desde archivos"""
+
+    def __init__(self, search_paths=None):
+        """
+        Inicializa el registro
+
+        Args:
+            search_paths: Carpetas o archivos adicionales donde buscar temas
+        """
+        self._lock = threading.Lock()
+        # Se construyen en el primer get(): RGBColor importa python-pptx
+        self._builtin = None
+        self._search_paths = list(search_paths or [])
+        # Caché de archivos parseados: ruta -> (mtime, temas)
+        self._file_cache = {}
+
+    def add_path(self, path):
+        """Agrega una carpeta o archivo de temas a la búsqueda"""
+        with self._lock:
+            if path not in self._search_paths:
+                self._search_paths.append(path)
+
+    def get(self, name):
+        """
+        Obtiene un tema por nombre
+
+        Raises:
+            ValueError: Si el tema no existe
+        """
+        themes = self._all_themes()
+        theme = themes.get(name)
+        if isinstance(theme, ValueError):
+            raise theme
+        if theme is None:
+            available = [n for n, t in themes.items() if not isinstance(t, ValueError)]
+            raise ValueError(
+                f"Tema desconocido: {name!r}. Temas disponibles: {', '.join(available)}"
+            )
+        return theme
+
+    def names(self):
+        """Lista los nombres de tema disponibles (integrados primero, sin los inválidos)"""
+        themes = self._all_themes(build_builtin=False)
+        return [name for name, theme in themes.items() if not isinstance(theme, ValueError)]
+
+    def _theme_files(self):
+        """Lista los archivos de temas de las rutas de búsqueda"""
+        paths = list(self._search_paths)
+        env_paths = os.getenv("PPTX_THEMES_PATH")
+        if env_paths:
+            paths.extend(p for p in env_paths.split(os.pathsep) if p)
+
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                for entry in sorted(os.listdir(path)):
+                    if entry.endswith(THEME_FILE_EXTENSIONS):
+                        files.append(os.path.join(path, entry))
+            elif os.path.isfile(path):
+                files.append(path)
+        return files
+
+    def _all_themes(self, build_builtin=True):
+        """
+        Combina temas integrados y de archivos (los de archivo tienen prioridad)
+
+        Args:
+            build_builtin: False para obtener solo los nombres de los temas
+                integrados (sus valores quedan en None)
+        """
+        with self._lock:
+            if build_builtin and self._builtin is None:
+                self._builtin = {
+                    name: make_theme(colors, f"tema {name}")
+                    for name, colors in _BUILTIN_THEMES.items()
+                }
+            themes = dict(self._builtin) if build_builtin else dict.fromkeys(_BUILTIN_THEMES)
+            for path in self._theme_files():
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    continue  # se borró mientras se listaba la carpeta
+                cached = self._file_cache.get(path)
+                if cached is None or cached[0] != mtime:
+                    try:
+                        file_themes = _load_theme_file(path)
+                    except (ValueError, OSError) as e:
+                        # Un archivo roto no impide usar los demás temas; no
+                        # se vuelve a avisar hasta que cambie
+                        print(f"⚠️  Archivo de temas ignorado: {path} ({e})")
+                        file_themes = {}
+                    cached = (mtime, file_themes)
+                    self._file_cache[path] = cached
+                themes.update(cached[1])
+        return themes
+
+
+# Registro compartido por la GUI, la CLI y los convertidores
+registry = ThemeRegistry([DEFAULT_THEMES_DIR])
+
+
+def get_theme(name):
+    """Obtiene un tema del registro compartido"""
+    return registry.get(name)
+
+
+def available_themes():
+    """Lista los temas disponibles en el registro compartido"""
+    return registry.names()
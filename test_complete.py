@@ -139,6 +139,1237 @@ def test_latex_to_pptx():
         return False
 
 
+def test_fast_bullets_xml():
+    """Prueba offline: la vía rápida de viñetas genera el mismo XML"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: XML de viñetas (vía rápida vs python-pptx)")
+    print("="*60)
+    
+    import io
+    from lxml import etree
+    from pptx import Presentation
+    
+    content = (
+        "SLIDE 1: Portada\n- Subtítulo\n\n"
+        "SLIDE 2: Contenido\n- Primera viñeta\n- Texto con & < > \" y acentos: áéíóú ñ\n"
+        "- Una viñeta bastante más larga que ocupa varias líneas en el cuadro de texto\n\n"
+        "SLIDE 3: Sin viñetas\n"
+    )
+    
+    try:
+        for theme in ["modern_blue", "dark", "professional", "vibrant"]:
+            slow = TextToPptxConverter(theme=theme).convert_text(content)
+            fast = TextToPptxConverter(theme=theme, fast_bullets=True).convert_text(content)
+            
+            slow_xml = [etree.tostring(s._element) for s in Presentation(io.BytesIO(slow)).slides]
+            fast_xml = [etree.tostring(s._element) for s in Presentation(io.BytesIO(fast)).slides]
+            
+            if slow_xml != fast_xml:
+                print(f"❌ El XML difiere con el tema {theme}")
+                return False
+        
+        print("✅ XML idéntico en todos los temas")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_concurrent_pdf_conversions():
+    """Prueba offline: dos conversiones PDF simultáneas en el mismo directorio"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Conversiones PDF simultáneas en un directorio")
+    print("="*60)
+    
+    import io
+    import shutil
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+    from PIL import Image
+    from pptx import Presentation
+    
+    colors = {"rojo.pptx": (200, 30, 30), "azul.pptx": (30, 30, 200)}
+    cwd = os.getcwd()
+    
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)
+            try:
+                def convert(name):
+                    pages = [Image.new("RGB", (320, 240), colors[name]) for _ in range(6)]
+                    if shutil.which("pdftoppm"):
+                        # Con poppler: ruta completa PDF -> PPTX
+                        pdf_file = name.replace(".pptx", ".pdf")
+                        pages[0].save(pdf_file, "PDF", save_all=True, append_images=pages[1:])
+                        LatexToPptxConverter(dpi=50, workers=1).convert(pdf_file, name)
+                    else:
+                        LatexToPptxConverter()._pages_to_pptx(pages, name)
+                
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    list(executor.map(convert, colors))
+                
+                leftovers = [f for f in os.listdir(workdir) if f.endswith(".png")]
+                if leftovers:
+                    print(f"❌ Quedaron archivos temporales: {leftovers}")
+                    return False
+                
+                for name, color in colors.items():
+                    for slide in Presentation(name).slides:
+                        blob = slide.shapes[0].image.blob
+                        pixel = Image.open(io.BytesIO(blob)).convert("RGB").getpixel((10, 10))
+                        if max(abs(a - b) for a, b in zip(pixel, color)) > 8:
+                            print(f"❌ {name} contiene una página de la otra conversión")
+                            return False
+                
+                # convert_many reparte las CPUs entre las conversiones simultáneas
+                class RecordingConverter(LatexToPptxConverter):
+                    def convert(self, input_file, output_file, pages=None, progress=None):
+                        used_workers.append(self.workers)
+                
+                used_workers = []
+                inputs = [f"doc{n}.pdf" for n in range(4)]
+                RecordingConverter(workers=64).convert_many(inputs, workdir, jobs=4)
+                expected = max(1, (os.cpu_count() or 1) // 4)
+                if used_workers != [expected] * 4:
+                    print(f"❌ Trabajadores por conversión: {used_workers} (se esperaba {expected})")
+                    return False
+            finally:
+                os.chdir(cwd)
+        
+        print("✅ Cada presentación contiene solo sus propias páginas")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_native_beamer():
+    """Prueba offline: conversión nativa de beamer sin pdflatex"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Conversión nativa de beamer")
+    print("="*60)
+    
+    import tempfile
+    from pptx import Presentation
+    from scripts.beamer_parser import BeamerParseError, parse_beamer
+    
+    latex_file = "examples/presentation.tex"
+    
+    try:
+        with open(latex_file, "r", encoding="utf-8") as f:
+            source = f.read()
+        
+        structure = parse_beamer(source)
+        titles = [slide["title"] for slide in structure]
+        if titles != ["Demo: RPA para PPT", "Objetivo", "Paso 1", "Cierre"]:
+            print(f"❌ Títulos inesperados: {titles}")
+            return False
+        
+        nested = source.replace(
+            "\\item Compilar LaTeX",
+            "\\item Compilar LaTeX\n    \\begin{enumerate}\\item pdflatex\\end{enumerate}"
+        )
+        if parse_beamer(nested)[2].get("levels") != [0, 0, 1]:
+            print("❌ No se detectó la lista anidada")
+            return False
+        
+        # PowerPoint no tiene niveles de viñeta más allá del 8
+        too_deep = source.replace(
+            "\\item Compilar LaTeX",
+            "\\item Compilar LaTeX\n" + "\\begin{itemize}\\item x" * 9 + "\\end{itemize}" * 9
+        )
+        for unsupported in (source.replace("Gracias.", "$E = mc^2$"), too_deep):
+            try:
+                parse_beamer(unsupported)
+                print("❌ Se aceptó una construcción no soportada")
+                return False
+            except BeamerParseError:
+                pass
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            output_file = os.path.join(workdir, "presentation_native.pptx")
+            LatexToPptxConverter(native_beamer=True).convert(latex_file, output_file)
+            num_slides = len(Presentation(output_file).slides)
+        if num_slides != 4:
+            print(f"❌ Se esperaban 4 diapositivas y hay {num_slides}")
+            return False
+        
+        print(f"✅ {num_slides} diapositivas editables sin pdflatex")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_page_ranges():
+    """Prueba offline: rasterizar solo un rango de páginas con progreso"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Rangos de páginas y progreso")
+    print("="*60)
+    
+    import shutil
+    import tempfile
+    from PIL import Image
+    from pptx import Presentation
+    from scripts.latex_to_pptx import parse_page_ranges, resolve_page_ranges
+    
+    try:
+        ranges = parse_page_ranges("10-, 2-3, 3")
+        rendered = []
+        progress = []
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            output_file = os.path.join(workdir, "rango.pptx")
+            converter = LatexToPptxConverter(dpi=50, workers=2, window=4)
+            
+            if shutil.which("pdftoppm"):
+                # Con poppler: PDF real de 12 páginas
+                pages = [Image.new("RGB", (320, 240), (20 * i, 0, 0)) for i in range(12)]
+                pdf_file = os.path.join(workdir, "doce.pdf")
+                pages[0].save(pdf_file, "PDF", save_all=True, append_images=pages[1:])
+                # El rojo de cada página indica su número
+                rendered = [round(img.getpixel((5, 5))[0] / 20) + 1
+                            for img in converter.iter_pdf_pages(pdf_file, ranges)]
+                converter.convert(pdf_file, output_file, pages=ranges,
+                                  progress=lambda *args: progress.append(args))
+            else:
+                def fake_convert(pdf, first_page, last_page, **options):
+                    rendered.extend(range(first_page, last_page + 1))
+                    return [Image.new("RGB", (32, 24)) for _ in range(first_page, last_page + 1)]
+                
+                resolved = resolve_page_ranges(ranges, 12)
+                images = converter._iter_pages("doce.pdf", fake_convert, {"Pages": 12}, resolved)
+                converter._pages_to_pptx(images, output_file, total=5,
+                                         progress=lambda *args: progress.append(args))
+            
+            if rendered != [2, 3, 10, 11, 12]:
+                print(f"❌ Páginas rasterizadas inesperadas: {rendered}")
+                return False
+            if [args[:2] for args in progress] != [(n, 5) for n in range(1, 6)]:
+                print(f"❌ Progreso inesperado: {progress}")
+                return False
+            num_slides = len(Presentation(output_file).slides)
+            if num_slides != 5:
+                print(f"❌ Se esperaban 5 diapositivas y hay {num_slides}")
+                return False
+        
+        try:
+            resolve_page_ranges([(11, 14)], 12)
+            print("❌ Se aceptó un rango fuera del documento")
+            return False
+        except ValueError:
+            pass
+        
+        print("✅ Solo se rasterizaron las páginas pedidas, con progreso por página")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_response_cache():
+    """Prueba offline: caché de respuestas de la IA (sin llamar a la API)"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Caché de respuestas de la IA")
+    print("="*60)
+    
+    import tempfile
+    import time
+    from claude.response_cache import ResponseCache
+    
+    class FakeIntegration(ClaudeIntegration):
+        """Proveedor simulado que cuenta las llamadas a la API"""
+        
+        def __init__(self, cache):
+            self.provider = "gemini"
+            self.model = "modelo-prueba"
+            self.cache = cache
+            self.requests = 0
+        
+        def _request(self, prompt):
+            self.requests += 1
+            time.sleep(0.2)
+            return f"SLIDE 1: Respuesta {self.requests}\n- Viñeta"
+    
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            cache = ResponseCache(os.path.join(workdir, "respuestas.sqlite3"))
+            ai = FakeIntegration(cache)
+            
+            first = ai.generate_presentation_content("RPA", num_slides=3)
+            start = time.perf_counter()
+            second = ai.generate_presentation_content("RPA", num_slides=3)
+            hit_ms = (time.perf_counter() - start) * 1000
+            if second != first or ai.requests != 1:
+                print("❌ La segunda petición idéntica no salió de la caché")
+                return False
+            
+            ai.generate_presentation_content("RPA", num_slides=4)
+            refreshed = ai.generate_presentation_content("RPA", num_slides=3, refresh=True)
+            if ai.requests != 3 or refreshed == first:
+                print("❌ Otro número de slides o refresh=True no pidieron una respuesta nueva")
+                return False
+            if ai.generate_presentation_content("RPA", num_slides=3) != refreshed:
+                print("❌ refresh=True no reemplazó la respuesta guardada")
+                return False
+            
+            stats = cache.stats()
+            if (stats["hits"], stats["misses"], stats["entries"]) != (2, 2, 2):
+                print(f"❌ Estadísticas inesperadas: {stats}")
+                return False
+        
+        print(f"✅ Acierto de caché en {hit_ms:.1f} ms (2 llamadas a la API evitadas)")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_generate_many():
+    """Prueba offline: generate_many respeta el límite de concurrencia"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Generación asíncrona concurrente")
+    print("="*60)
+    
+    import asyncio
+    import time
+    
+    class FakeAsyncIntegration(ClaudeIntegration):
+        """Proveedor simulado: cada petición tarda 50 ms"""
+        
+        def __init__(self):
+            self.provider = "claude"
+            self.model = "modelo-prueba"
+            self.cache = None
+            self.in_flight = 0
+            self.max_in_flight = 0
+        
+        async def _arequest(self, prompt):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(0.05)
+                if "Falla" in prompt:
+                    raise RuntimeError("error simulado")
+                return prompt.split('"')[1]
+            finally:
+                self.in_flight -= 1
+    
+    async def generate_all(ai, topics, concurrency):
+        return [result async for result in ai.generate_many(topics, concurrency=concurrency)]
+    
+    try:
+        topics = [f"Tema {n}" for n in range(16)] + ["Falla"]
+        timings = {}
+        for concurrency in (1, 8):
+            ai = FakeAsyncIntegration()
+            start = time.perf_counter()
+            results = asyncio.run(generate_all(ai, topics, concurrency))
+            timings[concurrency] = time.perf_counter() - start
+            
+            if ai.max_in_flight != concurrency:
+                print(f"❌ Con concurrency={concurrency} hubo {ai.max_in_flight} peticiones a la vez")
+                return False
+            contents = {topic: content for topic, content, error in results if error is None}
+            errors = [topic for topic, _, error in results if error is not None]
+            if errors != ["Falla"] or any(contents[t] != t for t in topics[:-1]):
+                print(f"❌ Resultados inesperados: {results}")
+                return False
+        
+        if timings[8] * 3 > timings[1]:
+            print(f"❌ Sin aceleración: {timings[1]:.2f} s con 1, {timings[8]:.2f} s con 8")
+            return False
+        
+        # Gemini: el cliente asíncrono queda atado a su bucle, así que cada
+        # asyncio.run debe recibir uno propio; la caché corre fuera del bucle
+        import threading
+        from claude.client_registry import registry
+        
+        class FakeGeminiClient:
+            def __init__(self):
+                self.loop = asyncio.get_running_loop()
+            
+            async def generate_content_async(self, prompt):
+                if asyncio.get_running_loop() is not self.loop:
+                    raise RuntimeError("cliente usado en otro bucle de eventos")
+                return type("Response", (), {"text": prompt.split('"')[1]})()
+        
+        class ThreadRecordingCache:
+            def __init__(self):
+                self.threads = set()
+            
+            def key(self, *args):
+                return "clave"
+            
+            def get(self, key):
+                self.threads.add(threading.get_ident())
+            
+            def put(self, key, content, **metadata):
+                self.threads.add(threading.get_ident())
+        
+        class FakeGeminiIntegration(ClaudeIntegration):
+            """Gemini con el _arequest real y el cliente del registro simulado"""
+            
+            def __init__(self):
+                self.provider = "gemini"
+                self.api_key = "clave-prueba"
+                self.model = "modelo-prueba"
+                self.cache = ThreadRecordingCache()
+        
+        gemini = FakeGeminiIntegration()
+        created = []
+        original_create_async = registry._create_async
+        registry._create_async = lambda *args: created.append(FakeGeminiClient()) or created[-1]
+        try:
+            for _ in range(2):
+                results = asyncio.run(generate_all(gemini, topics[:4], 2))
+                if any(error is not None for _, _, error in results):
+                    print(f"❌ Gemini falló en un segundo bucle de eventos: {results}")
+                    return False
+        finally:
+            registry._create_async = original_create_async
+            registry.clear()
+        if len(created) != 2:
+            print(f"❌ Se esperaba un cliente de Gemini por bucle y hubo {len(created)}")
+            return False
+        if threading.get_ident() in gemini.cache.threads:
+            print("❌ La caché se consultó dentro del bucle de eventos")
+            return False
+        
+        print(f"✅ 17 temas: {timings[1]:.2f} s con concurrency=1, {timings[8]:.2f} s con 8")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_streaming_generation():
+    """Prueba offline: diapositivas en streaming y tiempo hasta la primera"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Generación en streaming")
+    print("="*60)
+    
+    import tempfile
+    import time
+    from pptx import Presentation
+    from claude.response_cache import ResponseCache
+    from scripts.generate_presentation import generate_presentation
+    from scripts.text_to_pptx import iter_slides
+    
+    deck = "".join(
+        f"SLIDE {n}: Parte {n}\n- Idea A de la parte {n}\n- Idea B\n\n" for n in range(1, 7)
+    )
+    
+    class FakeStreamIntegration(ClaudeIntegration):
+        """Proveedor simulado que envía la respuesta en fragmentos de 7 caracteres"""
+        
+        def __init__(self, cache):
+            self.provider = "claude"
+            self.model = "modelo-prueba"
+            self.cache = cache
+            self.requests = 0
+        
+        def _request_stream(self, prompt):
+            self.requests += 1
+            for start in range(0, len(deck), 7):
+                time.sleep(0.005)
+                yield deck[start:start + 7]
+    
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            ai = FakeStreamIntegration(ResponseCache(os.path.join(workdir, "respuestas.sqlite3")))
+            output_file = os.path.join(workdir, "stream.pptx")
+            received = []
+            
+            stats = generate_presentation(ai, "Streaming", output_file,
+                                          on_slide=lambda number, slide: received.append(slide))
+            
+            if received != list(iter_slides(deck.split("\n"))):
+                print(f"❌ Las diapositivas en streaming no coinciden: {received}")
+                return False
+            if not stats["first_slide_s"] < stats["total_s"] / 3:
+                print(f"❌ La primera diapositiva llegó tarde: {stats}")
+                return False
+            if len(Presentation(output_file).slides) != 6:
+                print("❌ El PPTX no tiene las 6 diapositivas")
+                return False
+            
+            # La respuesta completa quedó en la caché: no se vuelve a pedir
+            if list(ai.stream_presentation_content("Streaming")) != [deck] or ai.requests != 1:
+                print("❌ La respuesta en streaming no se guardó en la caché")
+                return False
+        
+        print(f"✅ Primera diapositiva en {stats['first_slide_s'] * 1000:.0f} ms "
+              f"de {stats['total_s'] * 1000:.0f} ms totales")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_lazy_imports():
+    """Prueba offline: crear la integración y abrir la GUI no importan los SDK de IA"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Importaciones diferidas")
+    print("="*60)
+    
+    import subprocess
+    
+    code = (
+        "import sys\n"
+        "from claude.claude_integration import ClaudeIntegration\n"
+        "ai = ClaudeIntegration(provider='auto')\n"
+        "import gui_app\n"
+        "loaded = [m for m in ('anthropic', 'google.generativeai', 'pptx') if m in sys.modules]\n"
+        "print(ai.provider, ','.join(loaded))\n"
+    )
+    env = dict(os.environ, GEMINI_API_KEY="prueba")
+    
+    try:
+        result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                env=env, capture_output=True, text=True, timeout=60)
+        if result.returncode != 0:
+            if "customtkinter" in result.stderr or "tkinter" in result.stderr:
+                print("⚠️  Prueba omitida: la GUI necesita customtkinter/tkinter")
+                return True
+            print(f"❌ Error en el subproceso: {result.stderr.strip()}")
+            return False
+        
+        provider, _, loaded = result.stdout.strip().splitlines()[-1].partition(" ")
+        if provider != "gemini":
+            print(f"❌ Proveedor detectado incorrecto: {provider}")
+            return False
+        if loaded:
+            print(f"❌ Se importaron al arrancar: {loaded}")
+            return False
+        
+        print("✅ Ni los SDK de IA ni python-pptx se importan al arrancar")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_shared_clients():
+    """Prueba offline: las integraciones comparten cliente y conexiones keep-alive"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Clientes compartidos")
+    print("="*60)
+    
+    import threading
+    from benchmarks.fake_provider import FakeProvider
+    from claude import client_registry
+    from claude.claude_integration import ask_claude
+    
+    try:
+        import anthropic  # noqa: F401
+    except ImportError:
+        print("⚠️  Prueba omitida: necesita el SDK de anthropic")
+        return True
+    
+    saved_env = {name: os.environ.get(name) for name in ("ANTHROPIC_BASE_URL", "ANTHROPIC_API_KEY")}
+    try:
+        with FakeProvider(latency=0.0) as provider:
+            os.environ["ANTHROPIC_BASE_URL"] = provider.url
+            os.environ["ANTHROPIC_API_KEY"] = "prueba"
+            client_registry.registry.clear()
+            
+            # Muchas integraciones y llamadas legacy seguidas: una sola conexión
+            integrations = [ClaudeIntegration(provider="claude", api_key="prueba") for _ in range(10)]
+            for ai in integrations:
+                ai.generate_presentation_content("Conexiones", num_slides=2)
+            for _ in range(3):
+                ask_claude('Presentación sobre "Legacy" con 2 diapositivas')
+            
+            if any(ai.client is not integrations[0].client for ai in integrations):
+                print("❌ Las integraciones no comparten el cliente")
+                return False
+            if provider.requests != 13 or provider.connections != 1:
+                print(f"❌ {provider.requests} peticiones abrieron {provider.connections} conexiones")
+                return False
+            
+            # Desde hilos, con un pool de 3 conexiones
+            client_registry.configure_pool(max_connections=3)
+            provider.latency = 0.05
+            provider.max_in_flight = 0
+            before = provider.connections
+            errors = []
+            
+            def worker():
+                try:
+                    ai = ClaudeIntegration(provider="claude", api_key="prueba")
+                    for _ in range(2):
+                        ai.generate_presentation_content("Hilos", num_slides=2)
+                except Exception as e:
+                    errors.append(e)
+            
+            threads = [threading.Thread(target=worker) for _ in range(12)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            new_connections = provider.connections - before
+            if errors:
+                print(f"❌ Error en un hilo: {errors[0]}")
+                return False
+            if new_connections > 3 or provider.max_in_flight > 3:
+                print(f"❌ El pool de 3 conexiones abrió {new_connections} "
+                      f"({provider.max_in_flight} peticiones a la vez)")
+                return False
+        
+        print(f"✅ 13 peticiones por 1 conexión; 24 desde 12 hilos por {new_connections} "
+              f"(pool de 3)")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    
+    finally:
+        client_registry.configure_pool(max_connections=client_registry.DEFAULT_MAX_CONNECTIONS)
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def test_duplicate_output_names():
+    """Prueba offline: entradas con el mismo nombre en carpetas distintas no se pisan"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Nombres de salida repetidos")
+    print("="*60)
+    
+    import tempfile
+    from pptx import Presentation
+    from scripts.batch_convert import convert_batch
+    
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            for folder, name in (("a", "x"), ("b", "x"), ("c", "y")):
+                os.makedirs(os.path.join(workdir, folder), exist_ok=True)
+                with open(os.path.join(workdir, folder, f"{name}.txt"), "w", encoding="utf-8") as f:
+                    f.write(f"SLIDE 1: {folder}/{name}\n- Viñeta\n")
+            output_dir = os.path.join(workdir, "salida")
+            
+            result = convert_batch(os.path.join(workdir, "**", "*.txt"), output_dir, jobs=2)
+            failed = sorted(os.path.relpath(item["input"], workdir) for item in result["errors"])
+            if failed != [os.path.join("a", "x.txt"), os.path.join("b", "x.txt")]:
+                print(f"❌ Errores inesperados del lote: {result['errors']}")
+                return False
+            if result["files"] != 1 or os.path.exists(os.path.join(output_dir, "x.pptx")):
+                print(f"❌ Se convirtieron archivos con nombre repetido: {result['converted']}")
+                return False
+            Presentation(os.path.join(output_dir, "y.pptx"))
+            
+            # Lo mismo en convert_many (x.tex y x.pdf también chocan)
+            pdf_dir = os.path.join(workdir, "pdf")
+            os.makedirs(pdf_dir)
+            inputs = [os.path.join(workdir, "a", "x.tex"), os.path.join(pdf_dir, "x.pdf")]
+            result = LatexToPptxConverter().convert_many(inputs, output_dir)
+            if result["converted"] or sorted(item["input"] for item in result["errors"]) != sorted(inputs):
+                print(f"❌ convert_many no detectó el nombre repetido: {result}")
+                return False
+            if "repetido" not in result["errors"][0]["error"]:
+                print(f"❌ Mensaje de error inesperado: {result['errors'][0]['error']}")
+                return False
+        
+        print("✅ Las entradas con el mismo nombre se reportan como errores")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_scratch_cleanup_on_error():
+    """Prueba offline: el directorio de trabajo se borra aunque falle el rasterizado"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Limpieza del directorio de trabajo tras un error")
+    print("="*60)
+    
+    import tempfile
+    
+    class FailingRasterizer(LatexToPptxConverter):
+        """Compilación simulada seguida de un rasterizado que falla"""
+        
+        def _get_pdf(self, tex_file):
+            scratch_dir = tempfile.mkdtemp(prefix="latex_", dir=self.scratch_root)
+            pdf_file = os.path.join(scratch_dir, "documento.pdf")
+            for name in ("documento.pdf", "documento.aux", "documento.log"):
+                open(os.path.join(scratch_dir, name), "w").close()
+            return pdf_file, True
+        
+        def _pdf_to_pptx(self, pdf_file, output_file, pages=None, progress=None):
+            raise RuntimeError("poppler no disponible")
+    
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            scratch_root = os.path.join(workdir, "scratch")
+            os.makedirs(scratch_root)
+            tex_file = os.path.join(workdir, "documento.tex")
+            open(tex_file, "w").close()
+            
+            try:
+                FailingRasterizer(scratch_root=scratch_root).convert(
+                    tex_file, os.path.join(workdir, "salida.pptx"))
+                print("❌ El error del rasterizado no se propagó")
+                return False
+            except RuntimeError:
+                pass
+            
+            if os.listdir(scratch_root):
+                print(f"❌ Quedó el directorio de trabajo: {os.listdir(scratch_root)}")
+                return False
+        
+        print("✅ El directorio de trabajo se eliminó y el error se propagó")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_broken_theme_files():
+    """Prueba offline: un archivo de temas inválido no impide usar los demás"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Archivos de temas inválidos")
+    print("="*60)
+    
+    import json
+    import tempfile
+    from scripts.themes import ThemeRegistry
+    
+    colors = {"primary": "#003366", "secondary": "#0072BC", "accent": "#FFB900",
+              "text": "#333333", "bg_title": "#F2F2F2", "bg_content": "#FFFFFF"}
+    
+    try:
+        with tempfile.TemporaryDirectory() as themes_dir:
+            with open(os.path.join(themes_dir, "a_roto.json"), "w", encoding="utf-8") as f:
+                f.write("{ no es json")
+            with open(os.path.join(themes_dir, "b_temas.json"), "w", encoding="utf-8") as f:
+                json.dump({"corporativo": colors, "incompleto": {"primary": "#000000"}}, f)
+            
+            registry = ThemeRegistry([themes_dir])
+            names = registry.names()
+            if names[:4] != ["modern_blue", "dark", "professional", "vibrant"] or \
+                    "corporativo" not in names or "incompleto" in names:
+                print(f"❌ Nombres de tema inesperados: {names}")
+                return False
+            if str(registry.get("corporativo")["primary"]) != "003366":
+                print("❌ El tema válido del archivo no se cargó")
+                return False
+            registry.get("modern_blue")
+            
+            try:
+                registry.get("incompleto")
+                print("❌ El tema incompleto no lanzó error")
+                return False
+            except ValueError as e:
+                if "Faltan colores" not in str(e):
+                    print(f"❌ Mensaje de error inesperado: {e}")
+                    return False
+        
+        print("✅ Los temas válidos se usan y el inválido falla solo al pedirlo")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_pdf_bytes_temp_file():
+    """Prueba offline: un PDF en memoria se escribe a disco una sola vez"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: PDF en memoria con un solo archivo temporal")
+    print("="*60)
+    
+    import io
+    import tempfile
+    from PIL import Image
+    from pptx import Presentation
+    import scripts.latex_to_pptx as latex_to_pptx
+    
+    pdf_bytes = b"%PDF-1.4 contenido simulado"
+    calls = []
+    
+    def fake_pdfinfo(pdf_path):
+        calls.append(("info", pdf_path, open(pdf_path, "rb").read()))
+        return {"Pages": 12}
+    
+    def fake_convert(pdf_path, first_page, last_page, **options):
+        calls.append(("convert", pdf_path, open(pdf_path, "rb").read()))
+        return [Image.new("RGB", (32, 24)) for _ in range(first_page, last_page + 1)]
+    
+    originals = latex_to_pptx.pdfinfo_from_path, latex_to_pptx.convert_from_path
+    latex_to_pptx.pdfinfo_from_path, latex_to_pptx.convert_from_path = fake_pdfinfo, fake_convert
+    try:
+        with tempfile.TemporaryDirectory() as scratch_root:
+            converter = LatexToPptxConverter(workers=4, window=8, scratch_root=scratch_root)
+            pptx_bytes = converter.convert_pdf_bytes(pdf_bytes)
+            
+            paths = {path for _, path, _ in calls}
+            converts = sum(1 for kind, _, _ in calls if kind == "convert")
+            if len(paths) != 1 or any(content != pdf_bytes for _, _, content in calls):
+                print(f"❌ pdfinfo y los bloques no leyeron el mismo archivo: {paths}")
+                return False
+            if converts < 2:
+                print(f"❌ Se esperaban varios bloques de páginas y hubo {converts}")
+                return False
+            if os.listdir(scratch_root):
+                print(f"❌ Quedó el archivo temporal: {os.listdir(scratch_root)}")
+                return False
+            if len(Presentation(io.BytesIO(pptx_bytes)).slides) != 12:
+                print("❌ El PPTX no tiene las 12 páginas")
+                return False
+        
+        print(f"✅ 1 archivo temporal para pdfinfo y {converts} bloques de páginas")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    
+    finally:
+        latex_to_pptx.pdfinfo_from_path, latex_to_pptx.convert_from_path = originals
+
+
+def test_incremental_pathlib():
+    """Prueba offline: el modo incremental acepta pathlib.Path como salida"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Salida incremental con pathlib.Path")
+    print("="*60)
+    
+    import tempfile
+    from pathlib import Path
+    from pptx import Presentation
+    
+    content = "SLIDE 1: Portada\n- Subtítulo\n\nSLIDE 2: Contenido\n- Viñeta\n"
+    
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            output_file = Path(workdir) / "salida.pptx"
+            converter = TextToPptxConverter()
+            converter.write_text(content, output_file, incremental=True)
+            converter.write_text(content.replace("Viñeta", "Otra viñeta"), output_file, incremental=True)
+            
+            if not Path(f"{output_file}.manifest.json").exists():
+                print("❌ No se guardó el manifiesto de la salida incremental")
+                return False
+            if len(Presentation(str(output_file)).slides) != 2:
+                print("❌ El PPTX incremental no tiene las 2 diapositivas")
+                return False
+        
+        print("✅ Conversión incremental con pathlib.Path")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_mixed_page_sizes():
+    """Prueba offline: cada página se escala según su propio tamaño"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: PDF con páginas de distinto tamaño")
+    print("="*60)
+    
+    import io
+    from PIL import Image
+    from pptx import Presentation
+    from scripts.latex_to_pptx import page_size_pts, page_sizes_pts
+    
+    # Página 1 en 16:9 (beamer) y página 2 en 4:3, como las da pdfinfo -f/-l
+    info = {"Pages": 2, "Page    1 size": "480 x 270 pts", "Page    2 size": "720 x 540 pts"}
+    
+    try:
+        if page_sizes_pts(info) != {1: (480.0, 270.0), 2: (720.0, 540.0)}:
+            print(f"❌ Tamaños por página inesperados: {page_sizes_pts(info)}")
+            return False
+        
+        calls = []
+        
+        def fake_convert(pdf, first_page, last_page, size):
+            calls.append((first_page, last_page, size))
+            images = []
+            for page in range(first_page, last_page + 1):
+                # Como pdftoppm: el lado no fijado conserva la proporción de la página
+                width, height = page_sizes_pts(info)[page]
+                scale = size[0] / width if size[0] else size[1] / height
+                images.append(Image.new("RGB", (round(width * scale), round(height * scale))))
+            return images
+        
+        converter = LatexToPptxConverter(workers=1, target_resolution=(1920, 1080))
+        
+        # Sin rango, pdfinfo solo da el tamaño de la primera página
+        import scripts.latex_to_pptx as latex_module
+        requested = []
+        
+        def fake_pdfinfo(pdf, first_page=None, last_page=None):
+            requested.append((first_page, last_page))
+            return dict(info) if first_page else {"Pages": 2, "Page size": "480 x 270 pts"}
+        
+        original_pdfinfo = latex_module.pdfinfo_from_path
+        latex_module.pdfinfo_from_path = fake_pdfinfo
+        try:
+            if converter._pdfinfo("mixto.pdf") != info or requested != [(None, None), (1, 2)]:
+                print(f"❌ No se pidió a pdfinfo el tamaño de cada página: {requested}")
+                return False
+        finally:
+            latex_module.pdfinfo_from_path = original_pdfinfo
+        
+        images = list(converter._iter_pages("mixto.pdf", fake_convert, info))
+        if calls != [(1, 1, (1920, None)), (2, 2, (None, 1080))]:
+            print(f"❌ Opciones de rasterizado inesperadas: {calls}")
+            return False
+        if [img.size for img in images] != [(1920, 1080), (1440, 1080)]:
+            print(f"❌ Tamaños rasterizados inesperados: {[img.size for img in images]}")
+            return False
+        
+        buffer = io.BytesIO()
+        converter._pages_to_pptx(images, buffer, page_size=page_size_pts(info))
+        prs = Presentation(buffer)
+        wide, narrow = (slide.shapes[0] for slide in prs.slides)
+        if (wide.left, wide.top, wide.width, wide.height) != (0, 0, prs.slide_width, prs.slide_height):
+            print("❌ La página 16:9 no ocupa todo el slide 16:9")
+            return False
+        # La página 4:3 se centra con su proporción, sin estirarse
+        if narrow.height != prs.slide_height or abs(narrow.width / narrow.height - 4 / 3) > 0.01:
+            print(f"❌ La página 4:3 se deformó: {narrow.width} x {narrow.height}")
+            return False
+        if narrow.left != (prs.slide_width - narrow.width) // 2:
+            print("❌ La página 4:3 no está centrada")
+            return False
+        
+        print("✅ Cada página se rasterizó y ubicó según su propia proporción")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_auto_pagination():
+    """Prueba offline: las viñetas que desbordan pasan a continuaciones (cont.)"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Paginación automática")
+    print("="*60)
+    
+    import io
+    from pptx import Presentation
+    from scripts.text_metrics import count_lines
+    
+    bullets = [f"Viñeta número {n} con texto suficiente para ocupar una línea" for n in range(1, 41)]
+    content = "SLIDE 1: Portada\n- Subtítulo\n\nSLIDE 2: Largo\n" + "".join(f"- {b}\n" for b in bullets)
+    
+    try:
+        converter = TextToPptxConverter(auto_paginate=True)
+        prs = Presentation(io.BytesIO(converter.convert_text(content)))
+        
+        titles = []
+        found = []
+        for slide in list(prs.slides)[1:]:
+            texts = [shape.text_frame for shape in slide.shapes if shape.has_text_frame]
+            titles.append(texts[1].text)
+            found.extend(p.text[len(converter.BULLET_PREFIX):] for p in texts[2].paragraphs)
+        
+        continuations = titles.count("Largo" + converter.CONTINUATION_SUFFIX)
+        if titles[0] != "Largo" or continuations < 2 or continuations != len(titles) - 1:
+            print(f"❌ Títulos inesperados: {titles}")
+            return False
+        if found != bullets:
+            print("❌ Las viñetas no aparecen exactamente una vez y en orden")
+            return False
+        
+        # Un ancho nulo o negativo no debe dejar el cálculo en un bucle infinito
+        if count_lines("palabra", 0) < 1 or count_lines("dos palabras", -2.5) < 2:
+            print("❌ count_lines con ancho no positivo")
+            return False
+        
+        print(f"✅ 40 viñetas repartidas en 1 + {continuations} diapositivas \"(cont.)\"")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_latex_cache():
+    """Prueba offline: claves, expulsión LRU y estadísticas de la caché de LaTeX"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Caché de compilación de LaTeX")
+    print("="*60)
+    
+    import tempfile
+    from scripts.latex_cache import LatexCache
+    
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            tex_file = os.path.join(workdir, "main.tex")
+            part_file = os.path.join(workdir, "parte.tex")
+            with open(tex_file, "w", encoding="utf-8") as f:
+                f.write("\\documentclass{beamer}\\begin{document}\\input{parte}\\end{document}\n")
+            with open(part_file, "w", encoding="utf-8") as f:
+                f.write("\\begin{frame}Uno\\end{frame}\n")
+            
+            cache = LatexCache(os.path.join(workdir, "cache"))
+            converter = LatexToPptxConverter(latex_cache=cache, scratch_root=workdir)
+            compiled = []
+            
+            def fake_compile(tex):
+                # Sin pdflatex: un "PDF" de 1000 bytes en un directorio propio
+                pdf_file = os.path.join(tempfile.mkdtemp(dir=workdir), "main.pdf")
+                with open(pdf_file, "wb") as f:
+                    f.write(b"%PDF" + b"0" * 996)
+                compiled.append(tex)
+                return pdf_file
+            
+            converter._compile = fake_compile
+            
+            converter._get_pdf(tex_file)
+            pdf_file, fresh = converter._get_pdf(tex_file)
+            if len(compiled) != 1 or fresh or not pdf_file.startswith(cache.cache_dir):
+                print("❌ El segundo pedido no salió de la caché")
+                return False
+            
+            # Cambiar una dependencia o el .tex principal cambia la clave
+            with open(part_file, "a", encoding="utf-8") as f:
+                f.write("\\begin{frame}Dos\\end{frame}\n")
+            converter._get_pdf(tex_file)
+            with open(tex_file, "a", encoding="utf-8") as f:
+                f.write("% comentario\n")
+            converter._get_pdf(tex_file)
+            if len(compiled) != 3:
+                print(f"❌ Se esperaban 3 compilaciones y hubo {len(compiled)}")
+                return False
+            if cache.key(tex_file, "pdflatex") == cache.key(tex_file, "xelatex"):
+                print("❌ La clave no depende del motor de LaTeX")
+                return False
+            
+            stats = cache.stats()
+            if (stats["hits"], stats["misses"], stats["hit_rate"], stats["bytes_saved"]) != (1, 3, 0.25, 1000):
+                print(f"❌ Estadísticas inesperadas: {stats}")
+                return False
+            
+            # LRU: con lugar para 2 PDF se expulsa el usado hace más tiempo
+            small = LatexCache(os.path.join(workdir, "lru"), max_bytes=2500)
+            source_pdf = fake_compile(tex_file)
+            for age, key in enumerate(["a", "b"]):
+                path = small.put(key, source_pdf)
+                os.utime(path, (1000 + age, 1000 + age))
+            small.get("a")  # "a" pasa a ser la más reciente
+            small.put("c", source_pdf)
+            kept = [key for key in "abc" if os.path.exists(small._pdf_path(key))]
+            if kept != ["a", "c"] or small.stats()["total_bytes"] > 2500:
+                print(f"❌ Expulsión LRU inesperada: quedan {kept}")
+                return False
+        
+        print("✅ Aciertos, claves por fuente/dependencia/motor, LRU y estadísticas")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_profile_stages():
+    """Prueba offline: --profile guarda las etapas con sus contadores"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Perfilado por etapas")
+    print("="*60)
+    
+    import json
+    import tempfile
+    from PIL import Image
+    from scripts import text_to_pptx
+    from scripts.instrumentation import ProfileRecorder
+    
+    content = "SLIDE 1: Portada\n- Subtítulo\n\nSLIDE 2: Dos\n- a\n- b\n\nSLIDE 3: Tres\n- c\n"
+    
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            input_file = os.path.join(workdir, "entrada.txt")
+            output_file = os.path.join(workdir, "salida.pptx")
+            profile_file = os.path.join(workdir, "perfil.json")
+            with open(input_file, "w", encoding="utf-8") as f:
+                f.write(content)
+            
+            text_to_pptx.main([input_file, output_file, "--profile", profile_file])
+            with open(profile_file, "r", encoding="utf-8") as f:
+                profile = json.load(f)
+            ends = {event["stage"]: event for event in profile["events"] if event["event"] == "end"}
+            
+            if list(ends) != ["parse", "build", "save"] or set(profile["summary"]) != set(ends):
+                print(f"❌ Etapas inesperadas: {list(ends)}")
+                return False
+            if ends["parse"]["slides"] != 3 or ends["build"]["slides"] != 3:
+                print("❌ Las etapas no cuentan las 3 diapositivas")
+                return False
+            if ends["save"]["bytes"] != os.path.getsize(output_file):
+                print("❌ La etapa save no registra el tamaño del PPTX")
+                return False
+            
+            # PDF: rasterizado, codificación, construcción y guardado por página
+            recorder = ProfileRecorder()
+            converter = LatexToPptxConverter(workers=1, observer=recorder)
+            pages = [Image.new("RGB", (64, 48)) for _ in range(5)]
+            converter._pages_to_pptx(iter(pages), os.path.join(workdir, "pdf.pptx"))
+            ends = {event["stage"]: event for event in recorder.events if event["event"] == "end"}
+            if ends.keys() != {"rasterize", "encode", "build", "save"}:
+                print(f"❌ Etapas del PDF inesperadas: {sorted(ends)}")
+                return False
+            if ends["rasterize"]["pages"] != 5 or ends["encode"]["pages"] != 5 or ends["build"]["slides"] != 5:
+                print("❌ Las etapas del PDF no cuentan las 5 páginas")
+                return False
+        
+        print("✅ parse, build y save (y rasterize/encode en PDF) con sus contadores")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_chunked_rasterization_order():
+    """Prueba offline: los bloques en paralelo devuelven las páginas en orden"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Orden de las páginas al rasterizar por bloques")
+    print("="*60)
+    
+    import time
+    from PIL import Image
+    from scripts.latex_to_pptx import page_chunks
+    
+    def fake_convert(pdf, first_page, last_page, **options):
+        # Los primeros bloques tardan más: terminan después que los últimos
+        time.sleep(0.02 / first_page)
+        return [Image.new("L", (8, 8), page) for page in range(first_page, last_page + 1)]
+    
+    try:
+        for workers in (3, 4):
+            for page_count in (1, 5, 13, 22, 31):
+                chunks = page_chunks(page_count, workers)
+                covered = [page for first, last in chunks for page in range(first, last + 1)]
+                if covered != list(range(1, page_count + 1)) or len(chunks) > workers:
+                    print(f"❌ Bloques inválidos para {page_count} páginas: {chunks}")
+                    return False
+                
+                converter = LatexToPptxConverter(workers=workers, window=14)
+                pages = [img.getpixel((0, 0)) for img in
+                         converter._iter_pages("doc.pdf", fake_convert, {"Pages": page_count})]
+                if pages != list(range(1, page_count + 1)):
+                    print(f"❌ {page_count} páginas con {workers} trabajadores: {pages}")
+                    return False
+        
+        print("✅ Páginas en orden con bloques desiguales (3 y 4 trabajadores)")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_page_encoder():
+    """Prueba offline: el modo auto elige paleta o JPEG y target_bytes reduce el tamaño"""
+    print("\n" + "="*60)
+    print("🧪 PRUEBA: Codificación de páginas")
+    print("="*60)
+    
+    import random
+    from PIL import Image, ImageDraw
+    from scripts.image_encoding import PageEncoder
+    
+    # Diapositiva plana: fondo, una barra de título y un recuadro
+    flat = Image.new("RGB", (640, 360), (255, 255, 255))
+    draw = ImageDraw.Draw(flat)
+    draw.rectangle((0, 0, 640, 60), fill=(30, 60, 120))
+    draw.rectangle((40, 100, 600, 320), outline=(0, 0, 0), width=3)
+    
+    # "Foto": ruido de color, con muchos más colores que una paleta
+    rng = random.Random(0)
+    photo = Image.frombytes("RGB", (640, 360), bytes(rng.getrandbits(8) for _ in range(640 * 360 * 3)))
+    
+    try:
+        encoder = PageEncoder("auto")
+        flat_stream, flat_mode = encoder.encode(flat)
+        _, photo_mode = encoder.encode(photo)
+        if (flat_mode, photo_mode) != ("png-palette", "jpeg"):
+            print(f"❌ auto eligió {flat_mode} y {photo_mode}")
+            return False
+        png_size = PageEncoder("png").encode(flat)[0].getbuffer().nbytes
+        if flat_stream.getbuffer().nbytes >= png_size:
+            print("❌ La paleta no reduce el tamaño de la página plana")
+            return False
+        
+        unlimited = PageEncoder("png").encode(photo)[0].getbuffer().nbytes
+        target = unlimited // 4
+        limited, mode = PageEncoder("png", target_bytes=target).encode(photo)
+        if mode != "jpeg" or limited.getbuffer().nbytes >= unlimited:
+            print(f"❌ target_bytes no redujo el tamaño ({mode}, {limited.getbuffer().nbytes} bytes)")
+            return False
+        # Una página que ya cabe no se recodifica
+        if PageEncoder("png", target_bytes=png_size).encode(flat)[1] != "png":
+            print("❌ Se recodificó una página que ya cabía en target_bytes")
+            return False
+        
+        print(f"✅ auto: paleta/JPEG; target_bytes: {unlimited // 1024} KB → "
+              f"{limited.getbuffer().nbytes // 1024} KB")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en la prueba: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def main():
     """Ejecuta todas las pruebas"""
     print("\n" + "🚀"*30)
@@ -149,7 +1380,27 @@ def main():
         "API Connection": False,
         "Content Generation": False,
         "Text to PPTX": False,
-        "LaTeX to PPTX": False
+        "LaTeX to PPTX": False,
+        "Fast bullets XML": False,
+        "Concurrent PDF conversions": False,
+        "Native beamer": False,
+        "Page ranges": False,
+        "Response cache": False,
+        "Async generate_many": False,
+        "Streaming generation": False,
+        "Lazy imports": False,
+        "Shared clients": False,
+        "Duplicate output names": False,
+        "Scratch cleanup on error": False,
+        "Broken theme files": False,
+        "PDF bytes temp file": False,
+        "Incremental pathlib output": False,
+        "Mixed page sizes": False,
+        "Auto pagination": False,
+        "LaTeX cache": False,
+        "Profile stages": False,
+        "Chunked rasterization order": False,
+        "Page encoder": False
     }
     
     # Prueba 1: API
@@ -170,6 +1421,67 @@ def main():
     if test_latex_to_pptx():
         results["LaTeX to PPTX"] = True
     
+    # Pruebas offline (no necesitan API key)
+    if test_fast_bullets_xml():
+        results["Fast bullets XML"] = True
+    
+    if test_concurrent_pdf_conversions():
+        results["Concurrent PDF conversions"] = True
+    
+    if test_native_beamer():
+        results["Native beamer"] = True
+    
+    if test_page_ranges():
+        results["Page ranges"] = True
+    
+    if test_response_cache():
+        results["Response cache"] = True
+    
+    if test_generate_many():
+        results["Async generate_many"] = True
+    
+    if test_streaming_generation():
+        results["Streaming generation"] = True
+    
+    if test_lazy_imports():
+        results["Lazy imports"] = True
+    
+    if test_shared_clients():
+        results["Shared clients"] = True
+    
+    if test_duplicate_output_names():
+        results["Duplicate output names"] = True
+    
+    if test_scratch_cleanup_on_error():
+        results["Scratch cleanup on error"] = True
+    
+    if test_broken_theme_files():
+        results["Broken theme files"] = True
+    
+    if test_pdf_bytes_temp_file():
+        results["PDF bytes temp file"] = True
+    
+    if test_incremental_pathlib():
+        results["Incremental pathlib output"] = True
+    
+    if test_mixed_page_sizes():
+        results["Mixed page sizes"] = True
+    
+    if test_auto_pagination():
+        results["Auto pagination"] = True
+    
+    if test_latex_cache():
+        results["LaTeX cache"] = True
+    
+    if test_profile_stages():
+        results["Profile stages"] = True
+    
+    if test_chunked_rasterization_order():
+        results["Chunked rasterization order"] = True
+    
+    if test_page_encoder():
+        results["Page encoder"] = True
+    
     # Resumen final
     print("\n" + "="*60)
     print("📊 RESUMEN DE PRUEBAS")